@@ -12,8 +12,12 @@ For Future Agents:
     - Cue points are locators/markers in the timeline
     - song_time is in beats (quarter notes)
     - Loop is controlled via loop_start, loop_length, and loop (enable)
+    - Scrubs within SCRUB_INTERVAL of the last one are coalesced into a
+      single deferred scrub_by() on Live's next tick (~100ms granularity)
 """
 from __future__ import absolute_import, print_function, unicode_literals
+import time as _time
+
 from .base import HandlerBase
 
 
@@ -25,6 +29,31 @@ class ArrangementHandler(HandlerBase):
     including cue points (locators) and loop settings.
     """
     
+    # Scrubs closer together than this are deferred to Live's next tick
+    # rather than applied immediately
+    SCRUB_INTERVAL = 0.016
+    
+    def __init__(self, mcp):
+        HandlerBase.__init__(self, mcp)
+        self._scrub_target = None
+        self._scrub_last_ts = 0.0
+        self._scrub_flush_scheduled = False
+        self._scrub_song = None
+        self._scrub_by = None
+    
+    def _get_scrub_by(self):
+        """
+        Return Song.scrub_by as a cached bound method (None if unavailable).
+        
+        Re-resolved only when the Song object changes (e.g. a new Set is
+        loaded), so repeated scrubs skip the attribute lookup.
+        """
+        song = self.song
+        if song is not self._scrub_song:
+            self._scrub_song = song
+            self._scrub_by = getattr(song, "scrub_by", None)
+        return self._scrub_by
+    
     def get_arrangement_info(self):
         """
         Get information about the arrangement view.
@@ -57,9 +86,12 @@ class ArrangementHandler(HandlerBase):
             if hasattr(song, "cue_points"):
                 info["cue_points"] = []
                 for i, cue in enumerate(song.cue_points):
+                    name = getattr(cue, "name", None)
+                    if name is None:
+                        name = "Cue %d" % i
                     info["cue_points"].append({
                         "index": i,
-                        "name": getattr(cue, "name", "Cue {0}".format(i)),
+                        "name": name,
                         "time": getattr(cue, "time", 0.0)
                     })
             
@@ -168,10 +200,14 @@ class ArrangementHandler(HandlerBase):
             else:
                 song.current_song_time = cue_time
             
+            cue_name = getattr(cue, "name", None)
+            if cue_name is None:
+                cue_name = "Cue %d" % index
+            
             return {
                 "status": "success",
                 "jumped_to": cue_time,
-                "cue_name": getattr(cue, "name", "Cue {0}".format(index))
+                "cue_name": cue_name
             }
             
         except Exception as e:
@@ -193,11 +229,12 @@ class ArrangementHandler(HandlerBase):
         try:
             song = self.song
             
-            if hasattr(song, "loop_start"):
+            # Each property write is a round-trip into Live; skip no-op writes
+            if hasattr(song, "loop_start") and song.loop_start != float(start):
                 song.loop_start = float(start)
-            if hasattr(song, "loop_length"):
+            if hasattr(song, "loop_length") and song.loop_length != float(length):
                 song.loop_length = float(length)
-            if hasattr(song, "loop"):
+            if hasattr(song, "loop") and song.loop != bool(enable):
                 song.loop = bool(enable)
             
             return {
@@ -242,16 +279,29 @@ class ArrangementHandler(HandlerBase):
             time (float): Position in beats
             
         Returns:
-            dict: {"status": "success", "scrubbed_to": float}
+            dict: {"status": "success", "scrubbed_to": float}, or
+                  {"status": "success", "deferred": True} when the scrub was
+                  coalesced and will be applied on Live's next tick
         """
         try:
             song = self.song
             
-            if hasattr(song, "scrub_by"):
-                current = song.current_song_time
-                delta = float(time) - current
-                song.scrub_by(delta)
-                return {"status": "success", "scrubbed_to": time}
+            if self._get_scrub_by() is not None:
+                self._scrub_target = float(time)
+                now = _time.monotonic()
+                if now - self._scrub_last_ts >= self.SCRUB_INTERVAL:
+                    self._flush_scrub()
+                    return {"status": "success", "scrubbed_to": time}
+                
+                # Inside the throttle window: keep only the latest target and
+                # let a single deferred flush apply it on the next tick.
+                if not self._scrub_flush_scheduled:
+                    self._scrub_flush_scheduled = True
+                    try:
+                        self.mcp.schedule_message(0, self._flush_scrub)
+                    except AssertionError:
+                        self._flush_scrub()
+                return {"status": "success", "deferred": True}
             else:
                 song.current_song_time = float(time)
                 return {"status": "success", "jumped_to": time, "note": "scrub_by not available, used jump"}
@@ -259,3 +309,24 @@ class ArrangementHandler(HandlerBase):
         except Exception as e:
             self._log("Error scrubbing arrangement: " + str(e))
             raise
+    
+    def _flush_scrub(self):
+        """
+        Apply the pending scrub target as a single scrub_by() delta.
+        
+        Intermediate targets received within SCRUB_INTERVAL are dropped,
+        so a burst of scrub requests costs one Live API write. If the Set
+        changed since the scrub was scheduled and the new Song has no
+        scrub_by(), the playhead is moved directly instead.
+        """
+        self._scrub_flush_scheduled = False
+        target = self._scrub_target
+        if target is None:
+            return
+        self._scrub_target = None
+        scrub_by = self._get_scrub_by()
+        if scrub_by is None:
+            self._scrub_song.current_song_time = target
+        else:
+            scrub_by(target - self._scrub_song.current_song_time)
+        self._scrub_last_ts = _time.monotonic()
@@ -380,6 +380,36 @@ class SceneHandler(HandlerBase):
             self._log("Error creating scene: " + str(e))
             raise
     
+    def create_scenes(self, count=1, names=None):
+        """
+        Append several empty scenes in one call.
+        
+        Args:
+            count (int): Number of scenes to add at the end
+            names (list): Optional names, applied in order to the new scenes
+        
+        Returns:
+            dict: Index of the first new scene and the new scene count
+        
+        Live API:
+            Song.create_scene(index)
+        """
+        try:
+            names = names or ()
+            first_index = len(self.song.scenes)
+            for i in range(count):
+                new_scene = self.song.create_scene(first_index + i)
+                if i < len(names) and names[i]:
+                    new_scene.name = str(names[i])
+            return {
+                "created": count,
+                "first_index": first_index,
+                "scene_count": len(self.song.scenes)
+            }
+        except Exception as e:
+            self._log("Error creating scenes: " + str(e))
+            raise
+    
     def delete_scene(self, scene_index):
         """
         Delete a scene.
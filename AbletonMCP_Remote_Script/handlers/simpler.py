@@ -26,6 +26,31 @@ class SimplerHandler(HandlerBase):
     including playback modes, warping, and markers.
     """
     
+    # Optional sample attributes, probed once per handler
+    _SAMPLE_CAPS = ("start_marker", "end_marker", "warping", "warp_mode")
+    
+    def __init__(self, mcp):
+        HandlerBase.__init__(self, mcp)
+        self._sample_caps = None
+    
+    def _get_sample_caps(self, sample):
+        """
+        Return the set of optional sample attributes Live's Sample exposes.
+        
+        The hasattr() probes depend only on the sample type, not on the
+        device or which sample is loaded, so one result serves every call.
+        
+        Args:
+            sample: A Simpler/Sampler's loaded sample object
+            
+        Returns:
+            frozenset: Names from _SAMPLE_CAPS available on the sample
+        """
+        caps = self._sample_caps
+        if caps is None:
+            caps = self._sample_caps = frozenset(a for a in self._SAMPLE_CAPS if hasattr(sample, a))
+        return caps
+    
     def _find_simpler_device(self, track_index, device_index=None):
         """
         Find a Simpler or Sampler device on the specified track.
@@ -252,13 +277,14 @@ class SimplerHandler(HandlerBase):
                 return {"status": "error", "message": "No sample loaded in device"}
             
             sample = device.sample
+            caps = self._get_sample_caps(sample)
             result = {"status": "success", "device_index": dev_idx}
             
-            if start is not None and hasattr(sample, "start_marker"):
+            if start is not None and "start_marker" in caps:
                 sample.start_marker = float(start)
                 result["start_marker"] = start
                 
-            if end is not None and hasattr(sample, "end_marker"):
+            if end is not None and "end_marker" in caps:
                 sample.end_marker = float(end)
                 result["end_marker"] = end
             
@@ -288,13 +314,14 @@ class SimplerHandler(HandlerBase):
                 return {"status": "error", "message": "No sample loaded in device"}
             
             sample = device.sample
+            caps = self._get_sample_caps(sample)
             result = {"status": "success", "device_index": dev_idx}
             
-            if enable is not None and hasattr(sample, "warping"):
+            if enable is not None and "warping" in caps:
                 sample.warping = bool(enable)
                 result["warping"] = sample.warping
             
-            if warp_mode is not None and hasattr(sample, "warp_mode"):
+            if warp_mode is not None and "warp_mode" in caps:
                 mode_map = {"beats": 0, "tones": 1, "texture": 2, "repitch": 3, "complex": 4, "complex_pro": 5}
                 if isinstance(warp_mode, str):
                     warp_mode = mode_map.get(warp_mode.lower(), 0)
@@ -34,6 +34,8 @@ Common Patterns:
 from __future__ import absolute_import, print_function, unicode_literals
 import logging
 
+from ..protocol import unpack_notes
+
 
 class TrackHandler(object):
     """
@@ -841,6 +843,104 @@ class TrackHandler(object):
             self._log("Error creating clip: " + str(e))
             raise
 
+    def _fill_clip_slot(self, clip_slot, spec, replace):
+        """
+        Write one clip spec from bulk_create_clips/add_notes_to_clips_multi.
+        
+        With replace, any clip in the slot is deleted and a new one of
+        spec's length (default 4.0) is created; otherwise the slot must
+        already hold a clip. Adds spec's notes (or notes_packed) and applies
+        its name, if any.
+        
+        Returns:
+            tuple: (clip, number of notes written)
+        """
+        if replace:
+            if clip_slot.has_clip:
+                clip_slot.delete_clip()
+            clip_slot.create_clip(spec.get("length", 4.0))
+        elif not clip_slot.has_clip:
+            raise Exception("No clip in slot: " + str(spec.get("clip_index", 0)))
+        
+        clip = clip_slot.clip
+        if spec.get("notes_packed"):
+            notes = unpack_notes(spec["notes_packed"])
+        else:
+            notes = spec.get("notes") or ()
+        if notes:
+            self._write_clip_notes(clip, notes, replace=False)
+        if spec.get("name") is not None:
+            clip.name = str(spec["name"])
+        return clip, len(notes)
+
+    def bulk_create_clips(self, track_index, clips):
+        """
+        Create several MIDI clips on one track in a single call.
+        
+        Each entry in clips is a dict with clip_index, and optionally length
+        (default 4.0), name and notes (or notes_packed). A clip already in the
+        slot is replaced. Stops at the first failing entry.
+        """
+        try:
+            if track_index < 0 or track_index >= len(self.song.tracks):
+                raise IndexError("Track index out of range")
+            
+            track = self.song.tracks[track_index]
+            clip_slots = track.clip_slots
+            created = []
+            for spec in clips:
+                clip_index = spec.get("clip_index", 0)
+                if clip_index < 0 or clip_index >= len(clip_slots):
+                    raise IndexError("Clip index out of range: " + str(clip_index))
+                
+                clip, note_count = self._fill_clip_slot(clip_slots[clip_index], spec, replace=True)
+                created.append({
+                    "clip_index": clip_index,
+                    "name": clip.name,
+                    "length": clip.length,
+                    "note_count": note_count
+                })
+            
+            return {"track_index": track_index, "clips": created}
+        except Exception as e:
+            self._log("Error bulk creating clips: " + str(e))
+            raise
+
+    def add_notes_to_clips_multi(self, clips):
+        """
+        Write notes into clips on several tracks in a single call.
+        
+        Each entry in clips is a dict with track_index, clip_index and notes
+        (or notes_packed). With a length, the clip in the slot is replaced by
+        a new one of that length (as in bulk_create_clips); without one, the
+        notes are added to the existing clip. An optional name renames the
+        clip. Stops at the first failing entry.
+        """
+        try:
+            tracks = self.song.tracks
+            written = []
+            for spec in clips:
+                track_index = spec.get("track_index", 0)
+                clip_index = spec.get("clip_index", 0)
+                if track_index < 0 or track_index >= len(tracks):
+                    raise IndexError("Track index out of range: " + str(track_index))
+                clip_slots = tracks[track_index].clip_slots
+                if clip_index < 0 or clip_index >= len(clip_slots):
+                    raise IndexError("Clip index out of range: " + str(clip_index))
+                
+                replace = spec.get("length") is not None
+                clip, note_count = self._fill_clip_slot(clip_slots[clip_index], spec, replace)
+                written.append({
+                    "track_index": track_index,
+                    "clip_index": clip_index,
+                    "note_count": note_count
+                })
+            
+            return {"clips": written}
+        except Exception as e:
+            self._log("Error adding notes to clips: " + str(e))
+            raise
+
     def delete_clip(self, track_index, clip_index):
         """Delete a clip from a slot."""
         try:
@@ -1017,9 +1117,12 @@ class TrackHandler(object):
             self._log("Error reading clip notes: {0}".format(e))
             raise
     
-    def add_notes_to_clip(self, track_index, clip_index, notes):
-        """Add MIDI notes to a clip"""
+    def add_notes_to_clip(self, track_index, clip_index, notes, notes_packed=None):
+        """Add MIDI notes to a clip, given as note dicts or as notes_packed"""
         try:
+            if notes_packed:
+                notes = unpack_notes(notes_packed)
+            
             if track_index < 0 or track_index >= len(self.song.tracks):
                 raise IndexError("Track index out of range")
             
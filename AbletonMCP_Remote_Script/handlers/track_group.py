@@ -22,9 +22,18 @@ Live 11 API Reference:
     - See: https://nsuspray.github.io/Live_API_Doc/11.0.0.xml
 """
 from __future__ import absolute_import, print_function, unicode_literals
+import operator
+
 from .base import HandlerBase
 
 
+# Fetches the per-track overview fields in a single C-level call
+_TRACK_OVERVIEW_GETTER = operator.attrgetter(
+    "name", "color", "mute", "solo", "is_foldable", "is_grouped",
+    "is_visible", "has_midi_input", "has_audio_input"
+)
+
+
 class TrackGroupHandler(HandlerBase):
     """
     Handler for track grouping operations in AbletonMCP.
@@ -239,6 +248,55 @@ class TrackGroupHandler(HandlerBase):
             self._log("Error unfolding group: " + str(e))
             raise
     
+    def fold_group_bulk(self, track_indices):
+        """
+        Fold several group tracks in one command.
+        
+        Args:
+            track_indices (list[int]): Group track indices
+        
+        Returns:
+            dict: Per-track results, in request order
+        """
+        try:
+            return {"results": self._set_fold_state_bulk(track_indices, True)}
+        except Exception as e:
+            self._log("Error folding groups: " + str(e))
+            raise
+    
+    def unfold_group_bulk(self, track_indices):
+        """
+        Unfold several group tracks in one command.
+        
+        Args:
+            track_indices (list[int]): Group track indices
+        
+        Returns:
+            dict: Per-track results, in request order
+        """
+        try:
+            return {"results": self._set_fold_state_bulk(track_indices, False)}
+        except Exception as e:
+            self._log("Error unfolding groups: " + str(e))
+            raise
+    
+    def _set_fold_state_bulk(self, track_indices, folded):
+        """Apply a fold state to many tracks, resolving song.tracks once."""
+        tracks = self.song.tracks
+        n = len(tracks)
+        results = []
+        for i in track_indices:
+            if i < 0 or i >= n:
+                results.append({"track_index": i, "error": "Track index out of range"})
+                continue
+            track = tracks[i]
+            if not track.is_foldable:
+                results.append({"track_index": i, "error": "Track {} is not a group track".format(i)})
+                continue
+            track.fold_state = folded
+            results.append({"track_index": i, "fold_state": folded})
+        return results
+    
     def toggle_group_fold(self, track_index):
         """
         Toggle a group track's fold state.
@@ -372,6 +430,38 @@ class TrackGroupHandler(HandlerBase):
             self._log("Error stopping track clips: " + str(e))
             raise
     
+    def stop_track_clips_bulk(self, track_indices):
+        """
+        Stop all clips on several tracks in one command.
+        
+        Resolves song.tracks once and loops on the Live side, instead of
+        one bridge round-trip per track.
+        
+        Args:
+            track_indices (list[int]): Track indices
+        
+        Returns:
+            dict: Per-track results, in request order
+        
+        Live API:
+            Track.stop_all_clips()
+        """
+        try:
+            tracks = self.song.tracks
+            n = len(tracks)
+            results = []
+            for i in track_indices:
+                if i < 0 or i >= n:
+                    results.append({"track_index": i, "error": "Track index out of range"})
+                    continue
+                tracks[i].stop_all_clips()
+                results.append({"stopped": True, "track_index": i})
+            
+            return {"results": results}
+        except Exception as e:
+            self._log("Error stopping track clips: " + str(e))
+            raise
+    
     # =========================================================================
     # Track Overview
     # =========================================================================
@@ -389,24 +479,26 @@ class TrackGroupHandler(HandlerBase):
         try:
             tracks_list = []
             for idx, track in enumerate(self.song.tracks):
+                (name, color, mute, solo, is_foldable, is_grouped,
+                 is_visible, has_midi_input, has_audio_input) = _TRACK_OVERVIEW_GETTER(track)
                 track_info = {
                     "index": idx,
-                    "name": track.name,
-                    "color": track.color,
-                    "mute": track.mute,
-                    "solo": track.solo,
+                    "name": name,
+                    "color": color,
+                    "mute": mute,
+                    "solo": solo,
                     "arm": track.arm if hasattr(track, 'arm') else False,
-                    "is_foldable": track.is_foldable,
-                    "is_grouped": track.is_grouped,
-                    "is_visible": track.is_visible,
-                    "has_midi_input": track.has_midi_input,
-                    "has_audio_input": track.has_audio_input
+                    "is_foldable": is_foldable,
+                    "is_grouped": is_grouped,
+                    "is_visible": is_visible,
+                    "has_midi_input": has_midi_input,
+                    "has_audio_input": has_audio_input
                 }
                 
-                if track.is_foldable:
+                if is_foldable:
                     track_info["fold_state"] = track.fold_state
                 
-                if track.is_grouped and track.group_track:
+                if is_grouped and track.group_track:
                     for gidx, gt in enumerate(self.song.tracks):
                         if gt == track.group_track:
                             track_info["group_track_index"] = gidx
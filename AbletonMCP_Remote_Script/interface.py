@@ -9,11 +9,11 @@ Architecture:
 
 For Future Agents:
     - Commands arrive as dicts with "type" and "params" keys
-    - The dispatcher maps command type strings to handler lambdas
+    - The dispatcher maps command type strings to generated handler thunks
     - All handlers are accessed via self.handler (the main AbletonMCP instance)
     - Handler instances: track_handler, session_handler, device_handler,
       drum_rack_handler, groove_handler, simpler_handler, arrangement_handler
-    - Add new commands by extending the main_thread_commands dict
+    - Add new commands by extending _COMMAND_SPECS
 
 Command Flow Example:
     >>> command = {"type": "create_midi_track", "params": {"index": 0}}
@@ -25,14 +25,948 @@ Error Handling:
     - Tracebacks are logged to Ableton's log file
 """
 from __future__ import absolute_import, print_function, unicode_literals
-import traceback
-import json
+import collections
+import os
+import sys
+import threading
+import time
+import types
 
-# Change queue import for Python 2
-try:
-    import Queue as queue  # Python 2
-except ImportError:
-    import queue  # Python 3
+from .protocol import NOTE_PACKING
+
+
+def _bind_method(obj, name):
+    """
+    Resolve a handler method once for the dispatch table.
+    
+    Missing methods resolve to a stub that raises AttributeError when the
+    command is actually invoked, matching the previous late-bound behaviour
+    instead of failing while the table is built.
+    """
+    method = getattr(obj, name, None)
+    if method is not None:
+        return method
+    
+    def _unavailable(*args, **kwargs):
+        raise AttributeError("{0} has no method '{1}'".format(type(obj).__name__, name))
+    return _unavailable
+
+
+class _Const(object):
+    """Spec argument passed as a fixed literal instead of read from params."""
+    __slots__ = ("value",)
+    
+    def __init__(self, value):
+        self.value = value
+
+
+def _compile_thunk(method, args):
+    """
+    Generate a direct-call function for one command spec.
+    
+    The spec's param names and defaults are emitted as constants in the
+    generated source and the bound method is captured as a default
+    argument, so each call is one specialised function with no closure
+    cells:
+    
+        def _thunk(p, _m=_m):
+            if not p:
+                return _m(0, ...)
+            if p.__class__ is list:
+                n = len(p)
+                return _m(p[0] if n > 0 else 0, ...)
+            return _m(p.get("track_index", 0), ...)
+    
+    Args:
+        method: Bound handler method to call
+        args: Tuple of (param_name, default) pairs or _Const markers, in
+              the handler's positional parameter order
+    
+    Returns:
+        function: Callable taking the params dict
+    """
+    parts = []
+    defaults = []
+    positional = []
+    index = 0
+    for arg in args:
+        if isinstance(arg, _Const):
+            parts.append(repr(arg.value))
+            defaults.append(repr(arg.value))
+            positional.append(repr(arg.value))
+        else:
+            parts.append("p.get({0!r}, {1!r})".format(arg[0], arg[1]))
+            defaults.append(repr(arg[1]))
+            positional.append("p[{0}] if n > {0} else {1!r}".format(index, arg[1]))
+            index += 1
+    source = "def _thunk(p, _m=_m):\n"
+    if parts:
+        # Commands sent without params skip the per-key lookups entirely
+        source += "    if not p:\n        return _m({0})\n".format(", ".join(defaults))
+        # Clients may send params as a list in spec order (constants
+        # excluded); missing trailing entries take their defaults
+        source += "    if p.__class__ is list:\n        n = len(p)\n"
+        source += "        return _m({0})\n".format(", ".join(positional))
+    source += "    return _m({0})\n".format(", ".join(parts))
+    namespace = {"_m": method}
+    exec(source, namespace)
+    return namespace["_thunk"]
+
+
+# Command type -> (handler attribute on AbletonMCP or None for the instance
+# itself, method name, argument spec). Argument specs are read from the
+# command's params in order; see _compile_thunk(). Sequence params that the
+# handlers only iterate default to (), a code constant, rather than a list
+# literal that would be rebuilt on every call.
+_COMMAND_SPECS = {
+    # Session / browser queries (answered on the socket thread via
+    # _BACKGROUND_COMMANDS, along with list_clips)
+    "get_session_info": (None, "_get_session_info", ()),
+    "get_track_info": ("track_handler", "get_track_info", (("track_index", 0),)),
+    "get_browser_item": (None, "_get_browser_item", (("uri", None), ("path", None))),
+    "get_browser_items_at_path": (None, "get_browser_items_at_path", (("path", ""),)),
+
+    "create_midi_track": ("track_handler", "create_midi_track", (("index", -1),)),
+    "create_audio_track": ("track_handler", "create_audio_track", (("index", -1),)),
+    "delete_track": ("track_handler", "delete_track", (("track_index", -1),)),
+    "duplicate_track": ("track_handler", "duplicate_track", (("track_index", -1), ("target_index", None))),
+    "set_track_name": ("track_handler", "set_track_name", (("track_index", 0), ("name", ""))),
+    "configure_track_routing": ("track_handler", "configure_track_routing", (
+        ("track_index", 0),
+        ("input_type", None),
+        ("input_channel", None),
+        ("output_type", None),
+        ("output_channel", None),
+        ("monitor_state", None),
+        ("arm", None),
+        ("sends", None),
+    )),
+    "set_track_io": ("track_handler", "set_track_io", (
+        ("track_index", 0),
+        ("input_type", None),
+        ("input_channel", None),
+        ("output_type", None),
+        ("output_channel", None),
+    )),
+    "set_track_monitor": ("track_handler", "set_track_monitor", (("track_index", 0), ("state", "auto"))),
+    "set_track_arm": ("track_handler", "set_track_bool", (("track_index", 0), _Const("arm"), ("arm", True))),
+    "set_track_solo": ("track_handler", "set_track_bool", (("track_index", 0), _Const("solo"), ("solo", True))),
+    "set_track_mute": ("track_handler", "set_track_bool", (("track_index", 0), _Const("mute"), ("mute", True))),
+    "set_track_volume": ("track_handler", "set_track_volume", (("track_index", 0), ("volume", 0.0))),
+    "set_track_panning": ("track_handler", "set_track_panning", (("track_index", 0), ("panning", 0.0))),
+    "set_send_level": ("track_handler", "set_send_level", (("track_index", 0), ("send_index", 0), ("level", 0.0))),
+    "set_return_track_name": ("track_handler", "set_return_track_name", (("index", 0), ("name", ""))),
+    "get_routing_options": ("track_handler", "get_routing_options", (("track_index", 0),)),
+    "set_track_output": ("track_handler", "set_track_output", (("track_index", 0), ("output_name", "Master"))),
+    "create_clip": ("track_handler", "create_clip", (("track_index", 0), ("clip_index", 0), ("length", 4.0))),
+    "delete_clip": ("track_handler", "delete_clip", (("track_index", 0), ("clip_index", 0))),
+    "bulk_create_clips": ("track_handler", "bulk_create_clips", (("track_index", 0), ("clips", ()))),
+    "duplicate_clip": ("track_handler", "duplicate_clip", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("target_track_index", None),
+        ("target_clip_index", None),
+    )),
+    "add_notes_to_clip": ("track_handler", "add_notes_to_clip", (("track_index", 0), ("clip_index", 0), ("notes", ()), ("notes_packed", None))),
+    "add_notes_to_clips_multi": ("track_handler", "add_notes_to_clips_multi", (("clips", ()),)),
+    "set_clip_length": ("track_handler", "set_clip_length", (("track_index", 0), ("clip_index", 0), ("length", 4.0))),
+    "transpose_clip": ("track_handler", "transpose_clip", (("track_index", 0), ("clip_index", 0), ("semitones", 0))),
+    "apply_legato": ("track_handler", "apply_legato", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("preserve_gaps_below", 0.0),
+    )),
+    "set_tempo": ("session_handler", "set_tempo", (("tempo", 120.0),)),
+    "set_time_signature": ("session_handler", "set_time_signature", (("numerator", 4), ("denominator", 4))),
+    "list_clips": ("track_handler", "list_clips", (("track_pattern", None), ("match_mode", "contains"))),
+    "fire_clip_by_name": ("track_handler", "fire_clip_by_name", (
+        ("clip_pattern", ""),
+        ("track_pattern", None),
+        ("match_mode", "contains"),
+        ("first_only", True),
+    )),
+    "trigger_test_midi": (None, "_trigger_test_midi", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("length", 1.0),
+        ("pitch", 60),
+        ("velocity", 100),
+        ("duration", 0.5),
+        ("start_time", 0.0),
+        ("overwrite_clip", False),
+        ("fire_clip", True),
+        ("cc_number", None),
+        ("cc_value", 64),
+        ("channel", 0),
+    )),
+    "start_playback": ("session_handler", "start_playback", ()),
+    "stop_playback": ("session_handler", "stop_playback", ()),
+    "fire_scene_by_name": ("session_handler", "fire_scene_by_name", (
+        ("pattern", ""),
+        ("match_mode", "contains"),
+        ("first_only", True),
+    )),
+    "stop_scene": ("session_handler", "stop_scene", (("index", -1),)),
+    "get_song_context": ("session_handler", "get_song_context", (("include_clips", False),)),
+    "load_browser_item": ("device_handler", "load_browser_item", (
+        ("track_index", 0),
+        ("item_uri", ""),
+        ("clip_index", None),
+    )),
+    "load_device": ("device_handler", "load_device", (("track_index", 0), ("device_uri", ""), ("device_slot", -1))),
+    "hotswap_browser_item": ("device_handler", "hotswap_browser_item", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("item_uri", ""),
+    )),
+    "set_device_parameter": ("device_handler", "set_device_parameter", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("parameter", 0),
+        ("value", 0.0),
+    )),
+    # Macro Commands
+    "get_rack_macros": ("device_handler", "get_rack_macros", (("track_index", 0), ("device_index", 0))),
+    "add_macro": ("device_handler", "add_macro", (("track_index", 0), ("device_index", 0))),
+    "remove_macro": ("device_handler", "remove_macro", (("track_index", 0), ("device_index", 0))),
+    "get_rack_chains": ("device_handler", "get_rack_chains", (("track_index", 0), ("device_index", 0))),
+    "set_device_parameters": ("device_handler", "set_device_parameters", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("parameters", None),
+    )),
+    "set_device_audio_input": (None, "_set_device_audio_input", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("input_type", None),
+        ("input_channel", None),
+    )),
+    "get_device_parameters": ("device_handler", "get_device_parameters", (("track_index", 0), ("device_index", 0))),
+    "set_device_sidechain_source": ("device_handler", "set_device_sidechain_source", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("source_track_index", 0),
+        ("pre_fx", True),
+        ("mono", True),
+    )),
+    "list_routable_devices": ("device_handler", "list_routable_devices", ()),
+    "save_device_snapshot": ("device_handler", "save_device_snapshot", (("track_index", 0), ("device_index", 0))),
+    "save_device_preset": ("device_handler", "save_device_snapshot", (("track_index", 0), ("device_index", 0))),
+    "apply_device_snapshot": ("device_handler", "apply_device_snapshot", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("snapshot", {}),
+    )),
+    "add_basic_drum_pattern": ("track_handler", "add_basic_drum_pattern", (("track_index", 0), ("clip_index", 0))),
+    "add_chord_stack": (None, "_add_chord_stack", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("root_midi", 60),
+        ("quality", "major"),
+        ("bars", 4),
+        ("chord_length", 1.0),
+    )),
+    "set_clip_envelope": ("track_handler", "set_clip_envelope", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("device_index", 0),
+        ("parameter_name", "Frequency"),
+        ("points", ()),
+    )),
+    "list_loadable_devices": ("device_handler", "list_loadable_devices", (("category", "all"), ("max_items", 200))),
+    "search_loadable_devices": ("device_handler", "search_loadable_devices", (
+        ("query", ""),
+        ("category", "all"),
+        ("max_items", 200),
+    )),
+    "get_clip_notes": ("track_handler", "get_clip_notes", (("track_index", 0), ("clip_index", 0))),
+    "search_and_load_device": ("device_handler", "search_and_load_device", (
+        ("track_index", 0),
+        ("query", ""),
+        ("category", "all"),
+    )),
+    # Drum Rack Management (uses modular DrumRackHandler)
+    "get_drum_rack_info": ("drum_rack_handler", "get_drum_rack_info", (
+        ("track_index", 0),
+        ("device_index", None),
+        ("include_empty", False),
+    )),
+    "copy_drum_pad": ("drum_rack_handler", "copy_drum_pad", (
+        ("track_index", 0),
+        ("source_note", 36),
+        ("dest_note", 37),
+        ("device_index", None),
+    )),
+    "set_drum_pad_choke_group": ("drum_rack_handler", "set_drum_pad_choke_group", (
+        ("track_index", 0),
+        ("note", 36),
+        ("choke_group", 0),
+        ("device_index", None),
+    )),
+    "mute_drum_pad": ("drum_rack_handler", "mute_drum_pad", (
+        ("track_index", 0),
+        ("note", 36),
+        ("mute", True),
+        ("device_index", None),
+    )),
+    "solo_drum_pad": ("drum_rack_handler", "solo_drum_pad", (
+        ("track_index", 0),
+        ("note", 36),
+        ("solo", True),
+        ("device_index", None),
+    )),
+    # Groove Pool Management (uses modular GrooveHandler)
+    "get_groove_pool": ("groove_handler", "get_groove_pool", ()),
+    "set_clip_groove": ("groove_handler", "set_clip_groove", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("groove_index", None),
+    )),
+    "commit_groove": ("groove_handler", "commit_groove", (("track_index", 0), ("clip_index", 0))),
+    # Simpler/Sampler Control (uses modular SimplerHandler)
+    "get_simpler_info": ("simpler_handler", "get_simpler_info", (("track_index", 0), ("device_index", None))),
+    "reverse_simpler_sample": ("simpler_handler", "reverse_simpler_sample", (
+        ("track_index", 0),
+        ("device_index", None),
+    )),
+    "crop_simpler_sample": ("simpler_handler", "crop_simpler_sample", (("track_index", 0), ("device_index", None))),
+    "set_simpler_playback_mode": ("simpler_handler", "set_simpler_playback_mode", (
+        ("track_index", 0),
+        ("mode", "classic"),
+        ("device_index", None),
+    )),
+    "set_simpler_sample_markers": ("simpler_handler", "set_simpler_sample_markers", (
+        ("track_index", 0),
+        ("start", None),
+        ("end", None),
+        ("device_index", None),
+    )),
+    "warp_simpler_sample": ("simpler_handler", "warp_simpler_sample", (
+        ("track_index", 0),
+        ("warp_mode", None),
+        ("enable", None),
+        ("device_index", None),
+    )),
+    # Arrangement View (uses modular ArrangementHandler)
+    "get_arrangement_info": ("arrangement_handler", "get_arrangement_info", ()),
+    "create_cue_point": ("arrangement_handler", "create_cue_point", (("time", 0.0), ("name", None))),
+    "delete_cue_point": ("arrangement_handler", "delete_cue_point", (("index", 0),)),
+    "jump_to_cue_point": ("arrangement_handler", "jump_to_cue_point", (("index", 0),)),
+    "set_arrangement_loop": ("arrangement_handler", "set_arrangement_loop", (
+        ("start", 0.0),
+        ("length", 4.0),
+        ("enable", True),
+    )),
+    "set_song_time": ("arrangement_handler", "set_song_time", (("time", 0.0),)),
+    "scrub_arrangement": ("arrangement_handler", "scrub_arrangement", (("time", 0.0),)),
+    # Song Operations (uses modular SongHandler)
+    "capture_midi": ("song_handler", "capture_midi", (("destination", 0),)),
+    "set_record_mode": ("song_handler", "set_record_mode", (("enabled", False),)),
+    "get_record_mode": ("song_handler", "get_record_mode", ()),
+    "set_session_record": ("song_handler", "set_session_record", (("enabled", False),)),
+    "trigger_session_record": ("song_handler", "trigger_session_record", (("record_length", None),)),
+    "set_overdub": ("song_handler", "set_overdub", (("enabled", False),)),
+    "set_punch_in": ("song_handler", "set_punch_in", (("enabled", False),)),
+    "set_punch_out": ("song_handler", "set_punch_out", (("enabled", False),)),
+    "undo": ("song_handler", "undo", ()),
+    "redo": ("song_handler", "redo", ()),
+    "get_undo_state": ("song_handler", "get_undo_state", ()),
+    "set_metronome": ("song_handler", "set_metronome", (("enabled", True),)),
+    "get_metronome": ("song_handler", "get_metronome", ()),
+    "tap_tempo": ("song_handler", "tap_tempo", ()),
+    "nudge_tempo": ("song_handler", "nudge_tempo", (("direction", "up"), ("active", True))),
+    "set_swing_amount": ("song_handler", "set_swing_amount", (("amount", 0.0),)),
+    "continue_playing": ("song_handler", "continue_playing", ()),
+    "play_selection": ("song_handler", "play_selection", ()),
+    "stop_all_clips": ("song_handler", "stop_all_clips", (("quantized", True),)),
+    "jump_by": ("song_handler", "jump_by", (("beats", 0.0),)),
+    "jump_to_next_cue": ("song_handler", "jump_to_next_cue", ()),
+    "jump_to_prev_cue": ("song_handler", "jump_to_prev_cue", ()),
+    "set_or_delete_cue": ("song_handler", "set_or_delete_cue", ()),
+    "set_loop": ("song_handler", "set_loop", (("enabled", None), ("start", None), ("length", None))),
+    "get_loop": ("song_handler", "get_loop", ()),
+    "set_clip_trigger_quantization": ("song_handler", "set_clip_trigger_quantization", (("quantization", 4),)),
+    "set_midi_recording_quantization": ("song_handler", "set_midi_recording_quantization", (("quantization", 0),)),
+    "create_return_track": ("song_handler", "create_return_track", ()),
+    "delete_return_track": ("song_handler", "delete_return_track", (("index", 0),)),
+    "get_return_tracks": ("song_handler", "get_return_tracks", ()),
+    "get_song_state": ("song_handler", "get_song_state", ()),
+    # Clip Slot Operations (uses modular ClipSlotHandler)
+    "get_slot_info": ("clip_slot_handler", "get_slot_info", (("track_index", 0), ("slot_index", 0))),
+    "fire_slot": ("clip_slot_handler", "fire_slot", (
+        ("track_index", 0),
+        ("slot_index", 0),
+        ("record_length", None),
+        ("launch_quantization", None),
+        ("force_legato", False),
+    )),
+    "stop_slot": ("clip_slot_handler", "stop_slot", (("track_index", 0), ("slot_index", 0))),
+    "create_clip_in_slot": ("clip_slot_handler", "create_clip", (
+        ("track_index", 0),
+        ("slot_index", 0),
+        ("length", 4.0),
+    )),
+    "delete_clip_in_slot": ("clip_slot_handler", "delete_clip", (("track_index", 0), ("slot_index", 0))),
+    "duplicate_clip_to_slot": ("clip_slot_handler", "duplicate_clip_to", (
+        ("src_track", 0),
+        ("src_slot", 0),
+        ("dest_track", 0),
+        ("dest_slot", 0),
+    )),
+    "set_slot_stop_button": ("clip_slot_handler", "set_stop_button", (
+        ("track_index", 0),
+        ("slot_index", 0),
+        ("has_stop_button", True),
+    )),
+    "get_track_slots": ("clip_slot_handler", "get_track_slots", (("track_index", 0),)),
+    "fire_scene": ("clip_slot_handler", "fire_scene_slots", (("scene_index", 0),)),
+    # Mixer Operations (uses modular MixerHandler)
+    "get_master_info": ("mixer_handler", "get_master_info", ()),
+    "set_master_volume": ("mixer_handler", "set_master_volume", (("value", 0.85),)),
+    "set_master_pan": ("mixer_handler", "set_master_pan", (("value", 0.0),)),
+    "get_cue_volume": ("mixer_handler", "get_cue_volume", ()),
+    "set_cue_volume": ("mixer_handler", "set_cue_volume", (("value", 0.85),)),
+    "get_crossfader": ("mixer_handler", "get_crossfader", ()),
+    "set_crossfader": ("mixer_handler", "set_crossfader", (("value", 0.0),)),
+    "set_track_crossfade_assign": ("mixer_handler", "set_track_crossfade_assign", (("track_index", 0), ("assign", 0))),
+    "get_track_sends": ("mixer_handler", "get_track_sends", (("track_index", 0),)),
+    "set_track_send": ("mixer_handler", "set_track_send", (("track_index", 0), ("send_index", 0), ("value", 0.0))),
+    "set_return_volume": ("mixer_handler", "set_return_volume", (("return_index", 0), ("value", 0.85))),
+    "set_return_pan": ("mixer_handler", "set_return_pan", (("return_index", 0), ("value", 0.0))),
+    "mute_return": ("mixer_handler", "mute_return", (("return_index", 0), ("muted", True))),
+    "solo_return": ("mixer_handler", "solo_return", (("return_index", 0), ("soloed", True))),
+    "get_mixer_overview": ("mixer_handler", "get_mixer_overview", ()),
+    # Scene Operations (uses modular SceneHandler)
+    "get_scene_info": ("scene_handler", "get_scene_info", (("scene_index", 0),)),
+    "get_all_scenes": ("scene_handler", "get_all_scenes", ()),
+    "set_scene_name": ("scene_handler", "set_scene_name", (("scene_index", 0), ("name", ""))),
+    "set_scene_color": ("scene_handler", "set_scene_color", (("scene_index", 0), ("color", 0))),
+    "set_scene_color_index": ("scene_handler", "set_scene_color_index", (("scene_index", 0), ("color_index", 0))),
+    "set_scene_tempo": ("scene_handler", "set_scene_tempo", (("scene_index", 0), ("tempo", 0))),
+    "set_scene_time_signature": ("scene_handler", "set_scene_time_signature", (
+        ("scene_index", 0),
+        ("numerator", 4),
+        ("denominator", 4),
+    )),
+    "fire_scene_by_index": ("scene_handler", "fire_scene", (("scene_index", 0), ("force_legato", False))),
+    "select_scene": ("scene_handler", "select_scene", (("scene_index", 0),)),
+    "create_scene": ("scene_handler", "create_scene", (("index", -1),)),
+    "create_scenes": ("scene_handler", "create_scenes", (("count", 1), ("names", None))),
+    "delete_scene": ("scene_handler", "delete_scene", (("scene_index", 0),)),
+    "duplicate_scene": ("scene_handler", "duplicate_scene", (("scene_index", 0),)),
+    "move_scene": ("scene_handler", "move_scene", (("scene_index", 0), ("target_index", 0))),
+    "get_scene_overview": ("scene_handler", "get_scene_overview", ()),
+    # Application Operations (uses modular ApplicationHandler)
+    "get_live_version": ("application_handler", "get_live_version", ()),
+    "get_available_views": ("application_handler", "get_available_views", ()),
+    "focus_view": ("application_handler", "focus_view", (("view_name", "Session"),)),
+    "show_view": ("application_handler", "show_view", (("view_name", "Session"),)),
+    "hide_view": ("application_handler", "hide_view", (("view_name", "Browser"),)),
+    "is_view_visible": ("application_handler", "is_view_visible", (
+        ("view_name", "Session"),
+        ("main_window_only", True),
+    )),
+    "get_focused_document_view": ("application_handler", "get_focused_document_view", ()),
+    "scroll_view": ("application_handler", "scroll_view", (
+        ("direction", 0),
+        ("view_name", "Session"),
+        ("animate", True),
+    )),
+    "zoom_view": ("application_handler", "zoom_view", (("direction", 1), ("view_name", "Session"), ("animate", True))),
+    "toggle_browser": ("application_handler", "toggle_browser", ()),
+    "get_browse_mode": ("application_handler", "get_browse_mode", ()),
+    "get_dialog_state": ("application_handler", "get_dialog_state", ()),
+    "press_dialog_button": ("application_handler", "press_dialog_button", (("button_index", 0),)),
+    "get_application_overview": ("application_handler", "get_application_overview", ()),
+    # Clip Operations (uses modular ClipHandler)
+    "fire_clip": ("clip_handler", "fire_clip", (("track_index", 0), ("clip_index", 0), ("force_legato", False))),
+    "stop_clip": ("clip_handler", "stop_clip", (("track_index", 0), ("clip_index", 0))),
+    "get_clip_details": ("clip_handler", "get_clip_details", (("track_index", 0), ("clip_index", 0))),
+    "set_clip_name": ("clip_handler", "set_clip_name", (("track_index", 0), ("clip_index", 0), ("name", ""))),
+    "set_clip_color": ("clip_handler", "set_clip_color", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("color", None),
+        ("color_index", None),
+    )),
+    "set_clip_loop": ("clip_handler", "set_clip_loop", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("looping", None),
+        ("loop_start", None),
+        ("loop_end", None),
+    )),
+    "set_clip_markers": ("clip_handler", "set_clip_markers", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("start_marker", None),
+        ("end_marker", None),
+    )),
+    "duplicate_loop": ("clip_handler", "duplicate_loop", (("track_index", 0), ("clip_index", 0))),
+    "set_clip_launch_mode": ("clip_handler", "set_clip_launch_mode", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("mode", 0),
+    )),
+    "set_clip_launch_quantization": ("clip_handler", "set_clip_launch_quantization", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("quantization", -1),
+    )),
+    "set_clip_legato": ("clip_handler", "set_clip_legato", (("track_index", 0), ("clip_index", 0), ("legato", False))),
+    "set_clip_warp": ("clip_handler", "set_clip_warp", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("warping", None),
+        ("warp_mode", None),
+    )),
+    "set_clip_pitch": ("clip_handler", "set_clip_pitch", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("coarse", None),
+        ("fine", None),
+    )),
+    "set_clip_gain": ("clip_handler", "set_clip_gain", (("track_index", 0), ("clip_index", 0), ("gain", 0.5))),
+    "quantize_clip": ("clip_handler", "quantize_clip", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("grid", 5),
+        ("amount", 1.0),
+    )),
+    "crop_clip": ("clip_handler", "crop_clip", (("track_index", 0), ("clip_index", 0))),
+    "clear_clip": ("clip_handler", "clear_clip", (("track_index", 0), ("clip_index", 0))),
+    "deselect_all_notes": ("clip_handler", "deselect_all_notes", (("track_index", 0), ("clip_index", 0))),
+    "select_all_notes": ("clip_handler", "select_all_notes", (("track_index", 0), ("clip_index", 0))),
+    # Track Group Operations (uses modular TrackGroupHandler)
+    "get_group_info": ("track_group_handler", "get_group_info", (("track_index", 0),)),
+    "get_all_groups": ("track_group_handler", "get_all_groups", ()),
+    "get_track_group_membership": ("track_group_handler", "get_track_group_membership", (("track_index", 0),)),
+    "fold_group": ("track_group_handler", "fold_group", (("track_index", 0),)),
+    "unfold_group": ("track_group_handler", "unfold_group", (("track_index", 0),)),
+    "fold_group_bulk": ("track_group_handler", "fold_group_bulk", (("track_indices", ()),)),
+    "unfold_group_bulk": ("track_group_handler", "unfold_group_bulk", (("track_indices", ()),)),
+    "toggle_group_fold": ("track_group_handler", "toggle_group_fold", (("track_index", 0),)),
+    "set_track_color": ("track_group_handler", "set_track_color", (
+        ("track_index", 0),
+        ("color", None),
+        ("color_index", None),
+    )),
+    "get_track_freeze_state": ("track_group_handler", "get_track_freeze_state", (("track_index", 0),)),
+    "stop_track_clips": ("track_group_handler", "stop_track_clips", (("track_index", 0),)),
+    "stop_track_clips_bulk": ("track_group_handler", "stop_track_clips_bulk", (("track_indices", ()),)),
+    "get_tracks_overview": ("track_group_handler", "get_tracks_overview", ()),
+    # Browser Operations (uses modular BrowserHandler)
+    "get_browser_tree": ("browser_handler", "get_browser_tree", (("max_depth", 2),)),
+    "get_browser_category": ("browser_handler", "get_browser_category", (
+        ("category_name", "sounds"),
+        ("max_items", 50),
+    )),
+    "load_item_by_uri": ("browser_handler", "load_item_by_uri", (("uri", ""),)),
+    "hotswap_target_enabled": ("browser_handler", "hotswap_target_enabled", ()),
+    "filter_browser": ("browser_handler", "filter_browser", (("filter_type", 0),)),
+    "stop_preview": ("browser_handler", "stop_preview", ()),
+    "get_browser_state": ("browser_handler", "get_browser_state", ()),
+    # Conversion Operations (uses modular ConversionHandler)
+    "audio_to_drums": ("conversion_handler", "audio_to_drums", (("track_index", 0), ("clip_index", 0))),
+    "audio_to_harmony": ("conversion_handler", "audio_to_harmony", (("track_index", 0), ("clip_index", 0))),
+    "audio_to_melody": ("conversion_handler", "audio_to_melody", (("track_index", 0), ("clip_index", 0))),
+    "simpler_to_sampler": ("conversion_handler", "simpler_to_sampler", (("track_index", 0), ("device_index", None))),
+    "create_drum_rack_from_slices": ("conversion_handler", "create_drum_rack_from_slices", (
+        ("track_index", 0),
+        ("device_index", None),
+    )),
+    # =============================================================
+    # PHASE 1 COMMANDS
+    # =============================================================
+    # ChainHandler
+    "get_chains": ("chain_handler", "get_chains", (("track_index", 0), ("device_index", 0))),
+    "get_chain": ("chain_handler", "get_chain", (("track_index", 0), ("device_index", 0), ("chain_index", 0))),
+    "set_chain_name": ("chain_handler", "set_chain_name", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+        ("name", ""),
+    )),
+    "set_chain_mute": ("chain_handler", "set_chain_bool", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+        _Const("mute"),
+        ("mute", True),
+    )),
+    "set_chain_solo": ("chain_handler", "set_chain_bool", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+        _Const("solo"),
+        ("solo", True),
+    )),
+    "set_chain_color": ("chain_handler", "set_chain_color", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+        ("color", None),
+    )),
+    "delete_chain_device": ("chain_handler", "delete_chain_device", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+        ("chain_device_index", 0),
+    )),
+    "get_chain_mixer": ("chain_handler", "get_chain_mixer", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+    )),
+    "set_chain_volume": ("chain_handler", "set_chain_mixer_volume", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+        ("volume", 0.85),
+    )),
+    "set_chain_pan": ("chain_handler", "set_chain_mixer_pan", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+        ("pan", 0.0),
+    )),
+    "set_chain_send": ("chain_handler", "set_chain_mixer_send", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+        ("send_index", 0),
+        ("value", 0.0),
+    )),
+    "set_drum_chain_choke_group": ("chain_handler", "set_drum_chain_choke_group", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+        ("group", 0),
+    )),
+    "set_drum_chain_out_note": ("chain_handler", "set_drum_chain_out_note", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("chain_index", 0),
+        ("note", 60),
+    )),
+
+    # SpecializedDeviceHandler (Extended)
+    "get_specialized_device_info": ("specialized_device_handler", "get_specialized_device_info", (
+        ("track_index", 0),
+        ("device_index", 0),
+    )),
+    "toggle_device_active": ("specialized_device_handler", "toggle_device_active", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("active", True),
+    )),
+    "get_max_device_banks": ("specialized_device_handler", "get_max_device_banks", (
+        ("track_index", 0),
+        ("device_index", 0),
+    )),
+    "get_wavetable_oscillator": ("specialized_device_handler", "get_wavetable_oscillator", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("osc_index", 0),
+    )),
+    "get_wavetable_modulation": ("specialized_device_handler", "get_wavetable_modulation", (
+        ("track_index", 0),
+        ("device_index", 0),
+    )),
+    "get_hybrid_reverb_ir": ("specialized_device_handler", "get_hybrid_reverb_ir", (
+        ("track_index", 0),
+        ("device_index", 0),
+    )),
+
+    # =============================================================
+    # PHASE 2 COMMANDS
+    # =============================================================
+    # SongHandler (Additions)
+    "scrub_by": ("song_handler", "scrub_by", (("beats", 1.0),)),
+    "set_groove_amount": ("song_handler", "set_groove_amount", (("amount", 0.5),)),
+    "get_groove_amount": ("song_handler", "get_groove_amount", ()),
+    "capture_and_insert_scene": ("song_handler", "capture_and_insert_scene", (("scene_index", "selected"),)),
+    "get_cue_points": ("song_handler", "get_cue_points", ()),
+
+    # ClipHandler (Additions)
+    "set_clip_audio_properties": ("clip_handler", "set_clip_audio_properties", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("warp_mode", None),
+        ("warping", None),
+        ("pitch_coarse", None),
+        ("pitch_fine", None),
+        ("gain", None),
+    )),
+    "scrub_clip": ("clip_handler", "scrub_clip", (("track_index", 0), ("clip_index", 0), ("position", 0.0))),
+    "stop_scrub": ("clip_handler", "stop_scrub", (("track_index", 0), ("clip_index", 0))),
+    "get_notes": ("clip_handler", "get_notes", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("start_time", 0),
+        ("time_span", 1000),
+    )),
+    # Note: get_clip_details from Phase 2 already registered? It should be.
+
+    # Phase 5: Automation
+    "get_clip_envelope": ("clip_handler", "get_clip_envelope", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("device_id", "mixer"),
+        ("parameter_id", 0),
+    )),
+    "set_clip_envelope_step": ("clip_handler", "set_clip_envelope_step", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("device_id", "mixer"),
+        ("parameter_id", 0),
+        ("time", 0.0),
+        ("length", 1.0),
+        ("value", 0.0),
+    )),
+    "clear_clip_envelope": ("clip_handler", "clear_clip_envelope", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("device_id", "mixer"),
+        ("parameter_id", 0),
+    )),
+
+    # Phase 6: Humanization
+    "get_notes_extended": ("clip_handler", "get_notes_extended", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("start_time", 0),
+        ("time_span", 1000),
+    )),
+    "update_notes": ("clip_handler", "update_notes", (("track_index", 0), ("clip_index", 0), ("notes", ()))),
+
+    "set_notes": ("clip_handler", "set_notes", (("track_index", 0), ("clip_index", 0), ("notes", ()))),
+    "remove_notes": ("clip_handler", "remove_notes", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("start_time", 0),
+        ("time_span", 1000),
+        ("start_pitch", 0),
+        ("pitch_span", 128),
+    )),
+    "replace_selected_notes": ("clip_handler", "replace_selected_notes", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("notes", ()),
+    )),
+
+    # TrackHandler (Additions)
+    "set_track_fold_state": ("track_handler", "set_track_fold_state", (("track_index", 0), ("folded", True))),
+    "get_track_meters": ("track_handler", "get_track_meters", (("track_index", 0),)),
+    "get_arrangement_clips": ("track_handler", "get_arrangement_clips", (("track_index", 0),)),
+    "jump_in_running_session_clip": ("track_handler", "jump_in_running_session_clip", (
+        ("track_index", 0),
+        ("beats", 1.0),
+    )),
+    "duplicate_clip_to_arrangement": ("track_handler", "duplicate_clip_to_arrangement", (
+        ("track_index", 0),
+        ("clip_index", 0),
+        ("arrangement_time", 0.0),
+    )),
+
+    # DeviceHandler (Additions)
+    "begin_parameter_gesture": ("device_handler", "begin_parameter_gesture", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("parameter", 0),
+    )),
+    "end_parameter_gesture": ("device_handler", "end_parameter_gesture", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("parameter", 0),
+    )),
+    "str_for_value": ("device_handler", "str_for_value", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("parameter", 0),
+        ("value", 0.0),
+    )),
+    "re_enable_automation": ("device_handler", "re_enable_automation", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("parameter", 0),
+    )),
+    "set_device_routing": ("device_handler", "set_device_routing", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("routing_type", None),
+        ("routing_channel", None),
+    )),
+
+    # Phase 7: Final Polish
+    "get_data": ("song_handler", "get_data", (("key", ""),)),
+    "set_data": ("song_handler", "set_data", (("key", ""), ("value", ""))),
+    "move_device": ("song_handler", "move_device", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("target_track_index", 0),
+        ("target_index", -1),
+    )),
+    "store_variation": ("device_handler", "store_variation", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("variation_index", -1),
+    )),
+    "recall_variation": ("device_handler", "recall_variation", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("variation_index", -1),
+    )),
+    "delete_variation": ("device_handler", "delete_variation", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("variation_index", -1),
+    )),
+    "randomize_macros": ("device_handler", "randomize_macros", (("track_index", 0), ("device_index", 0))),
+    "copy_pad": ("device_handler", "copy_pad", (
+        ("track_index", 0),
+        ("device_index", 0),
+        ("from_note", 0),
+        ("to_note", 0),
+    )),
+
+    # =============================================================
+    # PHASE 3 COMMANDS
+    # =============================================================
+    # BrowserHandler (Updates)
+    "preview_item_by_uri": ("browser_handler", "preview_item_by_uri", (("uri", ""),)),
+
+    # SampleHandler (New)
+    "get_sample_details": ("sample_handler", "get_sample_details", (
+        ("track_index", 0),
+        ("clip_index", None),
+        ("device_index", None),
+    )),
+    "get_slices": ("sample_handler", "get_slices", (("track_index", 0), ("clip_index", None), ("device_index", None))),
+    "insert_slice": ("sample_handler", "insert_slice", (
+        ("track_index", 0),
+        ("slice_time", 0),
+        ("clip_index", None),
+        ("device_index", None),
+    )),
+    "remove_slice": ("sample_handler", "remove_slice", (
+        ("track_index", 0),
+        ("slice_time", 0),
+        ("clip_index", None),
+        ("device_index", None),
+    )),
+    "clear_slices": ("sample_handler", "clear_slices", (
+        ("track_index", 0),
+        ("clip_index", None),
+        ("device_index", None),
+    )),
+    "reset_slices": ("sample_handler", "reset_slices", (
+        ("track_index", 0),
+        ("clip_index", None),
+        ("device_index", None),
+    )),
+    "set_sample_gain": ("sample_handler", "set_sample_gain", (
+        ("track_index", 0),
+        ("gain", 1.0),
+        ("clip_index", None),
+        ("device_index", None),
+    )),
+    "get_gain_display_string": ("sample_handler", "get_gain_display_string", (
+        ("track_index", 0),
+        ("clip_index", None),
+        ("device_index", None),
+    )),
+    "beat_to_sample_time": ("sample_handler", "beat_to_sample_time", (
+        ("track_index", 0),
+        ("beat_time", 0.0),
+        ("clip_index", None),
+        ("device_index", None),
+    )),
+    "sample_to_beat_time": ("sample_handler", "sample_to_beat_time", (
+        ("track_index", 0),
+        ("sample_time", 0.0),
+        ("clip_index", None),
+        ("device_index", None),
+    )),
+
+    "create_drum_rack_from_audio_clip": ("conversion_handler", "create_drum_rack_from_audio_clip", (
+        ("track_index", 0),
+        ("clip_index", 0),
+    )),
+    "move_devices_to_drum_rack": ("conversion_handler", "move_devices_to_drum_rack", (("track_index", 0),)),
+    "midi_to_audio": ("conversion_handler", "midi_to_audio", (("track_index", 0),)),
+    "consolidate_clip": ("conversion_handler", "consolidate_clip", (("track_index", 0), ("clip_index", 0))),
+    # Specialized Device Operations (uses modular SpecializedDeviceHandler)
+    "set_eq8_band": ("specialized_device_handler", "set_eq8_band", (
+        ("track_index", 0),
+        ("band_index", 1),
+        ("enabled", None),
+        ("freq", None),
+        ("gain", None),
+        ("q", None),
+        ("filter_type", None),
+        ("device_index", None),
+    )),
+    "set_compressor_sidechain": ("specialized_device_handler", "set_compressor_sidechain", (
+        ("track_index", 0),
+        ("enabled", None),
+        ("source_track_index", None),
+        ("gain", None),
+        ("mix", None),
+        ("device_index", None),
+    )),
+}
+
+
+# Pure queries whose responses may be reused for a short window. Agents
+# tend to re-ask for the same state within milliseconds; anything that
+# changes Live's state invalidates the whole cache.
+_CACHEABLE = frozenset((
+    "list_loadable_devices",
+    "search_loadable_devices",
+    "list_routable_devices",
+    "get_song_state",
+    "get_arrangement_info",
+    "get_groove_pool",
+    "get_live_version",
+    "get_available_views",
+    "get_master_info",
+    "get_mixer_overview",
+    "get_tracks_overview",
+    "get_scene_overview",
+))
+_CACHE_MAXSIZE = 64
+_CACHE_TTL = 0.5  # seconds; bounds staleness from edits made in Live's UI
+
+# Reads answered directly on the socket thread, as they always have been.
+# The Live API is not thread-safe, so nothing else joins this set; every
+# other table command runs on Live's main thread. Browser walks in
+# particular can take far longer than a main-thread wait allows and would
+# freeze Live's UI for their duration.
+_BACKGROUND_COMMANDS = frozenset((
+    "get_session_info",
+    "get_track_info",
+    "list_clips",
+    "get_browser_item",
+    "get_browser_items_at_path",
+))
+
+# Reads polled at control rate (meter displays). The socket thread answers
+# them with the previous reading and queues a fresh one for Live's next
+# tick, so a poller never waits on the main thread and sees values at most
+# one poll old. Only the first poll for given params waits for a reading.
+_SNAPSHOT_COMMANDS = frozenset((
+    "get_track_meters",
+))
+
+# Commands queued for the main thread beyond this are refused rather than
+# left to time out behind a stalled tick
+_PENDING_MAXSIZE = 256
+
+# Failed commands are logged with a full traceback only when
+# ABLETON_MCP_DEBUG=1; handlers already log their own errors, and a client
+# that keeps sending bad commands shouldn't cost a stack walk each time
+_DEBUG = os.environ.get("ABLETON_MCP_DEBUG") == "1"
 
 
 class CommandDispatcher(object):
@@ -40,8 +974,9 @@ class CommandDispatcher(object):
     Routes incoming commands to appropriate handler methods.
     
     The dispatcher maintains a mapping of command type strings to handler
-    method calls. Each command is processed synchronously on Live's main
-    thread via the socket callback mechanism.
+    method calls. Commands are queued for Live's main thread via the socket
+    callback mechanism; the session/track reads in _BACKGROUND_COMMANDS
+    are answered directly on the socket thread.
     
     Attributes:
         handler: Reference to the main AbletonMCP ControlSurface instance,
@@ -58,1015 +993,288 @@ class CommandDispatcher(object):
     """
     def __init__(self, handler):
         self.handler = handler
+        
+        # Built once; every entry takes the command's params dict. Exposed
+        # read-only since socket threads share it without locking.
+        table = self._build_dispatch_table()
+        self._dispatch = types.MappingProxyType(table)
+        # Pre-bound lookup on the underlying dict: dispatch() calls this
+        # directly, skipping both the attribute lookup and the proxy layer
+        self._lookup = table.get
+
+        # Dense opcode numbering of the table, for clients that send an int
+        # "type": opcode -> command type and opcode -> callable by index
+        self._opcode_names = tuple(sorted(self._dispatch))
+        self._dispatch_arr = tuple(self._dispatch[name] for name in self._opcode_names)
+        self._opcodes = dict((name, i) for i, name in enumerate(self._opcode_names))
+
+        # (command_type, params) -> (timestamp, response) for _CACHEABLE
+        self._cache = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # (command_type, params) -> last main-thread response, and the keys
+        # with a refresh already queued, for _SNAPSHOT_COMMANDS
+        self._snapshots = {}
+        self._snapshot_refreshing = set()
+
+        # (fn, params, box, done) entries awaiting Live's main thread; the
+        # drain stores the response in box[0] and sets the done Event
+        self._pending = collections.deque()
+
+        # Opt-in per-command call counts (ABLETON_MCP_DISPATCH_STATS=1), for
+        # finding which commands dominate a session; see get_dispatch_stats
+        self._stats = None
+        if os.environ.get("ABLETON_MCP_DISPATCH_STATS") == "1":
+            self._stats = collections.Counter()
+
+        # get_browser_categories and get_browser_items were part of the
+        # original _process_command logic; delegate only if the handler
+        # still provides them. Resolved once rather than per call.
+        self._browser_categories = getattr(handler, "_get_browser_categories", None)
+        self._browser_items = getattr(handler, "_get_browser_items", None)
+
+    def _build_dispatch_table(self):
+        """
+        Build the command type -> callable mapping from _COMMAND_SPECS.
+        
+        Called once from __init__ so dispatch() is a single dict lookup.
+        Each callable is a generated thunk taking the params dict; commands
+        in this table modify or read Live's state and are executed on
+        Live's main thread unless listed in _BACKGROUND_COMMANDS.
+        """
+        table = {}
+        # Each sub-handler is resolved once, however many commands it serves
+        owners = {None: self.handler}
+        for command_type, (handler_attr, method_name, args) in _COMMAND_SPECS.items():
+            owner = owners.get(handler_attr)
+            if owner is None:
+                owner = owners[handler_attr] = getattr(self.handler, handler_attr)
+            # Interned keys let lookups of interned command types hit the
+            # pointer-identity fast path of str comparison
+            table[sys.intern(command_type)] = _compile_thunk(_bind_method(owner, method_name), args)
+        return table
 
     def dispatch(self, command):
         """Process a command and return a response"""
         command_type = command.get("type", "")
+        fn = None
+        if isinstance(command_type, str):
+            # Command types come from a small fixed vocabulary
+            command_type = sys.intern(command_type)
+            fn = self._lookup(command_type)
+        elif type(command_type) is int and 0 <= command_type < len(self._dispatch_arr):
+            # Opcode: index straight into the table, no string hashing
+            fn = self._dispatch_arr[command_type]
+            command_type = self._opcode_names[command_type]
         params = command.get("params", {})
+        if self._stats is not None:
+            self._stats[command_type] += 1
+
+        # Responses are built fresh at each leaf rather than pre-allocated and
+        # mutated, so the common success path allocates a single dict.
+        if fn is not None:
+            # The runners guard the handler call itself, so routing needs
+            # no try block of its own
+            if command_type in _BACKGROUND_COMMANDS:
+                run = self._run_in_background
+            elif command_type in _SNAPSHOT_COMMANDS:
+                return self._run_from_snapshot(command_type, fn, params)
+            else:
+                run = self._run_on_main_thread
+                if self._cache and command_type not in _CACHEABLE:
+                    with self._cache_lock:
+                        self._cache.clear()
+            if command_type in _CACHEABLE:
+                return self._run_cached(command_type, run, fn, params)
+            return run(fn, params)
+
+        try:
+            if command_type == "batch":
+                return self._dispatch_batch(params)
+            return self._dispatch_direct(command_type, params)
+        except Exception as e:
+            self._log_error("Error processing command: ", e)
+            return {"status": "error", "message": str(e)}
+
+    def _dispatch_batch(self, params):
+        """
+        Run a list of commands in order within a single main-thread task.
+        
+        Params:
+            commands: List of {"type": ..., "params": ...} command dicts
         
-        response = {
-            "status": "success",
-            "result": {}
-        }
+        Returns one response dict per command, in order; a failing command
+        does not stop the ones after it. Nested batches are rejected.
+        """
+        commands = params.get("commands", ())
+        if not isinstance(commands, (list, tuple)):
+            return {"status": "error", "message": "batch 'commands' must be a list"}
+        if self._cache:
+            with self._cache_lock:
+                self._cache.clear()
+
+        def run_batch(_params):
+            return [self._dispatch_inline(command) for command in commands]
+
+        return self._run_on_main_thread(run_batch, None)
 
+    def _dispatch_inline(self, command):
+        """Run one batched command on the current (main) thread"""
         try:
-            # Map command types to method names on the handler
-            # This allows us to decouple the command name from the method name if needed
-            # For now, we manually map to existing methods
-            
-            # Commands that modify Live's state (require main thread)
-            main_thread_commands = {
-                "create_midi_track": lambda: self.handler.track_handler.create_midi_track(params.get("index", -1)),
-                "create_audio_track": lambda: self.handler.track_handler.create_audio_track(params.get("index", -1)),
-                "delete_track": lambda: self.handler.track_handler.delete_track(params.get("track_index", -1)),
-                "duplicate_track": lambda: self.handler.track_handler.duplicate_track(params.get("track_index", -1), params.get("target_index", None)),
-                "set_track_name": lambda: self.handler.track_handler.set_track_name(params.get("track_index", 0), params.get("name", "")),
-                "configure_track_routing": lambda: self.handler.track_handler.configure_track_routing(
-                    params.get("track_index", 0),
-                    params.get("input_type", None),
-                    params.get("input_channel", None),
-                    params.get("output_type", None),
-                    params.get("output_channel", None),
-                    params.get("monitor_state", None),
-                    params.get("arm", None),
-                    params.get("sends", None)
-                ),
-                "set_track_io": lambda: self.handler.track_handler.set_track_io(
-                    params.get("track_index", 0),
-                    params.get("input_type", None),
-                    params.get("input_channel", None),
-                    params.get("output_type", None),
-                    params.get("output_channel", None)
-                ),
-                "set_track_monitor": lambda: self.handler.track_handler.set_track_monitor(params.get("track_index", 0), params.get("state", "auto")),
-                "set_track_arm": lambda: self.handler.track_handler.set_track_bool(params.get("track_index", 0), "arm", params.get("arm", True)),
-                "set_track_solo": lambda: self.handler.track_handler.set_track_bool(params.get("track_index", 0), "solo", params.get("solo", True)),
-                "set_track_mute": lambda: self.handler.track_handler.set_track_bool(params.get("track_index", 0), "mute", params.get("mute", True)),
-                "set_track_volume": lambda: self.handler.track_handler.set_track_volume(params.get("track_index", 0), params.get("volume", 0.0)),
-                "set_track_panning": lambda: self.handler.track_handler.set_track_panning(params.get("track_index", 0), params.get("panning", 0.0)),
-                "set_send_level": lambda: self.handler.track_handler.set_send_level(params.get("track_index", 0), params.get("send_index", 0), params.get("level", 0.0)),
-                "create_return_track": lambda: self.handler.track_handler.create_return_track(params.get("name", None)),
-                "delete_return_track": lambda: self.handler.track_handler.delete_return_track(params.get("index", -1)),
-                "set_return_track_name": lambda: self.handler.track_handler.set_return_track_name(params.get("index", 0), params.get("name", "")),
-                "get_routing_options": lambda: self.handler.track_handler.get_routing_options(params.get("track_index", 0)),
-                "set_track_output": lambda: self.handler.track_handler.set_track_output(
-                    params.get("track_index", 0),
-                    params.get("output_name", "Master")
-                ),
-                "create_clip": lambda: self.handler.track_handler.create_clip(params.get("track_index", 0), params.get("clip_index", 0), params.get("length", 4.0)),
-                "delete_clip": lambda: self.handler.track_handler.delete_clip(params.get("track_index", 0), params.get("clip_index", 0)),
-                "duplicate_clip": lambda: self.handler.track_handler.duplicate_clip(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("target_track_index", None),
-                    params.get("target_clip_index", None)
-                ),
-                "add_notes_to_clip": lambda: self.handler.track_handler.add_notes_to_clip(params.get("track_index", 0), params.get("clip_index", 0), params.get("notes", [])),
-                "set_clip_name": lambda: self.handler.track_handler.set_clip_name(params.get("track_index", 0), params.get("clip_index", 0), params.get("name", "Clip")),
-                "set_clip_loop": lambda: self.handler.track_handler.set_clip_loop(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("start", None),
-                    params.get("end", None),
-                    params.get("loop_on", True)
-                ),
-                "set_clip_length": lambda: self.handler.track_handler.set_clip_length(params.get("track_index", 0), params.get("clip_index", 0), params.get("length", 4.0)),
-                "quantize_clip": lambda: self.handler.track_handler.quantize_clip(params.get("track_index", 0), params.get("clip_index", 0), params.get("grid", 0.25), params.get("amount", 1.0)),
-                "transpose_clip": lambda: self.handler.track_handler.transpose_clip(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("semitones", 0)
-                ),
-                "apply_legato": lambda: self.handler.track_handler.apply_legato(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("preserve_gaps_below", 0.0)
-                ),
-                "set_tempo": lambda: self.handler.session_handler.set_tempo(params.get("tempo", 120.0)),
-                "set_time_signature": lambda: self.handler.session_handler.set_time_signature(params.get("numerator", 4), params.get("denominator", 4)),
-                "fire_clip": lambda: self.handler.track_handler.fire_clip(params.get("track_index", 0), params.get("clip_index", 0)),
-                "list_clips": lambda: self.handler.track_handler.list_clips(
-                    params.get("track_pattern", None),
-                    params.get("match_mode", "contains")
-                ),
-                "fire_clip_by_name": lambda: self.handler.track_handler.fire_clip_by_name(
-                    params.get("clip_pattern", ""),
-                    params.get("track_pattern", None),
-                    params.get("match_mode", "contains"),
-                    params.get("first_only", True)
-                ),
-                "trigger_test_midi": lambda: self.handler._trigger_test_midi(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("length", 1.0),
-                    params.get("pitch", 60),
-                    params.get("velocity", 100),
-                    params.get("duration", 0.5),
-                    params.get("start_time", 0.0),
-                    params.get("overwrite_clip", False),
-                    params.get("fire_clip", True),
-                    params.get("cc_number", None),
-                    params.get("cc_value", 64),
-                    params.get("channel", 0)
-                ),
-                "stop_clip": lambda: self.handler.track_handler.stop_clip(params.get("track_index", 0), params.get("clip_index", 0)),
-                "start_playback": lambda: self.handler.session_handler.start_playback(),
-                "stop_playback": lambda: self.handler.session_handler.stop_playback(),
-                "set_record_mode": lambda: self.handler.session_handler.set_record_mode(params.get("enabled", False)),
-                "trigger_session_record": lambda: self.handler.session_handler.trigger_session_record(params.get("record_length", 0)),
-                "capture_midi": lambda: self.handler.session_handler.capture_midi(params.get("destination", 0)),
-                "set_overdub": lambda: self.handler.session_handler.set_overdub(params.get("enabled", False)),
-                "create_scene": lambda: self.handler.session_handler.create_scene(params.get("index", -1), params.get("name", None)),
-                "delete_scene": lambda: self.handler.session_handler.delete_scene(params.get("index", -1)),
-                "duplicate_scene": lambda: self.handler.session_handler.duplicate_scene(params.get("index", -1)),
-                "fire_scene": lambda: self.handler.session_handler.fire_scene(params.get("index", -1)),
-                "fire_scene_by_name": lambda: self.handler.session_handler.fire_scene_by_name(
-                    params.get("pattern", ""),
-                    params.get("match_mode", "contains"),
-                    params.get("first_only", True)
-                ),
-                "stop_scene": lambda: self.handler.session_handler.stop_scene(params.get("index", -1)),
-                "get_song_context": lambda: self.handler.session_handler.get_song_context(params.get("include_clips", False)),
-                "load_browser_item": lambda: self.handler.device_handler.load_browser_item(
-                    params.get("track_index", 0),
-                    params.get("item_uri", ""),
-                    params.get("clip_index", None)
-                ),
-                "load_device": lambda: self.handler.device_handler.load_device(params.get("track_index", 0), params.get("device_uri", ""), params.get("device_slot", -1)),
-                "hotswap_browser_item": lambda: self.handler.device_handler.hotswap_browser_item(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0),
-                    params.get("item_uri", "")
-                ),
-                "set_device_parameter": lambda: self.handler.device_handler.set_device_parameter(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0),
-                    params.get("parameter", 0),
-                    params.get("value", 0.0)
-                ),
-                # Conversion Commands
-                "create_drum_rack_from_slices": lambda: self.handler.conversion_handler.create_drum_rack_from_slices(
-                    params.get("track_index", 0), 
-                    params.get("device_index", None)
-                ),
-                "create_drum_rack_from_audio_clip": lambda: self.handler.conversion_handler.create_drum_rack_from_audio_clip(
-                    params.get("track_index", 0), 
-                    params.get("clip_index", 0)
-                ),
-                "move_devices_to_drum_rack": lambda: self.handler.conversion_handler.move_devices_to_drum_rack(
-                    params.get("track_index", 0)
-                ),
-                "audio_to_drums": lambda: self.handler.conversion_handler.audio_to_drums(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "audio_to_harmony": lambda: self.handler.conversion_handler.audio_to_harmony(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "audio_to_melody": lambda: self.handler.conversion_handler.audio_to_melody(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                # Macro Commands
-                "get_rack_macros": lambda: self.handler.device_handler.get_rack_macros(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0)
-                ),
-                "add_macro": lambda: self.handler.device_handler.add_macro(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0)
-                ),
-                "remove_macro": lambda: self.handler.device_handler.remove_macro(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0)
-                ),
-                "randomize_macros": lambda: self.handler.device_handler.randomize_macros(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0)
-                ),
-                "get_rack_chains": lambda: self.handler.device_handler.get_rack_chains(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0)
-                ),
-                "set_device_parameters": lambda: self.handler.device_handler.set_device_parameters(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0),
-                    params.get("parameters", None)
-                ),
-                "set_device_audio_input": lambda: self.handler._set_device_audio_input(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0),
-                    params.get("input_type", None),
-                    params.get("input_channel", None)
-                ),
-                "get_device_parameters": lambda: self.handler.device_handler.get_device_parameters(params.get("track_index", 0), params.get("device_index", 0)),
-                "set_device_sidechain_source": lambda: self.handler.device_handler.set_device_sidechain_source(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0),
-                    params.get("source_track_index", 0),
-                    params.get("pre_fx", True),
-                    params.get("mono", True)
-                ),
-                "list_routable_devices": lambda: self.handler.device_handler.list_routable_devices(),
-                "save_device_snapshot": lambda: self.handler.device_handler.save_device_snapshot(params.get("track_index", 0), params.get("device_index", 0)),
-                "save_device_preset": lambda: self.handler.device_handler.save_device_snapshot(params.get("track_index", 0), params.get("device_index", 0)),
-                "apply_device_snapshot": lambda: self.handler.device_handler.apply_device_snapshot(
-                    params.get("track_index", 0),
-                    params.get("device_index", 0),
-                    params.get("snapshot", {})
-                ),
-                "add_basic_drum_pattern": lambda: self.handler.track_handler.add_basic_drum_pattern(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "add_chord_stack": lambda: self.handler._add_chord_stack(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("root_midi", 60),
-                    params.get("quality", "major"),
-                    params.get("bars", 4),
-                    params.get("chord_length", 1.0)
-                ),
-                "set_clip_envelope": lambda: self.handler.track_handler.set_clip_envelope(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("device_index", 0),
-                    params.get("parameter_name", "Frequency"),
-                    params.get("points", [])
-                ),
-                "list_loadable_devices": lambda: self.handler.device_handler.list_loadable_devices(params.get("category", "all"), params.get("max_items", 200)),
-                "search_loadable_devices": lambda: self.handler.device_handler.search_loadable_devices(
-                    params.get("query", ""),
-                    params.get("category", "all"),
-                    params.get("max_items", 200)
-                ),
-                "get_clip_notes": lambda: self.handler.track_handler.get_clip_notes(params.get("track_index", 0), params.get("clip_index", 0)),
-                "search_and_load_device": lambda: self.handler.device_handler.search_and_load_device(
-                    params.get("track_index", 0),
-                    params.get("query", ""),
-                    params.get("category", "all")
-                ),
-                # Drum Rack Management (uses modular DrumRackHandler)
-                "get_drum_rack_info": lambda: self.handler.drum_rack_handler.get_drum_rack_info(
-                    params.get("track_index", 0),
-                    params.get("device_index", None),
-                    params.get("include_empty", False)
-                ),
-                "copy_drum_pad": lambda: self.handler.drum_rack_handler.copy_drum_pad(
-                    params.get("track_index", 0),
-                    params.get("source_note", 36),
-                    params.get("dest_note", 37),
-                    params.get("device_index", None)
-                ),
-                "set_drum_pad_choke_group": lambda: self.handler.drum_rack_handler.set_drum_pad_choke_group(
-                    params.get("track_index", 0),
-                    params.get("note", 36),
-                    params.get("choke_group", 0),
-                    params.get("device_index", None)
-                ),
-                "mute_drum_pad": lambda: self.handler.drum_rack_handler.mute_drum_pad(
-                    params.get("track_index", 0),
-                    params.get("note", 36),
-                    params.get("mute", True),
-                    params.get("device_index", None)
-                ),
-                "solo_drum_pad": lambda: self.handler.drum_rack_handler.solo_drum_pad(
-                    params.get("track_index", 0),
-                    params.get("note", 36),
-                    params.get("solo", True),
-                    params.get("device_index", None)
-                ),
-                # Groove Pool Management (uses modular GrooveHandler)
-                "get_groove_pool": lambda: self.handler.groove_handler.get_groove_pool(),
-                "set_clip_groove": lambda: self.handler.groove_handler.set_clip_groove(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("groove_index", None)
-                ),
-                "commit_groove": lambda: self.handler.groove_handler.commit_groove(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                # Simpler/Sampler Control (uses modular SimplerHandler)
-                "get_simpler_info": lambda: self.handler.simpler_handler.get_simpler_info(
-                    params.get("track_index", 0),
-                    params.get("device_index", None)
-                ),
-                "reverse_simpler_sample": lambda: self.handler.simpler_handler.reverse_simpler_sample(
-                    params.get("track_index", 0),
-                    params.get("device_index", None)
-                ),
-                "crop_simpler_sample": lambda: self.handler.simpler_handler.crop_simpler_sample(
-                    params.get("track_index", 0),
-                    params.get("device_index", None)
-                ),
-                "set_simpler_playback_mode": lambda: self.handler.simpler_handler.set_simpler_playback_mode(
-                    params.get("track_index", 0),
-                    params.get("mode", "classic"),
-                    params.get("device_index", None)
-                ),
-                "set_simpler_sample_markers": lambda: self.handler.simpler_handler.set_simpler_sample_markers(
-                    params.get("track_index", 0),
-                    params.get("start", None),
-                    params.get("end", None),
-                    params.get("device_index", None)
-                ),
-                "warp_simpler_sample": lambda: self.handler.simpler_handler.warp_simpler_sample(
-                    params.get("track_index", 0),
-                    params.get("warp_mode", None),
-                    params.get("enable", None),
-                    params.get("device_index", None)
-                ),
-                # Arrangement View (uses modular ArrangementHandler)
-                "get_arrangement_info": lambda: self.handler.arrangement_handler.get_arrangement_info(),
-                "create_cue_point": lambda: self.handler.arrangement_handler.create_cue_point(
-                    params.get("time", 0.0),
-                    params.get("name", None)
-                ),
-                "delete_cue_point": lambda: self.handler.arrangement_handler.delete_cue_point(
-                    params.get("index", 0)
-                ),
-                "jump_to_cue_point": lambda: self.handler.arrangement_handler.jump_to_cue_point(
-                    params.get("index", 0)
-                ),
-                "set_arrangement_loop": lambda: self.handler.arrangement_handler.set_arrangement_loop(
-                    params.get("start", 0.0),
-                    params.get("length", 4.0),
-                    params.get("enable", True)
-                ),
-                "set_song_time": lambda: self.handler.arrangement_handler.set_song_time(
-                    params.get("time", 0.0)
-                ),
-                "scrub_arrangement": lambda: self.handler.arrangement_handler.scrub_arrangement(
-                    params.get("time", 0.0)
-                ),
-                # Song Operations (uses modular SongHandler)
-                "capture_midi": lambda: self.handler.song_handler.capture_midi(
-                    params.get("destination", 0)
-                ),
-                "set_record_mode": lambda: self.handler.song_handler.set_record_mode(
-                    params.get("enabled", False)
-                ),
-                "get_record_mode": lambda: self.handler.song_handler.get_record_mode(),
-                "set_session_record": lambda: self.handler.song_handler.set_session_record(
-                    params.get("enabled", False)
-                ),
-                "trigger_session_record": lambda: self.handler.song_handler.trigger_session_record(
-                    params.get("record_length", None)
-                ),
-                "set_overdub": lambda: self.handler.song_handler.set_overdub(
-                    params.get("enabled", False)
-                ),
-                "set_punch_in": lambda: self.handler.song_handler.set_punch_in(
-                    params.get("enabled", False)
-                ),
-                "set_punch_out": lambda: self.handler.song_handler.set_punch_out(
-                    params.get("enabled", False)
-                ),
-                "undo": lambda: self.handler.song_handler.undo(),
-                "redo": lambda: self.handler.song_handler.redo(),
-                "get_undo_state": lambda: self.handler.song_handler.get_undo_state(),
-                "set_metronome": lambda: self.handler.song_handler.set_metronome(
-                    params.get("enabled", True)
-                ),
-                "get_metronome": lambda: self.handler.song_handler.get_metronome(),
-                "tap_tempo": lambda: self.handler.song_handler.tap_tempo(),
-                "nudge_tempo": lambda: self.handler.song_handler.nudge_tempo(
-                    params.get("direction", "up"),
-                    params.get("active", True)
-                ),
-                "set_swing_amount": lambda: self.handler.song_handler.set_swing_amount(
-                    params.get("amount", 0.0)
-                ),
-                "continue_playing": lambda: self.handler.song_handler.continue_playing(),
-                "play_selection": lambda: self.handler.song_handler.play_selection(),
-                "stop_all_clips": lambda: self.handler.song_handler.stop_all_clips(
-                    params.get("quantized", True)
-                ),
-                "jump_by": lambda: self.handler.song_handler.jump_by(
-                    params.get("beats", 0.0)
-                ),
-                "jump_to_next_cue": lambda: self.handler.song_handler.jump_to_next_cue(),
-                "jump_to_prev_cue": lambda: self.handler.song_handler.jump_to_prev_cue(),
-                "set_or_delete_cue": lambda: self.handler.song_handler.set_or_delete_cue(),
-                "set_loop": lambda: self.handler.song_handler.set_loop(
-                    params.get("enabled", None),
-                    params.get("start", None),
-                    params.get("length", None)
-                ),
-                "get_loop": lambda: self.handler.song_handler.get_loop(),
-                "set_clip_trigger_quantization": lambda: self.handler.song_handler.set_clip_trigger_quantization(
-                    params.get("quantization", 4)
-                ),
-                "set_midi_recording_quantization": lambda: self.handler.song_handler.set_midi_recording_quantization(
-                    params.get("quantization", 0)
-                ),
-                "create_return_track": lambda: self.handler.song_handler.create_return_track(),
-                "delete_return_track": lambda: self.handler.song_handler.delete_return_track(
-                    params.get("index", 0)
-                ),
-                "get_return_tracks": lambda: self.handler.song_handler.get_return_tracks(),
-                "get_song_state": lambda: self.handler.song_handler.get_song_state(),
-                # Clip Slot Operations (uses modular ClipSlotHandler)
-                "get_slot_info": lambda: self.handler.clip_slot_handler.get_slot_info(
-                    params.get("track_index", 0),
-                    params.get("slot_index", 0)
-                ),
-                "fire_slot": lambda: self.handler.clip_slot_handler.fire_slot(
-                    params.get("track_index", 0),
-                    params.get("slot_index", 0),
-                    params.get("record_length", None),
-                    params.get("launch_quantization", None),
-                    params.get("force_legato", False)
-                ),
-                "stop_slot": lambda: self.handler.clip_slot_handler.stop_slot(
-                    params.get("track_index", 0),
-                    params.get("slot_index", 0)
-                ),
-                "create_clip_in_slot": lambda: self.handler.clip_slot_handler.create_clip(
-                    params.get("track_index", 0),
-                    params.get("slot_index", 0),
-                    params.get("length", 4.0)
-                ),
-                "delete_clip_in_slot": lambda: self.handler.clip_slot_handler.delete_clip(
-                    params.get("track_index", 0),
-                    params.get("slot_index", 0)
-                ),
-                "duplicate_clip_to_slot": lambda: self.handler.clip_slot_handler.duplicate_clip_to(
-                    params.get("src_track", 0),
-                    params.get("src_slot", 0),
-                    params.get("dest_track", 0),
-                    params.get("dest_slot", 0)
-                ),
-                "set_slot_stop_button": lambda: self.handler.clip_slot_handler.set_stop_button(
-                    params.get("track_index", 0),
-                    params.get("slot_index", 0),
-                    params.get("has_stop_button", True)
-                ),
-                "get_track_slots": lambda: self.handler.clip_slot_handler.get_track_slots(
-                    params.get("track_index", 0)
-                ),
-                "fire_scene": lambda: self.handler.clip_slot_handler.fire_scene_slots(
-                    params.get("scene_index", 0)
-                ),
-                # Mixer Operations (uses modular MixerHandler)
-                "get_master_info": lambda: self.handler.mixer_handler.get_master_info(),
-                "set_master_volume": lambda: self.handler.mixer_handler.set_master_volume(
-                    params.get("value", 0.85)
-                ),
-                "set_master_pan": lambda: self.handler.mixer_handler.set_master_pan(
-                    params.get("value", 0.0)
-                ),
-                "get_cue_volume": lambda: self.handler.mixer_handler.get_cue_volume(),
-                "set_cue_volume": lambda: self.handler.mixer_handler.set_cue_volume(
-                    params.get("value", 0.85)
-                ),
-                "get_crossfader": lambda: self.handler.mixer_handler.get_crossfader(),
-                "set_crossfader": lambda: self.handler.mixer_handler.set_crossfader(
-                    params.get("value", 0.0)
-                ),
-                "set_track_crossfade_assign": lambda: self.handler.mixer_handler.set_track_crossfade_assign(
-                    params.get("track_index", 0),
-                    params.get("assign", 0)
-                ),
-                "get_track_sends": lambda: self.handler.mixer_handler.get_track_sends(
-                    params.get("track_index", 0)
-                ),
-                "set_track_send": lambda: self.handler.mixer_handler.set_track_send(
-                    params.get("track_index", 0),
-                    params.get("send_index", 0),
-                    params.get("value", 0.0)
-                ),
-                "set_return_volume": lambda: self.handler.mixer_handler.set_return_volume(
-                    params.get("return_index", 0),
-                    params.get("value", 0.85)
-                ),
-                "set_return_pan": lambda: self.handler.mixer_handler.set_return_pan(
-                    params.get("return_index", 0),
-                    params.get("value", 0.0)
-                ),
-                "mute_return": lambda: self.handler.mixer_handler.mute_return(
-                    params.get("return_index", 0),
-                    params.get("muted", True)
-                ),
-                "solo_return": lambda: self.handler.mixer_handler.solo_return(
-                    params.get("return_index", 0),
-                    params.get("soloed", True)
-                ),
-                "get_mixer_overview": lambda: self.handler.mixer_handler.get_mixer_overview(),
-                # Scene Operations (uses modular SceneHandler)
-                "get_scene_info": lambda: self.handler.scene_handler.get_scene_info(
-                    params.get("scene_index", 0)
-                ),
-                "get_all_scenes": lambda: self.handler.scene_handler.get_all_scenes(),
-                "set_scene_name": lambda: self.handler.scene_handler.set_scene_name(
-                    params.get("scene_index", 0),
-                    params.get("name", "")
-                ),
-                "set_scene_color": lambda: self.handler.scene_handler.set_scene_color(
-                    params.get("scene_index", 0),
-                    params.get("color", 0)
-                ),
-                "set_scene_color_index": lambda: self.handler.scene_handler.set_scene_color_index(
-                    params.get("scene_index", 0),
-                    params.get("color_index", 0)
-                ),
-                "set_scene_tempo": lambda: self.handler.scene_handler.set_scene_tempo(
-                    params.get("scene_index", 0),
-                    params.get("tempo", 0)
-                ),
-                "set_scene_time_signature": lambda: self.handler.scene_handler.set_scene_time_signature(
-                    params.get("scene_index", 0),
-                    params.get("numerator", 4),
-                    params.get("denominator", 4)
-                ),
-                "fire_scene_by_index": lambda: self.handler.scene_handler.fire_scene(
-                    params.get("scene_index", 0),
-                    params.get("force_legato", False)
-                ),
-                "select_scene": lambda: self.handler.scene_handler.select_scene(
-                    params.get("scene_index", 0)
-                ),
-                "create_scene": lambda: self.handler.scene_handler.create_scene(
-                    params.get("index", -1)
-                ),
-                "delete_scene": lambda: self.handler.scene_handler.delete_scene(
-                    params.get("scene_index", 0)
-                ),
-                "duplicate_scene": lambda: self.handler.scene_handler.duplicate_scene(
-                    params.get("scene_index", 0)
-                ),
-                "move_scene": lambda: self.handler.scene_handler.move_scene(
-                    params.get("scene_index", 0),
-                    params.get("target_index", 0)
-                ),
-                "get_scene_overview": lambda: self.handler.scene_handler.get_scene_overview(),
-                # Application Operations (uses modular ApplicationHandler)
-                "get_live_version": lambda: self.handler.application_handler.get_live_version(),
-                "get_available_views": lambda: self.handler.application_handler.get_available_views(),
-                "focus_view": lambda: self.handler.application_handler.focus_view(
-                    params.get("view_name", "Session")
-                ),
-                "show_view": lambda: self.handler.application_handler.show_view(
-                    params.get("view_name", "Session")
-                ),
-                "hide_view": lambda: self.handler.application_handler.hide_view(
-                    params.get("view_name", "Browser")
-                ),
-                "is_view_visible": lambda: self.handler.application_handler.is_view_visible(
-                    params.get("view_name", "Session"),
-                    params.get("main_window_only", True)
-                ),
-                "get_focused_document_view": lambda: self.handler.application_handler.get_focused_document_view(),
-                "scroll_view": lambda: self.handler.application_handler.scroll_view(
-                    params.get("direction", 0),
-                    params.get("view_name", "Session"),
-                    params.get("animate", True)
-                ),
-                "zoom_view": lambda: self.handler.application_handler.zoom_view(
-                    params.get("direction", 1),
-                    params.get("view_name", "Session"),
-                    params.get("animate", True)
-                ),
-                "toggle_browser": lambda: self.handler.application_handler.toggle_browser(),
-                "get_browse_mode": lambda: self.handler.application_handler.get_browse_mode(),
-                "get_dialog_state": lambda: self.handler.application_handler.get_dialog_state(),
-                "press_dialog_button": lambda: self.handler.application_handler.press_dialog_button(
-                    params.get("button_index", 0)
-                ),
-                "get_application_overview": lambda: self.handler.application_handler.get_application_overview(),
-                # Clip Operations (uses modular ClipHandler)
-                "fire_clip": lambda: self.handler.clip_handler.fire_clip(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("force_legato", False)
-                ),
-                "stop_clip": lambda: self.handler.clip_handler.stop_clip(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "get_clip_details": lambda: self.handler.clip_handler.get_clip_details(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "set_clip_name": lambda: self.handler.clip_handler.set_clip_name(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("name", "")
-                ),
-                "set_clip_color": lambda: self.handler.clip_handler.set_clip_color(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("color", None),
-                    params.get("color_index", None)
-                ),
-                "set_clip_loop": lambda: self.handler.clip_handler.set_clip_loop(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("looping", None),
-                    params.get("loop_start", None),
-                    params.get("loop_end", None)
-                ),
-                "set_clip_markers": lambda: self.handler.clip_handler.set_clip_markers(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("start_marker", None),
-                    params.get("end_marker", None)
-                ),
-                "duplicate_loop": lambda: self.handler.clip_handler.duplicate_loop(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "set_clip_launch_mode": lambda: self.handler.clip_handler.set_clip_launch_mode(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("mode", 0)
-                ),
-                "set_clip_launch_quantization": lambda: self.handler.clip_handler.set_clip_launch_quantization(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("quantization", -1)
-                ),
-                "set_clip_legato": lambda: self.handler.clip_handler.set_clip_legato(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("legato", False)
-                ),
-                "set_clip_warp": lambda: self.handler.clip_handler.set_clip_warp(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("warping", None),
-                    params.get("warp_mode", None)
-                ),
-                "set_clip_pitch": lambda: self.handler.clip_handler.set_clip_pitch(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("coarse", None),
-                    params.get("fine", None)
-                ),
-                "set_clip_gain": lambda: self.handler.clip_handler.set_clip_gain(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("gain", 0.5)
-                ),
-                "quantize_clip": lambda: self.handler.clip_handler.quantize_clip(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0),
-                    params.get("grid", 5),
-                    params.get("amount", 1.0)
-                ),
-                "crop_clip": lambda: self.handler.clip_handler.crop_clip(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "clear_clip": lambda: self.handler.clip_handler.clear_clip(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "deselect_all_notes": lambda: self.handler.clip_handler.deselect_all_notes(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "select_all_notes": lambda: self.handler.clip_handler.select_all_notes(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                # Track Group Operations (uses modular TrackGroupHandler)
-                "get_group_info": lambda: self.handler.track_group_handler.get_group_info(
-                    params.get("track_index", 0)
-                ),
-                "get_all_groups": lambda: self.handler.track_group_handler.get_all_groups(),
-                "get_track_group_membership": lambda: self.handler.track_group_handler.get_track_group_membership(
-                    params.get("track_index", 0)
-                ),
-                "fold_group": lambda: self.handler.track_group_handler.fold_group(
-                    params.get("track_index", 0)
-                ),
-                "unfold_group": lambda: self.handler.track_group_handler.unfold_group(
-                    params.get("track_index", 0)
-                ),
-                "toggle_group_fold": lambda: self.handler.track_group_handler.toggle_group_fold(
-                    params.get("track_index", 0)
-                ),
-                "set_track_color": lambda: self.handler.track_group_handler.set_track_color(
-                    params.get("track_index", 0),
-                    params.get("color", None),
-                    params.get("color_index", None)
-                ),
-                "get_track_freeze_state": lambda: self.handler.track_group_handler.get_track_freeze_state(
-                    params.get("track_index", 0)
-                ),
-                "stop_track_clips": lambda: self.handler.track_group_handler.stop_track_clips(
-                    params.get("track_index", 0)
-                ),
-                "get_tracks_overview": lambda: self.handler.track_group_handler.get_tracks_overview(),
-                # Browser Operations (uses modular BrowserHandler)
-                "get_browser_tree": lambda: self.handler.browser_handler.get_browser_tree(
-                    params.get("max_depth", 2)
-                ),
-                "get_browser_category": lambda: self.handler.browser_handler.get_browser_category(
-                    params.get("category_name", "sounds"),
-                    params.get("max_items", 50)
-                ),
-                "load_item_by_uri": lambda: self.handler.browser_handler.load_item_by_uri(
-                    params.get("uri", "")
-                ),
-                "hotswap_target_enabled": lambda: self.handler.browser_handler.hotswap_target_enabled(),
-                "filter_browser": lambda: self.handler.browser_handler.filter_browser(
-                    params.get("filter_type", 0)
-                ),
-                "stop_preview": lambda: self.handler.browser_handler.stop_preview(),
-                "get_browser_state": lambda: self.handler.browser_handler.get_browser_state(),
-                # Conversion Operations (uses modular ConversionHandler)
-                "audio_to_drums": lambda: self.handler.conversion_handler.audio_to_drums(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "audio_to_harmony": lambda: self.handler.conversion_handler.audio_to_harmony(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "audio_to_melody": lambda: self.handler.conversion_handler.audio_to_melody(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "simpler_to_sampler": lambda: self.handler.conversion_handler.simpler_to_sampler(
-                    params.get("track_index", 0),
-                    params.get("device_index", None)
-                ),
-                "create_drum_rack_from_slices": lambda: self.handler.conversion_handler.create_drum_rack_from_slices(
-                    params.get("track_index", 0),
-                    params.get("device_index", None)
-                ),
-                # =============================================================
-                # PHASE 1 COMMANDS
-                # =============================================================
-                # ChainHandler
-                "get_chains": lambda: self.handler.chain_handler.get_chains(params.get("track_index", 0), params.get("device_index", 0)),
-                "get_chain": lambda: self.handler.chain_handler.get_chain(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0)),
-                "set_chain_name": lambda: self.handler.chain_handler.set_chain_name(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0), params.get("name", "")),
-                "set_chain_mute": lambda: self.handler.chain_handler.set_chain_bool(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0), "mute", params.get("mute", True)),
-                "set_chain_solo": lambda: self.handler.chain_handler.set_chain_bool(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0), "solo", params.get("solo", True)),
-                "set_chain_color": lambda: self.handler.chain_handler.set_chain_color(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0), params.get("color", None)),
-                "delete_chain_device": lambda: self.handler.chain_handler.delete_chain_device(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0), params.get("chain_device_index", 0)),
-                "get_chain_mixer": lambda: self.handler.chain_handler.get_chain_mixer(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0)),
-                "set_chain_volume": lambda: self.handler.chain_handler.set_chain_mixer_volume(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0), params.get("volume", 0.85)),
-                "set_chain_pan": lambda: self.handler.chain_handler.set_chain_mixer_pan(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0), params.get("pan", 0.0)),
-                "set_chain_send": lambda: self.handler.chain_handler.set_chain_mixer_send(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0), params.get("send_index", 0), params.get("value", 0.0)),
-                "set_drum_chain_choke_group": lambda: self.handler.chain_handler.set_drum_chain_choke_group(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0), params.get("group", 0)),
-                "set_drum_chain_out_note": lambda: self.handler.chain_handler.set_drum_chain_out_note(params.get("track_index", 0), params.get("device_index", 0), params.get("chain_index", 0), params.get("note", 60)),
-                
-                # SpecializedDeviceHandler (Extended)
-                "get_specialized_device_info": lambda: self.handler.specialized_device_handler.get_specialized_device_info(params.get("track_index", 0), params.get("device_index", 0)),
-                "toggle_device_active": lambda: self.handler.specialized_device_handler.toggle_device_active(params.get("track_index", 0), params.get("device_index", 0), params.get("active", True)),
-                "get_max_device_banks": lambda: self.handler.specialized_device_handler.get_max_device_banks(params.get("track_index", 0), params.get("device_index", 0)),
-                "get_wavetable_oscillator": lambda: self.handler.specialized_device_handler.get_wavetable_oscillator(params.get("track_index", 0), params.get("device_index", 0), params.get("osc_index", 0)),
-                "get_wavetable_modulation": lambda: self.handler.specialized_device_handler.get_wavetable_modulation(params.get("track_index", 0), params.get("device_index", 0)),
-                "get_hybrid_reverb_ir": lambda: self.handler.specialized_device_handler.get_hybrid_reverb_ir(params.get("track_index", 0), params.get("device_index", 0)),
-                
-                # =============================================================
-                # PHASE 2 COMMANDS
-                # =============================================================
-                # SongHandler (Additions)
-                "scrub_by": lambda: self.handler.song_handler.scrub_by(params.get("beats", 1.0)),
-                "set_groove_amount": lambda: self.handler.song_handler.set_groove_amount(params.get("amount", 0.5)),
-                "get_groove_amount": lambda: self.handler.song_handler.get_groove_amount(),
-                "capture_and_insert_scene": lambda: self.handler.song_handler.capture_and_insert_scene(params.get("scene_index", "selected")),
-                "get_cue_points": lambda: self.handler.song_handler.get_cue_points(),
-                
-                # ClipHandler (Additions)
-                "set_clip_audio_properties": lambda: self.handler.clip_handler.set_clip_audio_properties(
-                    params.get("track_index", 0), params.get("clip_index", 0),
-                    warp_mode=params.get("warp_mode"), warping=params.get("warping"),
-                    pitch_coarse=params.get("pitch_coarse"), pitch_fine=params.get("pitch_fine"),
-                    gain=params.get("gain")
-                ),
-                "scrub_clip": lambda: self.handler.clip_handler.scrub_clip(params.get("track_index", 0), params.get("clip_index", 0), params.get("position", 0.0)),
-                "stop_scrub": lambda: self.handler.clip_handler.stop_scrub(params.get("track_index", 0), params.get("clip_index", 0)),
-                "get_notes": lambda: self.handler.clip_handler.get_notes(
-                     params.get("track_index", 0), params.get("clip_index", 0),
-                     params.get("start_time", 0), params.get("time_span", 1000)
-                ),
-                "replace_selected_notes": lambda: self.handler.clip_handler.replace_selected_notes(
-                     params.get("track_index", 0), params.get("clip_index", 0),
-                     params.get("notes", [])
-                ),
-                # Note: get_clip_details from Phase 2 already registered? It should be.
-                
-                # Phase 5: Automation
-                "get_clip_envelope": lambda: self.handler.clip_handler.get_clip_envelope(
-                    params.get("track_index", 0), params.get("clip_index", 0),
-                    params.get("device_id", "mixer"), params.get("parameter_id", 0)
-                ),
-                "set_clip_envelope_step": lambda: self.handler.clip_handler.set_clip_envelope_step(
-                    params.get("track_index", 0), params.get("clip_index", 0),
-                    params.get("device_id", "mixer"), params.get("parameter_id", 0),
-                    params.get("time", 0.0), params.get("length", 1.0), params.get("value", 0.0)
-                ),
-                "clear_clip_envelope": lambda: self.handler.clip_handler.clear_clip_envelope(
-                    params.get("track_index", 0), params.get("clip_index", 0),
-                    params.get("device_id", "mixer"), params.get("parameter_id", 0)
-                ),
-                
-                # Phase 6: Humanization
-                "get_notes_extended": lambda: self.handler.clip_handler.get_notes_extended(
-                     params.get("track_index", 0), params.get("clip_index", 0),
-                     params.get("start_time", 0), params.get("time_span", 1000)
-                ),
-                "update_notes": lambda: self.handler.clip_handler.update_notes(
-                     params.get("track_index", 0), params.get("clip_index", 0),
-                     params.get("notes", [])
-                ),
-                
-                "set_notes": lambda: self.handler.clip_handler.set_notes(params.get("track_index", 0), params.get("clip_index", 0), params.get("notes", [])),
-                "remove_notes": lambda: self.handler.clip_handler.remove_notes(
-                     params.get("track_index", 0), params.get("clip_index", 0),
-                     params.get("start_time", 0), params.get("time_span", 1000),
-                     params.get("start_pitch", 0), params.get("pitch_span", 128)
-                ),
-                "replace_selected_notes": lambda: self.handler.clip_handler.replace_selected_notes(params.get("track_index", 0), params.get("clip_index", 0), params.get("notes", [])),
-                
-                # TrackHandler (Additions)
-                "set_track_fold_state": lambda: self.handler.track_handler.set_track_fold_state(params.get("track_index", 0), params.get("folded", True)),
-                "get_track_meters": lambda: self.handler.track_handler.get_track_meters(params.get("track_index", 0)),
-                "get_arrangement_clips": lambda: self.handler.track_handler.get_arrangement_clips(params.get("track_index", 0)),
-                "jump_in_running_session_clip": lambda: self.handler.track_handler.jump_in_running_session_clip(params.get("track_index", 0), params.get("beats", 1.0)),
-                "duplicate_clip_to_arrangement": lambda: self.handler.track_handler.duplicate_clip_to_arrangement(
-                    params.get("track_index", 0), params.get("clip_index", 0), params.get("arrangement_time", 0.0)
-                ),
-                
-                # DeviceHandler (Additions)
-                "begin_parameter_gesture": lambda: self.handler.device_handler.begin_parameter_gesture(params.get("track_index", 0), params.get("device_index", 0), params.get("parameter", 0)),
-                "end_parameter_gesture": lambda: self.handler.device_handler.end_parameter_gesture(params.get("track_index", 0), params.get("device_index", 0), params.get("parameter", 0)),
-                "str_for_value": lambda: self.handler.device_handler.str_for_value(params.get("track_index", 0), params.get("device_index", 0), params.get("parameter", 0), params.get("value", 0.0)),
-                "re_enable_automation": lambda: self.handler.device_handler.re_enable_automation(params.get("track_index", 0), params.get("device_index", 0), params.get("parameter", 0)),
-                "set_device_routing": lambda: self.handler.device_handler.set_device_routing(
-                     params.get("track_index", 0), params.get("device_index", 0),
-                     routing_type=params.get("routing_type"), routing_channel=params.get("routing_channel")
-                ),
-                
-                # Phase 7: Final Polish
-                "get_data": lambda: self.handler.song_handler.get_data(params.get("key", "")),
-                "set_data": lambda: self.handler.song_handler.set_data(params.get("key", ""), params.get("value", "")),
-                "move_device": lambda: self.handler.song_handler.move_device(
-                    params.get("track_index", 0), params.get("device_index", 0),
-                    params.get("target_track_index", 0), params.get("target_index", -1)
-                ),
-                "store_variation": lambda: self.handler.device_handler.store_variation(
-                    params.get("track_index", 0), params.get("device_index", 0), params.get("variation_index", -1)
-                ),
-                "recall_variation": lambda: self.handler.device_handler.recall_variation(
-                    params.get("track_index", 0), params.get("device_index", 0), params.get("variation_index", -1)
-                ),
-                "delete_variation": lambda: self.handler.device_handler.delete_variation(
-                    params.get("track_index", 0), params.get("device_index", 0), params.get("variation_index", -1)
-                ),
-                "randomize_macros": lambda: self.handler.device_handler.randomize_macros(
-                    params.get("track_index", 0), params.get("device_index", 0)
-                ),
-                "copy_pad": lambda: self.handler.device_handler.copy_pad(
-                    params.get("track_index", 0), params.get("device_index", 0),
-                    params.get("from_note", 0), params.get("to_note", 0)
-                ),
-                
-                
-                # =============================================================
-                # PHASE 3 COMMANDS
-                # =============================================================
-                # BrowserHandler (Updates)
-                "preview_item_by_uri": lambda: self.handler.browser_handler.preview_item_by_uri(params.get("uri", "")),
-                
-                # SampleHandler (New)
-                "get_sample_details": lambda: self.handler.sample_handler.get_sample_details(params.get("track_index", 0), params.get("clip_index", None), params.get("device_index", None)),
-                "get_slices": lambda: self.handler.sample_handler.get_slices(params.get("track_index", 0), params.get("clip_index", None), params.get("device_index", None)),
-                "insert_slice": lambda: self.handler.sample_handler.insert_slice(params.get("track_index", 0), params.get("slice_time", 0), params.get("clip_index", None), params.get("device_index", None)),
-                "remove_slice": lambda: self.handler.sample_handler.remove_slice(params.get("track_index", 0), params.get("slice_time", 0), params.get("clip_index", None), params.get("device_index", None)),
-                "clear_slices": lambda: self.handler.sample_handler.clear_slices(params.get("track_index", 0), params.get("clip_index", None), params.get("device_index", None)),
-                "reset_slices": lambda: self.handler.sample_handler.reset_slices(params.get("track_index", 0), params.get("clip_index", None), params.get("device_index", None)),
-                "set_sample_gain": lambda: self.handler.sample_handler.set_sample_gain(params.get("track_index", 0), params.get("gain", 1.0), params.get("clip_index", None), params.get("device_index", None)),
-                "get_gain_display_string": lambda: self.handler.sample_handler.get_gain_display_string(params.get("track_index", 0), params.get("clip_index", None), params.get("device_index", None)),
-                "beat_to_sample_time": lambda: self.handler.sample_handler.beat_to_sample_time(params.get("track_index", 0), params.get("beat_time", 0.0), params.get("clip_index", None), params.get("device_index", None)),
-                "sample_to_beat_time": lambda: self.handler.sample_handler.sample_to_beat_time(params.get("track_index", 0), params.get("sample_time", 0.0), params.get("clip_index", None), params.get("device_index", None)),
-
-                "create_drum_rack_from_audio_clip": lambda: self.handler.conversion_handler.create_drum_rack_from_audio_clip(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                "move_devices_to_drum_rack": lambda: self.handler.conversion_handler.move_devices_to_drum_rack(
-                    params.get("track_index", 0)
-                ),
-                "midi_to_audio": lambda: self.handler.conversion_handler.midi_to_audio(
-                    params.get("track_index", 0)
-                ),
-                "consolidate_clip": lambda: self.handler.conversion_handler.consolidate_clip(
-                    params.get("track_index", 0),
-                    params.get("clip_index", 0)
-                ),
-                # Specialized Device Operations (uses modular SpecializedDeviceHandler)
-                "set_eq8_band": lambda: self.handler.specialized_device_handler.set_eq8_band(
-                    params.get("track_index", 0),
-                    params.get("band_index", 1),
-                    enabled=params.get("enabled", None),
-                    freq=params.get("freq", None),
-                    gain=params.get("gain", None),
-                    q=params.get("q", None),
-                    filter_type=params.get("filter_type", None),
-                    device_index=params.get("device_index", None)
-                ),
-                "set_compressor_sidechain": lambda: self.handler.specialized_device_handler.set_compressor_sidechain(
-                    params.get("track_index", 0),
-                    enabled=params.get("enabled", None),
-                    source_track_index=params.get("source_track_index", None),
-                    gain=params.get("gain", None),
-                    mix=params.get("mix", None),
-                    device_index=params.get("device_index", None)
-                )
-            }
-
-            if command_type == "get_session_info":
-                response["result"] = self.handler._get_session_info()
-            elif command_type == "get_track_info":
-                track_index = params.get("track_index", 0)
-                response["result"] = self.handler.track_handler.get_track_info(track_index)
-            elif command_type == "list_clips":
-                track_pattern = params.get("track_pattern", None)
-                match_mode = params.get("match_mode", "contains")
-                response["result"] = self.handler.track_handler.list_clips(track_pattern, match_mode)
-            elif command_type in main_thread_commands:
-                # Use a thread-safe approach with a response queue
-                response_queue = queue.Queue()
-
-                def main_thread_task():
-                    try:
-                        result = main_thread_commands[command_type]()
-                        response_queue.put({"status": "success", "result": result})
-                    except Exception as e:
-                        # Log to handler's logger if possible
-                        if hasattr(self.handler, "log_message"):
-                            self.handler.log_message("Error in main thread task: " + str(e))
-                            self.handler.log_message(traceback.format_exc())
-                        response_queue.put({"status": "error", "message": str(e)})
-
-                # Schedule the task on the main thread
-                # This logic was previously in _process_command
-                try:
-                    self.handler.schedule_message(0, main_thread_task)
-                except AssertionError:
-                    main_thread_task()
+            command_type = command.get("type", "")
+            params = command.get("params", {})
+            fn = None
+            if isinstance(command_type, str):
+                command_type = sys.intern(command_type)
+                fn = self._lookup(command_type)
+            elif type(command_type) is int and 0 <= command_type < len(self._dispatch_arr):
+                fn = self._dispatch_arr[command_type]
+                command_type = self._opcode_names[command_type]
+            if fn is not None:
+                return {"status": "success", "result": fn(params)}
+            if command_type == "batch":
+                return {"status": "error", "message": "Nested batch commands are not supported"}
+            return self._dispatch_direct(command_type, params)
+        except Exception as e:
+            self._log_error("Error in batched command: ", e)
+            return {"status": "error", "message": str(e)}
 
-                # Wait for response
-                try:
-                    task_response = response_queue.get(timeout=10.0)
-                    if task_response.get("status") == "error":
-                        response["status"] = "error"
-                        response["message"] = task_response.get("message", "Unknown error")
-                    else:
-                        response["result"] = task_response.get("result", {})
-                except queue.Empty:
-                    response["status"] = "error"
-                    response["message"] = "Timeout waiting for operation to complete"
-                    
-            elif command_type == "get_browser_item":
-                uri = params.get("uri", None)
-                path = params.get("path", None)
-                response["result"] = self.handler._get_browser_item(uri, path)
-            elif command_type == "get_browser_categories":
-                # These were not in the big dict in __init__.py? 
-                # Wait, I copied the original _process_command logic.
-                # get_browser_categories and get_browser_items were in the original _process_command logic?
-                # Ah, the original file I read in the view_file (earlier in conversation) had:
-                # elif command_type == "get_browser_item": ...
-                # elif command_type == "get_browser_categories": ...
-                # elif command_type == "get_browser_items": ...
-                # I should just delegate these if they exist on the handler
-                
-                # Double checking the original file content view...
-                # Yes, they were present.
-                if hasattr(self.handler, "_get_browser_categories"):
-                    response["result"] = self.handler._get_browser_categories(params.get("category_type", "all"))
-                else:
-                     response["status"] = "error"; response["message"] = "Command not implemented"
-                     
-            elif command_type == "get_browser_items":
-                if hasattr(self.handler, "_get_browser_items"):
-                    response["result"] = self.handler._get_browser_items(params.get("path", ""), params.get("item_type", "all"))
-                else:
-                    response["status"] = "error"; response["message"] = "Command not implemented"
-                    
-            elif command_type == "get_browser_tree":
-                response["result"] = self.handler.get_browser_tree(params.get("category_type", "all"))
-            elif command_type == "get_browser_items_at_path":
-                response["result"] = self.handler.get_browser_items_at_path(params.get("path", ""))
-            else:
-                response["status"] = "error"
-                response["message"] = "Unknown command: " + command_type
-                
+    def _run_cached(self, command_type, run, fn, params):
+        """Serve a read-only table command from the TTL cache if possible"""
+        try:
+            key = (command_type, tuple(sorted(params.items())))
+            hash(key)
+        except (AttributeError, TypeError):
+            # Non-dict params or unhashable values (lists) are not cached
+            return run(fn, params)
+
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[0] < _CACHE_TTL:
+                self._cache.move_to_end(key)
+                return entry[1]
+
+        response = run(fn, params)
+        if response.get("status") == "success":
+            with self._cache_lock:
+                self._cache[key] = (now, response)
+                self._cache.move_to_end(key)
+                while len(self._cache) > _CACHE_MAXSIZE:
+                    self._cache.popitem(last=False)
+        return response
+
+    def _run_in_background(self, fn, params):
+        """Run a read-only table entry directly on the calling socket thread"""
+        try:
+            return {"status": "success", "result": fn(params)}
         except Exception as e:
-            if hasattr(self.handler, "log_message"):
-                self.handler.log_message("Error processing command: " + str(e))
-                self.handler.log_message(traceback.format_exc())
-            response["status"] = "error"
-            response["message"] = str(e)
-            
+            self._log_error("Error processing command: ", e)
+            return {"status": "error", "message": str(e)}
+
+    def _run_from_snapshot(self, command_type, fn, params):
+        """Answer a polled read from its last main-thread response"""
+        try:
+            key = (command_type, tuple(sorted(params.items())))
+            hash(key)
+        except (AttributeError, TypeError):
+            return self._run_on_main_thread(fn, params)
+
+        response = self._snapshots.get(key)
+        if response is None:
+            response = self._run_on_main_thread(fn, params)
+            if response.get("status") == "success":
+                self._snapshots[key] = response
+            return response
+
+        if key not in self._snapshot_refreshing:
+            self._snapshot_refreshing.add(key)
+
+            def refresh():
+                # Runs on Live's main thread
+                self._snapshot_refreshing.discard(key)
+                try:
+                    self._snapshots[key] = {"status": "success", "result": fn(params)}
+                except Exception as e:
+                    # e.g. the track is gone; the next poll reads afresh
+                    self._snapshots.pop(key, None)
+                    self._log_error("Error in main thread task: ", e)
+
+            try:
+                self.handler.schedule_message(0, refresh)
+            except AssertionError:
+                refresh()
         return response
+
+    def _run_on_main_thread(self, fn, params):
+        """Queue a table entry for Live's main thread and wait for its response"""
+        if len(self._pending) >= _PENDING_MAXSIZE:
+            return {"status": "error", "message": "Too many pending commands"}
+
+        # The shared pending deque only needs append/popleft, which are
+        # atomic in CPython. Each call gets its own box and Event, so a reply
+        # that arrives after a timeout lands where nobody is waiting.
+        box = [None]
+        done = threading.Event()
+        self._pending.append((fn, params, box, done))
+
+        # Wake the main thread; a drain handles every command queued so far,
+        # so bursts from several clients run in a single tick
+        try:
+            self.handler.schedule_message(0, self._drain_pending)
+        except AssertionError:
+            self._drain_pending()
+
+        # Wait for response; the drain already built the response dict
+        if not done.wait(10.0):
+            return {"status": "error", "message": "Timeout waiting for operation to complete"}
+        return box[0]
+
+    def _drain_pending(self):
+        """Run every queued table command. Called on Live's main thread."""
+        pending = self._pending
+        while pending:
+            try:
+                fn, params, box, done = pending.popleft()
+            except IndexError:
+                break
+            try:
+                response = {"status": "success", "result": fn(params)}
+            except Exception as e:
+                self._log_error("Error in main thread task: ", e)
+                response = {"status": "error", "message": str(e)}
+            box[0] = response
+            done.set()
+
+    def _log_error(self, prefix, e):
+        """Log a failed command to the handler's logger, if any"""
+        if hasattr(self.handler, "log_message"):
+            if not _DEBUG:
+                self.handler.log_message(prefix + str(e))
+                return
+            # Only needed on the failure path, so imported here
+            import traceback
+            self.handler.log_message(prefix + str(e) + "\n" + traceback.format_exc())
+
+    def _dispatch_direct(self, command_type, params):
+        """Answer dispatcher meta-commands and commands outside the table"""
+        if command_type == "get_dispatch_stats":
+            if self._stats is None:
+                return {"status": "error", "message": "Dispatch stats are disabled; set ABLETON_MCP_DISPATCH_STATS=1"}
+            return {"status": "success", "result": {"counts": [
+                {"command": str(name), "count": count} for name, count in self._stats.most_common(params.get("limit", 20))
+            ]}}
+        elif command_type == "get_command_opcodes":
+            # Opcodes are only stable for this load of the script; clients
+            # fetch them again on every connect
+            return {"status": "success", "result": {"opcodes": dict(self._opcodes), "note_packing": NOTE_PACKING}}
+        elif command_type == "get_browser_categories":
+            if self._browser_categories is not None:
+                return {"status": "success", "result": self._browser_categories(params.get("category_type", "all"))}
+            return {"status": "error", "message": "Command not implemented"}
+        elif command_type == "get_browser_items":
+            if self._browser_items is not None:
+                return {"status": "success", "result": self._browser_items(params.get("path", ""), params.get("item_type", "all"))}
+            return {"status": "error", "message": "Command not implemented"}
+        else:
+            return {"status": "error", "message": "Unknown command: " + str(command_type)}
@@ -1,17 +1,61 @@
 # mcp_socket.py
 from __future__ import absolute_import, print_function, unicode_literals
+import concurrent.futures
 import socket
 import json
+import struct
 import threading
 import time
-import traceback
 import os
 
-# Change queue import for Python 2
+# Use orjson for decoding when it is importable; its decode errors subclass
+# ValueError, so the incomplete-JSON handling below works with either
 try:
-    import Queue as queue  # Python 2
+    import orjson
+    _loads = orjson.loads
 except ImportError:
-    import queue  # Python 3
+    _loads = json.loads
+
+# Splits pipelined messages; orjson has no incremental decode
+_decoder = json.JSONDecoder()
+
+# Length-prefixed framing: each message is a 4-byte big-endian payload
+# length followed by that many bytes of UTF-8 JSON. A client picks it by
+# its first byte; legacy clients start with '{' or '[' and get bare JSON.
+_FRAME_HEADER = struct.Struct(">I")
+FRAMING = "u32be"
+
+# Largest frame payload accepted. A client that isn't really speaking the
+# framed protocol (a stray probe, a misframed write) would otherwise have
+# its first bytes read as a length of up to 4 GiB and be buffered until
+# it stopped sending.
+_MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+# Per-connection read chunk; large enough that a batch of clip notes
+# arrives in a few reads rather than dozens
+_RECV_SIZE = 65536
+
+# Encoded envelopes for the dispatcher's fixed error replies, which tend to
+# arrive in bursts when Live's main thread stalls
+_STATIC_ERRORS = dict(
+    (message, json.dumps({"status": "error", "message": message}).encode('utf-8'))
+    for message in (
+        "Timeout waiting for operation to complete",
+        "Too many pending commands",
+    )
+)
+
+# Reply to a decoded message that is not a JSON object or array
+_INVALID_COMMAND = {"status": "error", "message": "Command must be a JSON object"}
+
+# Each connected client holds one worker for as long as it stays connected;
+# connections beyond this are refused with an error greeting rather than
+# queued behind clients that may never disconnect
+_MAX_CLIENTS = 8
+_BUSY_GREETING = json.dumps({"status": "error", "message": "Too many clients connected"}).encode('utf-8')
+
+# Linux only
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
 
 class AbletonMCPServer(object):
     """
@@ -27,7 +71,11 @@ class AbletonMCPServer(object):
         self.socket = None
         self.server_thread_obj = None
         self.running = False
-        self.client_threads = []
+        self._pool = None
+        # Sockets of connected clients, so stop() can unblock their reads
+        self._clients = set()
+        # One slot per pool worker; taken at accept, freed when the handler ends
+        self._slots = threading.BoundedSemaphore(_MAX_CLIENTS)
 
     def start(self):
         """Start the socket server in a separate thread"""
@@ -38,6 +86,8 @@ class AbletonMCPServer(object):
             self.socket.listen(5)
             
             self.running = True
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_MAX_CLIENTS, thread_name_prefix="mcp-client")
             self.server_thread_obj = threading.Thread(target=self._server_loop)
             self.server_thread_obj.daemon = True
             self.server_thread_obj.start()
@@ -63,10 +113,16 @@ class AbletonMCPServer(object):
             # Wait briefly
             self.server_thread_obj.join(1.0)
             
-        # Clean up client threads
-        for t in self.client_threads[:]:
-            if t.is_alive():
-                self.log_message("Client thread still alive during stop")
+        # Pool workers are joined at interpreter exit, so wake any handler
+        # blocked in recv() rather than leave it waiting on an idle client
+        for client in list(self._clients):
+            try:
+                client.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._pool:
+            self._pool.shutdown(wait=False)
+            self._pool = None
         
         self.log_message("Server stopped")
 
@@ -81,12 +137,33 @@ class AbletonMCPServer(object):
                     client, address = self.socket.accept()
                     self.log_message("Connection accepted from " + str(address))
                     
-                    t = threading.Thread(target=self._handle_client, args=(client,))
-                    t.daemon = True
-                    t.start()
+                    # Requests and responses are small and strictly
+                    # alternate, so don't let Nagle hold them back
+                    try:
+                        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    except (OSError, AttributeError):
+                        pass
+                    
+                    # Accepted sockets inherit the listener's accept timeout
+                    client.settimeout(None)
+                    
+                    # Every worker is held by a connected client; a queued
+                    # client would get no greeting and hang until it timed out
+                    if not self._slots.acquire(False):
+                        self.log_message("Refusing connection from " + str(address) + ": too many clients")
+                        try:
+                            client.sendall(_BUSY_GREETING)
+                        except OSError:
+                            pass
+                        client.close()
+                        continue
                     
-                    self.client_threads.append(t)
-                    self.client_threads = [x for x in self.client_threads if x.is_alive()]
+                    try:
+                        self._pool.submit(self._handle_client, client)
+                    except RuntimeError:
+                        # Pool already shut down by stop()
+                        self._slots.release()
+                        client.close()
                     
                 except socket.timeout:
                     continue
@@ -97,81 +174,161 @@ class AbletonMCPServer(object):
         except Exception as e:
             self.log_message("Server thread crashed: " + str(e))
 
+    def _process_commands(self, commands):
+        """Process decoded messages and return their responses in order"""
+        for i, command in enumerate(commands):
+            # A top-level array is a batch of commands run in one main-thread
+            # round trip
+            if isinstance(command, list):
+                commands[i] = {"type": "batch", "params": {"commands": command}}
+        
+        # Anything else that isn't an object (a bare string or number) gets
+        # an error in its place; the rest of the read is still answered
+        valid = [c for c in commands if isinstance(c, dict)]
+        responses = self._process_valid(valid) if valid else []
+        if len(valid) == len(commands):
+            return responses
+        results = iter(responses)
+        return [next(results) if isinstance(c, dict) else dict(_INVALID_COMMAND) for c in commands]
+    
+    def _process_valid(self, commands):
+        """Process command objects and return their responses in order"""
+        if len(commands) == 1 or any(c.get("type") == "batch" for c in commands):
+            responses = []
+            for command in commands:
+                self.log_message("Received command: " + str(command.get("type", "unknown")))
+                responses.append(self.process_command(command))
+            return responses
+        
+        # Messages that arrived together share one main-thread round trip;
+        # the batch result is split back into one response per message
+        self.log_message("Received {0} pipelined commands".format(len(commands)))
+        response = self.process_command({"type": "batch", "params": {"commands": commands}})
+        if response.get("status") != "success":
+            return [response] * len(commands)
+        return response["result"]
+
+    def _send_response(self, client, response, framed=False):
+        """Serialize and send one response"""
+        payload = None
+        if response.get("status") == "error":
+            payload = _STATIC_ERRORS.get(response.get("message"))
+        if payload is None:
+            payload = json.dumps(response).encode('utf-8')
+        if framed:
+            payload = _FRAME_HEADER.pack(len(payload)) + payload
+        if _TCP_QUICKACK is not None:
+            # Linux clears quick-ack after each delayed ACK; re-arm it so the
+            # client's next request is acknowledged immediately
+            try:
+                client.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+            except OSError:
+                pass
+        client.sendall(payload)
+
+    def _read_frames(self, buffer):
+        """
+        Consume complete length-prefixed frames from the bytearray buffer.
+        
+        Each frame is removed before it is decoded, so a malformed payload
+        raises without being retried on the next read. A length over
+        _MAX_FRAME_SIZE raises IOError, which closes the connection.
+        """
+        commands = []
+        header_size = _FRAME_HEADER.size
+        while len(buffer) >= header_size:
+            (length,) = _FRAME_HEADER.unpack_from(buffer)
+            if length > _MAX_FRAME_SIZE:
+                raise IOError("Frame of {0} bytes exceeds the {1} byte limit".format(length, _MAX_FRAME_SIZE))
+            end = header_size + length
+            if len(buffer) < end:
+                break
+            # Slicing copies, so the payload survives the del; both JSON
+            # decoders accept a bytearray
+            payload = buffer[header_size:end]
+            del buffer[:end]
+            commands.append(_loads(payload))
+        return commands
+
+    def _read_legacy(self, buffer):
+        """Consume complete bare JSON messages from the bytearray buffer"""
+        commands = []
+        while buffer:
+            try:
+                commands.append(_loads(buffer))
+                del buffer[:]
+            except ValueError:
+                # Concatenated messages, or an incomplete one (possibly
+                # ending mid UTF-8 sequence)
+                try:
+                    text = buffer.decode('utf-8').lstrip()
+                    command, end = _decoder.raw_decode(text)
+                except ValueError:
+                    break
+                commands.append(command)
+                buffer[:] = text[end:].lstrip().encode('utf-8')
+        return commands
+
     def _handle_client(self, client):
         """Handle individual client connection"""
-        client.settimeout(None)
+        self._clients.add(client)
         
-        # Send greeting for handshake
+        # Send greeting for handshake; it is always bare JSON since the
+        # client has not said which framing it speaks yet
         try:
-            greeting = json.dumps({"status": "connected", "message": "AbletonMCP Ready"})
-            try:
-                client.sendall(greeting.encode('utf-8'))
-            except AttributeError:
-                client.sendall(greeting)
+            greeting = json.dumps({"status": "connected", "message": "AbletonMCP Ready", "framing": FRAMING})
+            client.sendall(greeting.encode('utf-8'))
         except Exception as e:
             self.log_message("Error sending greeting: " + str(e))
             
-        buffer = ''
+        # Reads land in a reused chunk and are appended to the accumulator
+        # as bytes; nothing is decoded until a whole message is present
+        buffer = bytearray()
+        chunk = bytearray(_RECV_SIZE)
+        view = memoryview(chunk)
+        framed = None  # decided by the first byte the client sends
         
         try:
             while self.running:
                 try:
-                    data = client.recv(8192)
-                    if not data:
+                    n = client.recv_into(view)
+                    if not n:
                         break
+                    buffer += view[:n]
                     
-                    # Buffer logic
-                    try:
-                        buffer += data.decode('utf-8')
-                    except AttributeError:
-                        buffer += data
+                    if framed is None:
+                        start = len(buffer) - len(buffer.lstrip())
+                        if start == len(buffer):
+                            continue
+                        framed = buffer[start:start + 1] not in (b'{', b'[')
+                        if not framed:
+                            del buffer[:start]
                     
-                    # Parse JSON
-                    try:
-                        while buffer: # Process all complete JSON objects in buffer if multiple?
-                            # Simple JSON parser that relies on finding a valid object
-                            # Actually, standard json.loads parses the whole string. 
-                            # If we have partial data, it fails.
-                            # We might have multiple concatenated JSONs or partial.
-                            # The original code just did `json.loads(buffer)` and if successful cleared buffer.
-                            # This implies the client sends one command at a time and we wait for it.
-                            # But if we receive partial, we wait.
-                            
-                            # However, if we receive "}{", json.loads fails.
-                            # The original code:
-                            # command = json.loads(buffer)
-                            # buffer = ''
-                            # This assumes one command per buffer accumulation cycle until valid.
-                            
-                            command = json.loads(buffer)
-                            buffer = '' # Clear buffer
-                            
-                            self.log_message("Received command: " + str(command.get("type", "unknown")))
-                            
-                            # CALLBACK
-                            response = self.process_command(command)
-                            
-                            # Send response
-                            resp_str = json.dumps(response)
-                            try:
-                                client.sendall(resp_str.encode('utf-8'))
-                            except AttributeError:
-                                client.sendall(resp_str)
-                                
-                    except ValueError:
-                        # Incomplete JSON, continue waiting for data
+                    # A read can hold part of a message or several; the
+                    # remainder stays buffered for the next read
+                    if framed:
+                        commands = self._read_frames(buffer)
+                    else:
+                        commands = self._read_legacy(buffer)
+                    
+                    if not commands:
                         continue
+                    
+                    # Commands sent with "ack": false get no reply; the
+                    # client has moved on without reading one
+                    responses = self._process_commands(commands)
+                    for command, response in zip(commands, responses):
+                        if not isinstance(command, dict) or command.get("ack") is not False:
+                            self._send_response(client, response, framed)
+                        elif response.get("status") == "error":
+                            self.log_message("Unacknowledged command failed: " + str(response.get("message")))
                         
                 except Exception as e:
                     self.log_message("Error handling client data: " + str(e))
                     # Try sending error
                     err = {"status": "error", "message": str(e)}
                     try:
-                        s = json.dumps(err)
-                        try:
-                             client.sendall(s.encode('utf-8'))
-                        except AttributeError:
-                             client.sendall(s)
+                        self._send_response(client, err, bool(framed))
                     except:
                         break
                     if not isinstance(e, ValueError):
@@ -179,6 +336,8 @@ class AbletonMCPServer(object):
         except Exception as e:
             self.log_message("Client handler error: " + str(e))
         finally:
+            self._clients.discard(client)
+            self._slots.release()
             try:
                 client.close()
             except: pass
@@ -0,0 +1,25 @@
+# protocol.py
+"""
+Wire-format constants shared by the dispatcher and the handlers.
+
+Kept free of Live and handler imports so either side can use it without
+importing the other.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+import base64
+import struct
+
+# struct layout of one note in a base64 "notes_packed" payload: pitch,
+# start_time, duration, velocity, mute. Advertised with the opcodes so
+# clients only pack notes for a script that can unpack them.
+NOTE_PACKING = "<BddBB"
+
+_NOTE_RECORD = struct.Struct(NOTE_PACKING)
+
+
+def unpack_notes(packed):
+    """Decode a base64 notes_packed payload into note dicts."""
+    return [
+        {"pitch": pitch, "start_time": start_time, "duration": duration, "velocity": velocity, "mute": bool(mute)}
+        for pitch, start_time, duration, velocity, mute in _NOTE_RECORD.iter_unpack(base64.b64decode(packed))
+    ]
@@ -9,20 +9,14 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parent))
 
 from mcp_tooling.connection import get_ableton_connection
-from mcp_tooling.drummer import generate_drum_pattern, search_patterns
+from mcp_tooling.drummer import get_pattern, pattern_to_notes, search_patterns
 from mcp_tooling.devices import search_and_load_device
 
 def add_rock_drums():
     conn = get_ableton_connection()
     
-    # 1. Find existing track count using get_track_info fallback
-    track_count = 0
-    for i in range(100):
-        try:
-            conn.send_command("get_track_info", {"track_index": i})
-            track_count = i + 1
-        except:
-            break
+    # 1. Find existing track count
+    track_count = conn.send_command("get_session_info").get("track_count", 0)
     
     print(f"Found {track_count} existing tracks.")
     
@@ -34,7 +28,7 @@ def add_rock_drums():
     print(f"Created track at index {new_track_idx}")
     
     # 3. Name it
-    conn.send_command("set_track_name", {"track_index": new_track_idx, "name": "Rock Drums"})
+    conn.send_command("set_track_name", {"track_index": new_track_idx, "name": "Rock Drums"}, ack=False)
     print("Named track 'Rock Drums'")
     
     # 4. Load 606 Core Kit
@@ -48,32 +42,39 @@ def add_rock_drums():
     
     print(f"Found {len(rock_patterns)} rock/break patterns")
     
-    # 6. Populate 8 scenes with rock patterns
+    # 6. Populate 8 scenes with rock patterns in a single batched round-trip
+    commands = []
+    scenes = []
     for i in range(8):
         pattern = rock_patterns[i % len(rock_patterns)] if rock_patterns else None
-        
-        if pattern:
-            try:
-                res = generate_drum_pattern(
-                    track_index=new_track_idx,
-                    clip_index=i,
-                    genre=pattern.get("genre", "breakbeat"),
-                    pattern_name=pattern.get("name"),
-                    bars=4,
-                    humanize=0.05,
-                    clear_existing=True
-                )
-                # Label the clip
-                conn.send_command("set_clip_name", {
-                    "track_index": new_track_idx,
-                    "clip_index": i,
-                    "name": pattern.get("name", f"Rock {i+1}")
-                })
-                print(f"  Scene {i+1}: {pattern.get('name')}")
-            except Exception as e:
-                print(f"  Scene {i+1} failed: {e}")
-        else:
+        entry = get_pattern(pattern.get("genre", "breakbeat"), pattern.get("name")) if pattern else None
+        if not entry:
             print(f"  Scene {i+1}: No pattern available")
+            continue
+        
+        notes, clip_length = pattern_to_notes(entry.get("pattern", {}), bars=4, humanize=0.05)
+        slot = {"track_index": new_track_idx, "clip_index": i}
+        commands += [
+            {"type": "delete_clip", "params": slot},
+            {"type": "create_clip", "params": dict(slot, length=clip_length)},
+            {"type": "add_notes_to_clip", "params": dict(slot, notes=notes)},
+            # Label the clip
+            {"type": "set_clip_name", "params": dict(slot, name=pattern.get("name", f"Rock {i+1}"))},
+        ]
+        scenes.append((i, pattern.get("name")))
+    
+    if commands:
+        try:
+            results = conn.send_batch(commands)
+            for n, (i, name) in enumerate(scenes):
+                # The delete_clip response is ignored; the slot may be empty
+                errors = [r.get("message") for r in results[n * 4 + 1:n * 4 + 4] if r.get("status") == "error"]
+                if errors:
+                    print(f"  Scene {i+1} failed: {errors[0]}")
+                else:
+                    print(f"  Scene {i+1}: {name}")
+        except Exception as e:
+            print(f"  Scene population failed: {e}")
     
     print(f"\n🥁 Rock Drums track created at index {new_track_idx}!")
     print("Fire scenes 1-8 to hear the energetic beats!")
@@ -4,6 +4,8 @@ Anamanaguchi-Style Drums - Driving Punk Rock Patterns
 Overwrites clips on the Rock Drums track with driving, straight-ahead beats.
 No syncopation - pure energy!
 """
+import functools
+import operator
 import sys
 from pathlib import Path
 
@@ -18,6 +20,12 @@ CLOSED_HH = 42
 OPEN_HH = 46
 CRASH = 49
 
+_START_TIME = operator.itemgetter("start_time")
+
+# In-bar hit offsets (beats)
+EIGHTHS = tuple(step * 0.5 for step in range(8))
+SIXTEENTHS = tuple(step * 0.25 for step in range(16))
+
 def create_anamanaguchi_patterns():
     conn = get_ableton_connection()
     
@@ -25,217 +33,161 @@ def create_anamanaguchi_patterns():
     track_idx = 4
     print(f"Updating Rock Drums track (index {track_idx}) with Anamanaguchi patterns...")
     
-    # Define 8 driving punk patterns
-    patterns = [
-        # Pattern 1: Classic punk (kick-snare-kick-snare, 8th hats)
-        {
-            "name": "Punk Drive",
-            "notes": _punk_drive(bars=4)
-        },
-        # Pattern 2: Double-time punk
-        {
-            "name": "Punk Fast",
-            "notes": _punk_fast(bars=4)
-        },
-        # Pattern 3: Driving 4-on-floor with snare 2+4
-        {
-            "name": "Chiptune Drive",
-            "notes": _chiptune_drive(bars=4)
-        },
-        # Pattern 4: Punk with crash accents
-        {
-            "name": "Crash Punk",
-            "notes": _crash_punk(bars=4)
-        },
-        # Pattern 5: 16th note hi-hats (energy!)
-        {
-            "name": "16th Energy",
-            "notes": _sixteenth_energy(bars=4)
-        },
-        # Pattern 6: Half-time feel
-        {
-            "name": "Half-Time",
-            "notes": _half_time(bars=4)
-        },
-        # Pattern 7: Punk with open hi-hat accents
-        {
-            "name": "Open Hat Punk",
-            "notes": _open_hat_punk(bars=4)
-        },
-        # Pattern 8: Fill/Build pattern
-        {
-            "name": "Build Up",
-            "notes": _build_up(bars=4)
-        },
+    # The 8 driving punk patterns, built once at import
+    patterns = _PRECOMPUTED_BARS_4
+    
+    # Replace every scene's clip in one main-thread task
+    clips = [
+        {"clip_index": i, "length": 16.0, "name": name, "notes": list(notes)}  # 4 bars
+        for i, (name, notes) in enumerate(patterns)
     ]
     
-    for i, pattern in enumerate(patterns):
-        try:
-            # Delete existing clip
-            try:
-                conn.send_command("delete_clip", {"track_index": track_idx, "clip_index": i})
-            except:
-                pass
-            
-            # Create new clip
-            conn.send_command("create_clip", {
-                "track_index": track_idx,
-                "clip_index": i,
-                "length": 16.0  # 4 bars
-            })
-            
-            # Add notes
-            conn.send_command("add_notes_to_clip", {
-                "track_index": track_idx,
-                "clip_index": i,
-                "notes": pattern["notes"]
-            })
-            
-            # Label it
-            conn.send_command("set_clip_name", {
-                "track_index": track_idx,
-                "clip_index": i,
-                "name": pattern["name"]
-            })
-            
-            print(f"  Scene {i+1}: {pattern['name']} ({len(pattern['notes'])} notes)")
-        except Exception as e:
-            print(f"  Scene {i+1} failed: {e}")
+    try:
+        conn.bulk_create_clips(track_idx, clips)
+    except Exception as e:
+        print(f"  Creating clips failed: {e}")
+        return
+    
+    for i, (name, notes) in enumerate(patterns):
+        print(f"  Scene {i+1}: {name} ({len(notes)} notes)")
     
     print("\n🥁 Anamanaguchi patterns loaded! Pure driving energy!")
 
+# The pattern builders below are memoized per bar count and return time-ordered
+# tuples of note dicts shared between callers; copy before modifying any note
+
+def _notes(pitch, starts, duration, velocity):
+    """Expand one drum voice into note dicts; velocity is an int or a per-hit sequence"""
+    if isinstance(velocity, int):
+        return [{"pitch": pitch, "start_time": float(t), "duration": duration, "velocity": velocity}
+                for t in starts]
+    return [{"pitch": pitch, "start_time": float(t), "duration": duration, "velocity": v}
+            for t, v in zip(starts, velocity)]
+
+def _by_time(notes):
+    """Freeze notes in start-time order (voice order kept for ties), as Live stores them"""
+    return tuple(sorted(notes, key=_START_TIME))
+
+def _grid(bars, offsets):
+    """Start times of the given in-bar offsets repeated over every bar"""
+    return [bar * 4.0 + o for bar in range(bars) for o in offsets]
+
+@functools.lru_cache(maxsize=None)
 def _punk_drive(bars=4):
     """Classic punk: kick on 1+3, snare on 2+4, 8th note hats"""
-    notes = []
-    for bar in range(bars):
-        base = bar * 4.0
+    return _by_time(
         # Kick on 1 and 3
-        notes.append({"pitch": KICK, "start_time": base + 0, "duration": 0.25, "velocity": 110})
-        notes.append({"pitch": KICK, "start_time": base + 2, "duration": 0.25, "velocity": 105})
+        _notes(KICK, _grid(bars, (0, 2)), 0.25, (110, 105) * bars)
         # Snare on 2 and 4
-        notes.append({"pitch": SNARE, "start_time": base + 1, "duration": 0.25, "velocity": 115})
-        notes.append({"pitch": SNARE, "start_time": base + 3, "duration": 0.25, "velocity": 115})
+        + _notes(SNARE, _grid(bars, (1, 3)), 0.25, 115)
         # 8th note hi-hats
-        for beat in range(8):
-            vel = 90 if beat % 2 == 0 else 75
-            notes.append({"pitch": CLOSED_HH, "start_time": base + beat * 0.5, "duration": 0.2, "velocity": vel})
-    return notes
+        + _notes(CLOSED_HH, _grid(bars, EIGHTHS), 0.2, (90, 75) * (4 * bars))
+    )
 
+@functools.lru_cache(maxsize=None)
 def _punk_fast(bars=4):
     """Double-time punk: kick every beat, snare on 2+4"""
-    notes = []
-    for bar in range(bars):
-        base = bar * 4.0
+    return _by_time(
         # Kick every beat
-        for beat in range(4):
-            notes.append({"pitch": KICK, "start_time": base + beat, "duration": 0.25, "velocity": 105})
+        _notes(KICK, _grid(bars, range(4)), 0.25, 105)
         # Snare on 2 and 4
-        notes.append({"pitch": SNARE, "start_time": base + 1, "duration": 0.25, "velocity": 120})
-        notes.append({"pitch": SNARE, "start_time": base + 3, "duration": 0.25, "velocity": 120})
+        + _notes(SNARE, _grid(bars, (1, 3)), 0.25, 120)
         # 8th note hi-hats
-        for beat in range(8):
-            notes.append({"pitch": CLOSED_HH, "start_time": base + beat * 0.5, "duration": 0.2, "velocity": 85})
-    return notes
+        + _notes(CLOSED_HH, _grid(bars, EIGHTHS), 0.2, 85)
+    )
 
+@functools.lru_cache(maxsize=None)
 def _chiptune_drive(bars=4):
     """4-on-floor with snare backbeat"""
-    notes = []
-    for bar in range(bars):
-        base = bar * 4.0
+    return _by_time(
         # Kick on every beat (4-on-floor)
-        for beat in range(4):
-            notes.append({"pitch": KICK, "start_time": base + beat, "duration": 0.25, "velocity": 110})
+        _notes(KICK, _grid(bars, range(4)), 0.25, 110)
         # Snare on 2 and 4
-        notes.append({"pitch": SNARE, "start_time": base + 1, "duration": 0.25, "velocity": 115})
-        notes.append({"pitch": SNARE, "start_time": base + 3, "duration": 0.25, "velocity": 115})
+        + _notes(SNARE, _grid(bars, (1, 3)), 0.25, 115)
         # Offbeat hi-hats (classic house/dance feel)
-        for beat in range(4):
-            notes.append({"pitch": CLOSED_HH, "start_time": base + beat + 0.5, "duration": 0.2, "velocity": 95})
-    return notes
+        + _notes(CLOSED_HH, _grid(bars, (0.5, 1.5, 2.5, 3.5)), 0.2, 95)
+    )
 
+@functools.lru_cache(maxsize=None)
 def _crash_punk(bars=4):
     """Punk with crash on bar 1"""
-    notes = _punk_drive(bars)
     # Add crash on beat 1 of each bar
-    for bar in range(bars):
-        notes.append({"pitch": CRASH, "start_time": bar * 4.0, "duration": 1.0, "velocity": 100})
-    return notes
+    return _by_time(_punk_drive(bars) + tuple(_notes(CRASH, _grid(bars, (0,)), 1.0, 100)))
 
+@functools.lru_cache(maxsize=None)
 def _sixteenth_energy(bars=4):
     """16th note hi-hats for maximum energy"""
-    notes = []
-    for bar in range(bars):
-        base = bar * 4.0
+    return _by_time(
         # Kick on 1 and 3
-        notes.append({"pitch": KICK, "start_time": base + 0, "duration": 0.25, "velocity": 110})
-        notes.append({"pitch": KICK, "start_time": base + 2, "duration": 0.25, "velocity": 105})
+        _notes(KICK, _grid(bars, (0, 2)), 0.25, (110, 105) * bars)
         # Snare on 2 and 4
-        notes.append({"pitch": SNARE, "start_time": base + 1, "duration": 0.25, "velocity": 115})
-        notes.append({"pitch": SNARE, "start_time": base + 3, "duration": 0.25, "velocity": 115})
-        # 16th note hi-hats
-        for step in range(16):
-            vel = 95 if step % 4 == 0 else 70 if step % 2 == 0 else 55
-            notes.append({"pitch": CLOSED_HH, "start_time": base + step * 0.25, "duration": 0.15, "velocity": vel})
-    return notes
+        + _notes(SNARE, _grid(bars, (1, 3)), 0.25, 115)
+        # 16th note hi-hats: accent the quarters, lighter on the "e" and "a"
+        + _notes(CLOSED_HH, _grid(bars, SIXTEENTHS), 0.15, (95, 55, 70, 55) * (4 * bars))
+    )
 
+@functools.lru_cache(maxsize=None)
 def _half_time(bars=4):
     """Half-time feel for verses"""
-    notes = []
-    for bar in range(bars):
-        base = bar * 4.0
+    return _by_time(
         # Kick on 1 only
-        notes.append({"pitch": KICK, "start_time": base + 0, "duration": 0.25, "velocity": 110})
+        _notes(KICK, _grid(bars, (0,)), 0.25, 110)
         # Snare on 3 (half-time feel)
-        notes.append({"pitch": SNARE, "start_time": base + 2, "duration": 0.25, "velocity": 120})
+        + _notes(SNARE, _grid(bars, (2,)), 0.25, 120)
         # 8th note hi-hats
-        for beat in range(8):
-            notes.append({"pitch": CLOSED_HH, "start_time": base + beat * 0.5, "duration": 0.2, "velocity": 80})
-    return notes
+        + _notes(CLOSED_HH, _grid(bars, EIGHTHS), 0.2, 80)
+    )
 
+@functools.lru_cache(maxsize=None)
 def _open_hat_punk(bars=4):
     """Punk with open hi-hat accents"""
-    notes = []
-    for bar in range(bars):
-        base = bar * 4.0
+    return _by_time(
         # Kick on 1 and 3
-        notes.append({"pitch": KICK, "start_time": base + 0, "duration": 0.25, "velocity": 110})
-        notes.append({"pitch": KICK, "start_time": base + 2, "duration": 0.25, "velocity": 105})
+        _notes(KICK, _grid(bars, (0, 2)), 0.25, (110, 105) * bars)
         # Snare on 2 and 4
-        notes.append({"pitch": SNARE, "start_time": base + 1, "duration": 0.25, "velocity": 115})
-        notes.append({"pitch": SNARE, "start_time": base + 3, "duration": 0.25, "velocity": 115})
+        + _notes(SNARE, _grid(bars, (1, 3)), 0.25, 115)
         # Closed hats with open hat on the "and" of 4
-        for beat in range(7):
-            notes.append({"pitch": CLOSED_HH, "start_time": base + beat * 0.5, "duration": 0.2, "velocity": 85})
-        notes.append({"pitch": OPEN_HH, "start_time": base + 3.5, "duration": 0.4, "velocity": 100})
-    return notes
+        + _notes(CLOSED_HH, _grid(bars, EIGHTHS[:7]), 0.2, 85)
+        + _notes(OPEN_HH, _grid(bars, (3.5,)), 0.4, 100)
+    )
 
+# Accelerating snare per bar of the build; bars past the fourth keep 8th notes
+_BUILD_SNARES = (
+    ((2,), 0.25, 100),
+    ((1, 3), 0.25, 105),
+    (tuple(range(4)), 0.25, 110),
+    (EIGHTHS, 0.2, 115),
+)
+
+@functools.lru_cache(maxsize=None)
 def _build_up(bars=4):
     """Build-up pattern with accelerating snare"""
     notes = []
     for bar in range(bars):
         base = bar * 4.0
         # Kick on every quarter
-        for beat in range(4):
-            notes.append({"pitch": KICK, "start_time": base + beat, "duration": 0.25, "velocity": 105 + bar * 3})
-        
-        # Accelerating snare based on bar number
-        if bar == 0:
-            notes.append({"pitch": SNARE, "start_time": base + 2, "duration": 0.25, "velocity": 100})
-        elif bar == 1:
-            notes.append({"pitch": SNARE, "start_time": base + 1, "duration": 0.25, "velocity": 105})
-            notes.append({"pitch": SNARE, "start_time": base + 3, "duration": 0.25, "velocity": 105})
-        elif bar == 2:
-            for beat in range(4):
-                notes.append({"pitch": SNARE, "start_time": base + beat, "duration": 0.25, "velocity": 110})
-        else:
-            # Bar 4: 8th note snares
-            for step in range(8):
-                notes.append({"pitch": SNARE, "start_time": base + step * 0.5, "duration": 0.2, "velocity": 115})
-        
+        notes += _notes(KICK, [base + beat for beat in range(4)], 0.25, 105 + bar * 3)
+        offsets, duration, velocity = _BUILD_SNARES[min(bar, 3)]
+        notes += _notes(SNARE, [base + o for o in offsets], duration, velocity)
         # Crash on last beat
         if bar == 3:
-            notes.append({"pitch": CRASH, "start_time": base + 3.5, "duration": 1.0, "velocity": 120})
-    return notes
+            notes += _notes(CRASH, (base + 3.5,), 1.0, 120)
+    return _by_time(notes)
+
+# Scene order; every scene uses the 4-bar (16 beat) clip
+_PATTERNS = (
+    ("Punk Drive", _punk_drive),          # Classic punk (kick-snare-kick-snare, 8th hats)
+    ("Punk Fast", _punk_fast),            # Double-time punk
+    ("Chiptune Drive", _chiptune_drive),  # Driving 4-on-floor with snare 2+4
+    ("Crash Punk", _crash_punk),          # Punk with crash accents
+    ("16th Energy", _sixteenth_energy),   # 16th note hi-hats (energy!)
+    ("Half-Time", _half_time),            # Half-time feel
+    ("Open Hat Punk", _open_hat_punk),    # Punk with open hi-hat accents
+    ("Build Up", _build_up),              # Fill/Build pattern
+)
+
+# (name, notes) per scene for the default 4 bars, computed once at import
+_PRECOMPUTED_BARS_4 = tuple((name, build(4)) for name, build in _PATTERNS)
 
 if __name__ == "__main__":
     create_anamanaguchi_patterns()
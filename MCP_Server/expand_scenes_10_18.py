@@ -13,6 +13,17 @@ from mcp_tooling.generators import generate_chord_progression_advanced
 from mcp_tooling.basslines import generate_bassline_from_progression
 from mcp_tooling.constants import PROGRESSIONS
 
+# Bass style label -> generate_bassline_from_progression style
+BASS_STYLES = {
+    "simple": "rock",
+    "octave": "rock",
+    "syncopated": "funk",
+    "jazz_walking": "jazz"
+}
+
+# Used when a progression name is missing from PROGRESSIONS
+DEFAULT_CHORDS = ["I", "IV", "V", "I"]
+
 def expand_scenes():
     conn = get_ableton_connection()
     
@@ -33,16 +44,17 @@ def expand_scenes():
     print("Expanding Scenes 10-18 (clip indices 9-17)...")
     print("=" * 50)
     
-    # Ensure enough scenes exist
+    # Ensure enough scenes exist, creating only the missing ones
     print("\n📋 Ensuring scenes exist...")
-    for i in range(18):
-        try:
-            conn.send_command("create_scene", {"index": -1})
-        except:
-            pass  # May already exist
+    context = conn.send_command("get_song_context", {"include_clips": False})
+    missing = 18 - context.get("scene_count", len(context.get("scenes", [])))
+    if missing > 0:
+        conn.send_command("create_scenes", {"count": missing})
     
-    # Track 0: Chords (using generator)
+    # Track 0: Chords (using generator); the clip labels go out in one batch
     print("\n🎹 Track 0 (Chords):")
+    labels = []
+    labelled = []
     for clip_idx, mood, progression, key, scale, _ in scenes:
         try:
             result = generate_chord_progression_advanced(
@@ -56,69 +68,76 @@ def expand_scenes():
                 velocity=90
             )
             # Label the clip
-            conn.send_command("set_clip_name", {
+            labels.append({"type": "set_clip_name", "params": {
                 "track_index": 0,
                 "clip_index": clip_idx,
                 "name": f"{mood} ({key} {scale})"
-            })
-            print(f"  Scene {clip_idx + 1}: {mood} - {progression} ({key} {scale})")
+            }})
+            labelled.append((clip_idx, f"{mood} - {progression} ({key} {scale})"))
         except Exception as e:
             print(f"  Scene {clip_idx + 1} FAILED: {e}")
+    _report(conn, labels, labelled, per_scene=1)
     
     # Track 1: Bass
     print("\n🎸 Track 1 (Bass):")
     
-    style_map = {
-        "simple": "rock",
-        "octave": "rock",
-        "syncopated": "funk",
-        "jazz_walking": "jazz"
-    }
-    
+    # Resolve each scene's chords, generator style and clip length up front
+    bass_plan = []
     for clip_idx, mood, progression, key, scale, bass_style in scenes:
+        chords = PROGRESSIONS.get(progression, DEFAULT_CHORDS)
+        bass_plan.append((clip_idx, mood, key, scale, bass_style, chords,
+                          BASS_STYLES.get(bass_style, "rock"), len(chords) * 4.0))
+    
+    # Every scene's delete/create/add_notes/set_name goes out in one batch
+    pending = []
+    queued = []
+    for clip_idx, mood, key, scale, bass_style, chords, style, clip_length in bass_plan:
         try:
-            chords = PROGRESSIONS.get(progression, ["I", "IV", "V", "I"])
-            
             notes = generate_bassline_from_progression(
                 chords=chords,
                 key=key,
                 scale=scale,
                 beats_per_chord=4.0,
-                style=style_map.get(bass_style, "rock"),
+                style=style,
                 velocity=100,
                 octave=2
             )
-            
-            clip_length = len(chords) * 4.0
-            try:
-                conn.send_command("delete_clip", {"track_index": 1, "clip_index": clip_idx})
-            except:
-                pass
-            
-            conn.send_command("create_clip", {
-                "track_index": 1,
-                "clip_index": clip_idx,
-                "length": clip_length
-            })
-            
-            conn.send_command("add_notes_to_clip", {
-                "track_index": 1,
-                "clip_index": clip_idx,
-                "notes": notes
-            })
-            
-            conn.send_command("set_clip_name", {
-                "track_index": 1,
-                "clip_index": clip_idx,
-                "name": f"{mood} Bass ({bass_style})"
-            })
-            print(f"  Scene {clip_idx + 1}: {mood} - {bass_style} ({key} {scale})")
         except Exception as e:
             print(f"  Scene {clip_idx + 1} FAILED: {e}")
+            continue
+        
+        slot = {"track_index": 1, "clip_index": clip_idx}
+        pending += [
+            {"type": "delete_clip", "params": slot},
+            {"type": "create_clip", "params": dict(slot, length=clip_length)},
+            {"type": "add_notes_to_clip", "params": dict(slot, notes=notes)},
+            {"type": "set_clip_name", "params": dict(slot, name=f"{mood} Bass ({bass_style})")},
+        ]
+        queued.append((clip_idx, f"{mood} - {bass_style} ({key} {scale})"))
+    # The delete_clip responses are skipped; the slot may be empty
+    _report(conn, pending, queued, per_scene=4, skip=1)
     
     print("\n" + "=" * 50)
     print("✅ Scenes 10-18 populated!")
     print("Fire scenes 10-18 to hear the new content.")
 
+def _report(conn, commands, scenes, per_scene, skip=0):
+    """Send one batch and print each scene's outcome from its slice of responses"""
+    if not commands:
+        return
+    try:
+        results = conn.send_batch(commands)
+    except Exception as e:
+        for clip_idx, _ in scenes:
+            print(f"  Scene {clip_idx + 1} FAILED: {e}")
+        return
+    for n, (clip_idx, description) in enumerate(scenes):
+        replies = results[n * per_scene + skip:(n + 1) * per_scene]
+        errors = [r.get("message") for r in replies if r.get("status") == "error"]
+        if errors:
+            print(f"  Scene {clip_idx + 1} FAILED: {errors[0]}")
+        else:
+            print(f"  Scene {clip_idx + 1}: {description}")
+
 if __name__ == "__main__":
     expand_scenes()
@@ -6,11 +6,10 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parent))
 
 from mcp_tooling.connection import get_ableton_connection
-from mcp_tooling.generators import (
-    generate_chord_progression_advanced as gen_chords,
-    generate_bassline_advanced_wrapper as gen_bass
-)
-from mcp_tooling.drummer import generate_drum_pattern, list_genres
+from mcp_tooling.ableton_helpers import ensure_track_exists, ensure_clip_slot
+from mcp_tooling.generators import normalize_key_and_scale, finalize_notes, build_chord_notes
+from mcp_tooling.basslines import generate_bassline_advanced
+from mcp_tooling.drummer import get_random_pattern, pattern_to_notes
 from mcp_tooling.devices import search_and_load_device
 
 def build_chiptune():
@@ -36,6 +35,12 @@ def build_chiptune():
     drum_genres = ['breakbeat', 'hip_hop', 'trap', 'footwork', 'garage', 'dubstep', 'house']
     
     print("Building 8 scenes of F# Mixolydian magic...")
+    # Tracks and scene slots are ensured once, up front and in order. These
+    # are check-then-create sequences, so running them from concurrent
+    # per-part workers would create duplicate scenes or tracks.
+    for track_index in range(3):
+        ensure_track_exists(track_index, prefer="midi", allow_create=True)
+    ensure_clip_slot(0, 7, allow_create=True)
     
     # We'll fill scenes 0 to 7 (8 scenes total)
     for i in range(8):
@@ -51,55 +56,24 @@ def build_chiptune():
         print(f"--- Scene {i+1} (Slot {i}) ---")
         print(f"Progression: {prog} | Genre: {genre} | Length: {num_bars} bars")
 
-        # Lead Chords (Track 0)
+        # Chords, bass and drums are built here and written to their three
+        # tracks with one command per scene
+        clips = []
+        for part in (
+            _scene_chords(i, prog, beats_per_chord),
+            _scene_bass(i, prog, num_bars),
+            _scene_drums(i, genre, num_bars),
+        ):
+            if isinstance(part, str):
+                print(part)
+            else:
+                clips.append(part)
         try:
-            res = gen_chords(
-                track_index=0, 
-                clip_index=i, 
-                key='F#', 
-                scale='mixolydian', # Explicit mixolydian
-                progression=prog, 
-                beats_per_chord=beats_per_chord, 
-                total_bars=num_bars, 
-                arpeggiate=True
-            )
-            # Label the clip for improvisation
-            conn.send_command("set_clip_name", {"track_index": 0, "clip_index": i, "name": prog})
-            print(f"  Chords: {res} (Labeled: {prog})")
+            res = conn.add_notes_to_clips_multi(clips)
+            for clip in res.get("clips", []):
+                print(f"  Track {clip['track_index']}: {clip['note_count']} notes")
         except Exception as e:
-            print(f"  Chords failed: {e}")
-
-        # Jazz Walking Bass (Track 1)
-        try:
-            # User specifically asked for 'jazz' walking and 16 bars
-            res = gen_bass(
-                track_index=1, 
-                clip_index=i, 
-                key='F#', 
-                scale='mixolydian', 
-                progression=prog, 
-                beats_per_chord=1.0, # Quarter note walk
-                total_bars=num_bars, 
-                style='jazz', 
-                octave=2
-            )
-            print(f"  Bass: {res}")
-        except Exception as e:
-            print(f"  Bass failed: {e}")
-
-        # Drums (Track 2)
-        try:
-            res = generate_drum_pattern(
-                track_index=2,
-                clip_index=i,
-                genre=genre,
-                bars=num_bars,
-                humanize=0.08,
-                clear_existing=True
-            )
-            print(f"  Drums: {res}")
-        except Exception as e:
-            print(f"  Drums failed: {e}")
+            print(f"  Scene failed: {e}")
 
     # 4. Play Scene 1
     print("Firing Scene 1 and starting playback...")
@@ -108,5 +82,51 @@ def build_chiptune():
     
     print("Arrangement ready! 🕹️ 8 scenes populated with 16-bar Jazz Walking Basslines.")
 
+def _scene_chords(i, prog, beats_per_chord):
+    """Lead Chords (Track 0), voice led in F# Mixolydian and labeled with the progression"""
+    try:
+        _, key, scale = normalize_key_and_scale('F#', 'mixolydian')
+        notes, clip_length = build_chord_notes(prog.split(), key, scale, beats_per_chord)
+        return {"track_index": 0, "clip_index": i, "length": clip_length,
+                "notes": notes, "name": prog}
+    except Exception as e:
+        return f"  Chords failed: {e}"
+
+def _scene_bass(i, prog, num_bars):
+    """Jazz Walking Bass (Track 1)"""
+    try:
+        # User specifically asked for 'jazz' walking and 16 bars
+        _, key, scale = normalize_key_and_scale('F#', 'mixolydian')
+        notes, clip_length = generate_bassline_advanced(
+            chords=prog.split(),
+            key=key,
+            scale=scale,
+            beats_per_chord=1.0, # Quarter note walk
+            total_bars=num_bars,
+            style='jazz',
+            velocity=100,
+            octave=2
+        )
+        clip_length = float(clip_length)
+        return {"track_index": 1, "clip_index": i, "length": clip_length,
+                "notes": finalize_notes(notes, clip_length)}
+    except Exception as e:
+        return f"  Bass failed: {e}"
+
+def _scene_drums(i, genre, num_bars):
+    """Drums (Track 2)"""
+    try:
+        result = get_random_pattern(genre)
+        if not result:
+            return f"  Drums failed: no patterns for genre '{genre}'"
+        notes, clip_length = pattern_to_notes(
+            result["pattern"].get("pattern", {}),
+            bars=num_bars,
+            humanize=0.08
+        )
+        return {"track_index": 2, "clip_index": i, "length": clip_length, "notes": notes}
+    except Exception as e:
+        return f"  Drums failed: {e}"
+
 if __name__ == "__main__":
     build_chiptune()
@@ -1,10 +1,33 @@
 # mcp_tooling package exports
-from .drummer import (
-    list_genres as drummer_list_genres,
-    list_patterns as drummer_list_patterns,
-    search_patterns as drummer_search_patterns,
-    get_pattern as drummer_get_pattern,
-    generate_drum_pattern,
-    generate_drum_fill,
-    generate_drum_section,
-)
+#
+# Loaded on first access (PEP 562) so importing a light submodule such as
+# mcp_tooling.connection doesn't also load the drum pattern library.
+import importlib
+
+# Exported name -> (submodule, attribute)
+_LAZY = {
+    "drummer_list_genres": ("drummer", "list_genres"),
+    "drummer_list_patterns": ("drummer", "list_patterns"),
+    "drummer_search_patterns": ("drummer", "search_patterns"),
+    "drummer_get_pattern": ("drummer", "get_pattern"),
+    "generate_drum_pattern": ("drummer", "generate_drum_pattern"),
+    "generate_drum_fill": ("drummer", "generate_drum_fill"),
+    "generate_drum_section": ("drummer", "generate_drum_section"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module("." + module_name, __name__), attr)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -46,13 +46,16 @@ def _ensure_track_exists(track_index: Optional[int], prefer: str = "midi", allow
     
     new_index = resp.get("index", track_count)
     
-    # Verification loop: Wait for track to be visible to API
-    for _ in range(10):
+    # Verification loop: Wait for track to be visible to API, backing off
+    # from 25 ms so the usual quick case returns fast (about 2 s in total)
+    delay = 0.025
+    for _ in range(8):
         try:
             ableton.send_command("get_track_info", {"track_index": new_index})
             return new_index
         except Exception:
-            time.sleep(0.2)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.4)
             
     # One last try or return anyway
     return new_index
@@ -83,19 +86,22 @@ def _ensure_clip_slot(track_index: int, clip_index: int, allow_create: bool = Tr
 def ensure_device(ableton, track_index, class_name_fragment, slot_index=-1):
     """Check if a device exists on the track and return its index."""
     try:
+        # get_track_info is briefly cached by the connection
         track_info = ableton.send_command("get_track_info", {"track_index": track_index})
-        devices = track_info.get("devices", [])
+        fragment = class_name_fragment.casefold()
+        devices = [
+            (dev.get("name", "").casefold(), dev.get("class_name", "").casefold(), dev.get("index"))
+            for dev in track_info.get("devices", [])
+        ]
         
         if slot_index >= 0 and slot_index < len(devices):
-             dev = devices[slot_index]
-             if class_name_fragment.lower() in dev.get("name", "").lower() or \
-                class_name_fragment.lower() in dev.get("class_name", "").lower():
+             name, class_name, _ = devices[slot_index]
+             if fragment in name or fragment in class_name:
                  return slot_index
         
-        for dev in devices:
-             if class_name_fragment.lower() in dev.get("name", "").lower() or \
-                class_name_fragment.lower() in dev.get("class_name", "").lower():
-                 return dev.get("index")
+        for name, class_name, index in devices:
+             if fragment in name or fragment in class_name:
+                 return index
     except Exception:
         pass
     return None
@@ -156,6 +162,7 @@ def load_sample_to_simpler(track_index: int, sample_query: str, backup_query: st
         # 4. Verify Simpler Existence
         # Sometimes get_simpler_info fails immediately after load due to indexing lag
         start_time = time.time()
+        delay = 0.1
         while time.time() - start_time < 5.0:
             info = conn.send_command("get_simpler_info", {"track_index": track_index})
             if info.get("status") != "error":
@@ -168,7 +175,8 @@ def load_sample_to_simpler(track_index: int, sample_query: str, backup_query: st
                  print(f"   ℹ️ Verified device '{devs.get('device_name')}' exists (Simpler API check pending)")
                  return True
                  
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
             
         print("   ⚠️ Warning: Sample loaded but Simpler device not fully verified by API.")
         return True # Return true anyway to attempt playback, as load command didn't error
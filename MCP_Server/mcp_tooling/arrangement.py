@@ -19,22 +19,25 @@ def create_song_blueprint(genre: str = "pop", key: str = "C", scale: str = "majo
         "genre": genre,
         "key": key,
         "scale": scale,
-        "tracks": template["tracks"],
+        "tracks": [
+            {"name": track.name, "type": track.type, "instrument": track.instrument}
+            for track in template.tracks
+        ],
         "scenes": []
     }
     
-    for section_name in template["structure"]:
-        prog = template["progression_map"].get(section_name, "pop_1")
+    for section_name in template.structure:
+        prog = template.progression_map.get(section_name, "pop_1")
         scene = {
             "name": section_name,
             "clips": []
         }
         
         # Populate clips for each track
-        for track in template["tracks"]:
+        for track in template.tracks:
             clip_def = {
-                "track_name": track["name"],
-                "type": track["type"],
+                "track_name": track.name,
+                "type": track.type,
                 "progression": prog,
                 "bars": 4 # Standard length
             }
@@ -59,15 +62,12 @@ def construct_song(blueprint_json: str) -> str:
         
         # 1. Setup Tracks
         track_map = {} # name -> index
-        # Use get_song_context instead of deprecated get_session_info
-        context = ableton.send_command("get_song_context", {"include_clips": False})
-        start_track = len(context.get("tracks", []))
-        
+        # Tracks and scenes are appended, and each create call reports where
+        # the new ones landed, so the set's counts never need to be read
         created_tracks_log = []
         
-        for i, track_def in enumerate(plan["tracks"]):
-            t_idx = start_track + i
-            ableton.send_command("create_midi_track", {"index": t_idx})
+        for track_def in plan["tracks"]:
+            t_idx = ableton.send_command("create_midi_track", {"index": -1})["index"]
             ableton.send_command("set_track_name", {"track_index": t_idx, "name": track_def["name"]})
             track_map[track_def["name"]] = t_idx
             
@@ -76,11 +76,10 @@ def construct_song(blueprint_json: str) -> str:
             if inst:
                  # Use load_device_by_name instead of resolve_uri_by_name
                  # Try instruments, then sounds, then drums
-                 result = load_device_by_name(track_idx, inst, "instruments")
-                 if not result.get("loaded"):
-                     result = load_device_by_name(track_idx, inst, "sounds")
-                 if not result.get("loaded"):
-                     result = load_device_by_name(track_idx, inst, "drums")
+                 for category in ("instruments", "sounds", "drums"):
+                     result = load_device_by_name(t_idx, inst, category)
+                     if result.get("loaded"):
+                         break
                  uri = result.get("device_uri") if result.get("loaded") else None
                  if uri:
                      ableton.send_command("load_device", {"track_index": t_idx, "device_uri": uri})
@@ -90,12 +89,14 @@ def construct_song(blueprint_json: str) -> str:
         
         # 2. Setup Scenes & Clips
         created_scenes_log = []
-        start_scene = len(context.get("scenes", []))
+        # Create every named scene in one call
+        start_scene = ableton.send_command("create_scenes", {
+            "count": len(plan["scenes"]),
+            "names": [scene_def["name"] for scene_def in plan["scenes"]]
+        })["first_index"]
         
         for i, scene_def in enumerate(plan["scenes"]):
             s_idx = start_scene + i
-            # Create scene with name
-            ableton.send_command("create_scene", {"index": s_idx, "name": scene_def["name"]}) 
             
             # 3. Generate Content
             for clip_def in scene_def["clips"]:
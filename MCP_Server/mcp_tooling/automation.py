@@ -1,7 +1,7 @@
 import logging
 import math
 from typing import List, Dict, Any, Optional, Tuple
-from .connection import get_ableton_connection
+from .connection import get_ableton_connection, AbletonCommandError
 
 logger = logging.getLogger("mcp_server.automation")
 
@@ -11,6 +11,21 @@ CC_EXPRESSION = 11
 CC_VOLUME = 7
 CC_PAN = 10
 
+def _linear(pct):
+    return pct
+
+# curve_type -> shape over pct (0.0 to 1.0), returning 0.0 to 1.0;
+# "attack_release" depends on its arguments and is built per call
+_CURVES = {
+    "swell": lambda pct: math.sin(pct * math.pi),  # Bell curve
+    "fade_in": _linear,
+    "fade_out": lambda pct: 1.0 - pct,
+    "constant": lambda pct: 1.0,
+    "linear": _linear,
+    "exponential_in": lambda pct: pct ** 2,
+    "exponential_out": lambda pct: 1.0 - ((1.0 - pct) ** 2),
+}
+
 def generate_cc_envelope(
     length_beats: float,
     curve_type: str = "swell",
@@ -32,49 +47,59 @@ def generate_cc_envelope(
         - "exponential_in": Slow start, fast finish.
         - "exponential_out": Fast start, slow finish.
     """
-    points = []
     num_points = max(2, int(length_beats / resolution))
     
-    for i in range(num_points + 1):
-        t = (i / num_points) * length_beats
-        pct = i / num_points  # 0.0 to 1.0
+    if curve_type == "attack_release":
+        # Attack -> Sustain -> Release
+        attack_end = attack_pct
+        release_start = 1.0 - release_pct
         
-        if curve_type == "swell":
-            # Bell curve: sin(x * pi)
-            val = math.sin(pct * math.pi)
-        elif curve_type == "fade_in":
-            val = pct
-        elif curve_type == "fade_out":
-            val = 1.0 - pct
-        elif curve_type == "constant":
-            val = 1.0
-        elif curve_type == "linear":
-            val = pct
-        elif curve_type == "exponential_in":
-            val = pct ** 2
-        elif curve_type == "exponential_out":
-            val = 1.0 - ((1.0 - pct) ** 2)
-        elif curve_type == "attack_release":
-            # Attack -> Sustain -> Release
-            attack_end = attack_pct
-            release_start = 1.0 - release_pct
+        def curve(pct):
             if pct < attack_end:
-                val = pct / attack_end
-            elif pct > release_start:
-                val = 1.0 - ((pct - release_start) / release_pct)
-            else:
-                val = 1.0
-        else:
-            val = pct  # Default to linear
-        
-        # Map to value range
-        mapped_val = int(start_value + (end_value - start_value) * val)
-        mapped_val = max(0, min(127, mapped_val))
-        points.append((round(t, 4), mapped_val))
+                return pct / attack_end
+            if pct > release_start:
+                return 1.0 - ((pct - release_start) / release_pct)
+            return 1.0
+    else:
+        curve = _CURVES.get(curve_type, _linear)  # Default to linear
+    
+    # Map to value range
+    span = end_value - start_value
+    points = []
+    for i in range(num_points + 1):
+        pct = i / num_points  # 0.0 to 1.0
+        mapped_val = int(start_value + span * curve(pct))
+        points.append((round(pct * length_beats, 4), max(0, min(127, mapped_val))))
     
     return points
 
 
+def _device_parameters(ableton, track_index: int, devices: List[Dict[str, Any]], strict: bool = False):
+    """
+    Fetch the parameters of several devices on a track in one batch.
+    
+    Yields (device_index, parameters) per device, in order. A device whose
+    lookup failed yields an empty list, or with strict raises
+    AbletonCommandError when the scan reaches it, as a lone
+    get_device_parameters call would have.
+    """
+    indices = [d.get("index", 0) for d in devices]
+    if not indices:
+        return
+    replies = ableton.send_batch([
+        {"type": "get_device_parameters", "params": {"track_index": track_index, "device_index": d_idx}}
+        for d_idx in indices
+    ])
+    for d_idx, reply in zip(indices, replies):
+        if reply.get("status") == "success":
+            yield d_idx, reply.get("result", {}).get("parameters", [])
+        elif strict:
+            raise AbletonCommandError(reply.get("message", "Unknown error from Ableton"))
+        else:
+            logger.debug(f"Error checking device {d_idx}: {reply.get('message')}")
+            yield d_idx, []
+
+
 def apply_cc_automation(
     track_index: int,
     clip_index: int,
@@ -127,29 +152,19 @@ def apply_cc_automation(
             # Try to find a matching parameter based on CC number
             search_names = cc_param_map.get(cc_number, [f"CC{cc_number}", "Macro 1"])
             
-            for d in devices:
-                d_idx = d.get("index", 0)
-                if device_index is not None and d_idx != device_index:
-                    continue
-                    
-                try:
-                    p_data = ableton.send_command("get_device_parameters", {
-                        "track_index": track_index, 
-                        "device_index": d_idx
-                    })
-                    for p in p_data.get("parameters", []):
-                        p_name = p.get("name", "")
-                        p_orig = p.get("original_name", "")
-                        for search in search_names:
-                            if search.lower() in p_name.lower() or search.lower() in p_orig.lower():
-                                target_device_idx = d_idx
-                                target_param_name = p_name
-                                break
-                        if target_param_name:
+            # All candidate devices' parameters come back in one round-trip
+            candidates = [d for d in devices if device_index is None or d.get("index", 0) == device_index]
+            for d_idx, params in _device_parameters(ableton, track_index, candidates):
+                for p in params:
+                    p_name = p.get("name", "")
+                    p_orig = p.get("original_name", "")
+                    for search in search_names:
+                        if search.lower() in p_name.lower() or search.lower() in p_orig.lower():
+                            target_device_idx = d_idx
+                            target_param_name = p_name
                             break
-                except Exception as e:
-                    logger.debug(f"Error checking device {d_idx}: {e}")
-                    continue
+                    if target_param_name:
+                        break
                 if target_param_name:
                     break
         
@@ -202,10 +217,10 @@ def apply_automation_logic(track_index: int, clip_index: int, parameter_name: st
         target_device_idx = -1
         
         # Heuristic: Find first device with parameter 'parameter_name'
-        for d in devices:
-            d_idx = d["index"]
-            p_data = ableton.send_command("get_device_parameters", {"track_index": track_index, "device_index": d_idx})
-            for p in p_data.get("parameters", []):
+        # Unlike the CC search, a failed device lookup aborts rather than
+        # being skipped
+        for d_idx, params in _device_parameters(ableton, track_index, devices, strict=True):
+            for p in params:
                  if p.get("name") == parameter_name or p.get("original_name") == parameter_name:
                      target_device_idx = d_idx
                      break
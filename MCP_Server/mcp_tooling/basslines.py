@@ -12,7 +12,9 @@ Based on detailed harmonic and rhythmic profiles:
 - Country: 2-feel (Root-5 on 1 and 3)
 """
 
+import functools
 import random
+from collections import namedtuple
 from typing import List, Dict, Any, Optional, Union
 from .theory import get_chord_notes
 from .constants import SCALES
@@ -23,6 +25,7 @@ DEFAULT_BASS_OCTAVE = 2
 # Note names for MIDI conversion
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 
+@functools.lru_cache(maxsize=64)
 def key_to_midi(key: str, octave: int = DEFAULT_BASS_OCTAVE) -> int:
     """Convert key name to MIDI note number at specified octave."""
     key_norm = key.upper().replace("DB", "C#").replace("EB", "D#").replace("GB", "F#").replace("AB", "G#").replace("BB", "A#")
@@ -55,10 +58,27 @@ def get_approach_note(target_pitch: int, style: str = "chromatic_below") -> int:
         return target_pitch + 7
     return target_pitch - 1 # Default
 
+# Chord tones a generator may target, resolved once per chord. Missing
+# tones fall back to major-third / perfect-fifth / minor-seventh guesses;
+# has_seventh says whether the seventh is really in the chord.
+ChordCtx = namedtuple("ChordCtx", "root third fifth seventh octave has_seventh")
+
+def unpack_chord(root: int, chord_tones: List[int]) -> ChordCtx:
+    """Build a ChordCtx from a chord's root and its tones (root, 3rd, 5th, 7th...)."""
+    n = len(chord_tones)
+    return ChordCtx(
+        root=root,
+        third=chord_tones[1] if n > 1 else root + 4,
+        fifth=chord_tones[2] if n > 2 else root + 7,
+        seventh=chord_tones[3] if n > 3 else root + 10,
+        octave=root + 12,
+        has_seventh=n > 3
+    )
+
 # --- GENRE-SPECIFIC GENERATORS ---
 
 def _gen_jazz_walking(
-    root: int, chord_tones: List[int], next_root: Optional[int], 
+    ctx: ChordCtx, next_root: Optional[int], 
     start_time: float, duration: float, velocity: int
 ) -> List[Dict]:
     """
@@ -67,12 +87,7 @@ def _gen_jazz_walking(
     """
     notes = []
     beats = int(duration)
-    
-    # Analyze chord tones for targets
-    # chord_tones usually [root, 3rd, 5th, 7th]
-    third = chord_tones[1] if len(chord_tones) > 1 else root + 4
-    fifth = chord_tones[2] if len(chord_tones) > 2 else root + 7
-    seventh = chord_tones[3] if len(chord_tones) > 3 else root + 10
+    root = ctx.root
     
     current_pitch = root
     
@@ -102,8 +117,8 @@ def _gen_jazz_walking(
         else:
             # Middle Beats (2, 3, etc): Targets & Passing Tones
             # Target 3rd, 5th, 7th, or octave
-            options = [third, fifth, root + 12]
-            if len(chord_tones) > 3: options.append(seventh)
+            options = [ctx.third, ctx.fifth, ctx.octave]
+            if ctx.has_seventh: options.append(ctx.seventh)
             
             # Simple passing logic: move stepwise if possible
             # For now, random chord tone selection is robust enough for basic walking
@@ -123,7 +138,7 @@ def _gen_jazz_walking(
     return notes
 
 def _gen_rock_pop_driving(
-    root: int, chord_tones: List[int], next_root: Optional[int], 
+    ctx: ChordCtx, next_root: Optional[int], 
     start_time: float, duration: float, velocity: int
 ) -> List[Dict]:
     """
@@ -134,8 +149,7 @@ def _gen_rock_pop_driving(
     beats = int(duration)
     subdivisions = 2 # 8th notes
     
-    fifth = chord_tones[2] if len(chord_tones) > 2 else root + 7
-    octave = root + 12
+    root, fifth, octave = ctx.root, ctx.fifth, ctx.octave
     
     pattern_type = random.choice(["straight_8", "root_5", "gallop"])
     
@@ -174,7 +188,7 @@ def _gen_rock_pop_driving(
     return notes
 
 def _gen_funk_syncopated(
-    root: int, chord_tones: List[int], next_root: Optional[int], 
+    ctx: ChordCtx, next_root: Optional[int], 
     start_time: float, duration: float, velocity: int
 ) -> List[Dict]:
     """
@@ -185,9 +199,8 @@ def _gen_funk_syncopated(
     # Funk is less about filling every slot, more about the grid
     # We'll generate a 1-bar pattern (16 slots)
     
-    octave = root + 12
-    flat_seven = root + 10 # approximate
-    if len(chord_tones) > 3: flat_seven = chord_tones[3]
+    root, octave = ctx.root, ctx.octave
+    flat_seven = ctx.seventh # root + 10 when the chord has no 7th
     
     # Always hit the ONE
     notes.append({
@@ -244,7 +257,7 @@ def _gen_funk_syncopated(
     return notes
 
 def _gen_reggae_dub(
-    root: int, chord_tones: List[int], next_root: Optional[int], 
+    ctx: ChordCtx, next_root: Optional[int], 
     start_time: float, duration: float, velocity: int
 ) -> List[Dict]:
     """
@@ -252,6 +265,7 @@ def _gen_reggae_dub(
     Rule: Avoid the One (mostly). Emphasize 3 (One Drop). Deep subs.
     """
     notes = []
+    root = ctx.root
     
     # Common Reggae Pattern: Drop One, Hit 2 and 3 and 4
     # OR: Hit 3 hard (One Drop)
@@ -287,7 +301,7 @@ def _gen_reggae_dub(
     return notes
     
 def _gen_country_2feel(
-    root: int, chord_tones: List[int], next_root: Optional[int], 
+    ctx: ChordCtx, next_root: Optional[int], 
     start_time: float, duration: float, velocity: int
 ) -> List[Dict]:
     """
@@ -296,7 +310,7 @@ def _gen_country_2feel(
     """
     notes = []
     
-    fifth = chord_tones[2] if len(chord_tones) > 2 else root + 7
+    root, fifth = ctx.root, ctx.fifth
     lower_fifth = root - 5
     
     # Beat 1: Root
@@ -332,6 +346,19 @@ def _gen_country_2feel(
 
 # --- MAIN DISPATCHER ---
 
+# Style name -> per-chord generator; anything else plays held root notes
+_STYLE_GENERATORS = {}
+for _styles, _gen in (
+    (("jazz", "walking", "swing"), _gen_jazz_walking),
+    (("rock", "pop", "driving", "metal"), _gen_rock_pop_driving),
+    (("funk", "soul", "rnb", "syncopated"), _gen_funk_syncopated),
+    (("reggae", "dub"), _gen_reggae_dub),
+    (("country", "blues", "folk"), _gen_country_2feel),
+):
+    for _style in _styles:
+        _STYLE_GENERATORS[_style] = _gen
+del _styles, _gen, _style
+
 def generate_bassline_from_progression(
     chords: List[str],
     key: str,
@@ -352,9 +379,8 @@ def generate_bassline_from_progression(
     # Pre-calc roots and chord tones for improved context awareness
     prog_data = []
     for chord in chords:
-        r = get_chord_root_pitch(root_midi, scale, chord)
-        t = get_chord_tones(root_midi, scale, chord)
-        prog_data.append({"root": r, "tones": t})
+        tones = get_chord_tones(root_midi, scale, chord)
+        prog_data.append(unpack_chord(tones[0] if tones else root_midi, tones))
         
     # Calculate timing
     if total_bars:
@@ -362,27 +388,18 @@ def generate_bassline_from_progression(
         beats_per_chord = beats_total / len(chords)
     
     current_time = 0.0
+    # Dispatch once for the whole progression
+    generate = _STYLE_GENERATORS.get(style)
     
-    for i, data in enumerate(prog_data):
-        root = data["root"]
-        tones = data["tones"]
-        next_root = prog_data[i+1]["root"] if i+1 < len(prog_data) else None
+    for i, ctx in enumerate(prog_data):
+        next_root = prog_data[i+1].root if i+1 < len(prog_data) else None
         
-        # Dispatch
-        if style in ["jazz", "walking", "swing"]:
-            notes = _gen_jazz_walking(root, tones, next_root, current_time, beats_per_chord, velocity)
-        elif style in ["rock", "pop", "driving", "metal"]:
-            notes = _gen_rock_pop_driving(root, tones, next_root, current_time, beats_per_chord, velocity)
-        elif style in ["funk", "soul", "rnb", "syncopated"]:
-            notes = _gen_funk_syncopated(root, tones, next_root, current_time, beats_per_chord, velocity)
-        elif style in ["reggae", "dub"]:
-            notes = _gen_reggae_dub(root, tones, next_root, current_time, beats_per_chord, velocity)
-        elif style in ["country", "blues", "folk"]:
-            notes = _gen_country_2feel(root, tones, next_root, current_time, beats_per_chord, velocity)
+        if generate is not None:
+            notes = generate(ctx, next_root, current_time, beats_per_chord, velocity)
         else:
             # Default fallback (Root notes)
             notes = [{
-                "pitch": root,
+                "pitch": ctx.root,
                 "start_time": current_time,
                 "duration": beats_per_chord - 0.1,
                 "velocity": velocity
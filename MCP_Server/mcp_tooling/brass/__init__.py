@@ -4,12 +4,14 @@ Brass Orchestration Module
 Generates brass section midi.
 """
 
+import functools
 from typing import List, Optional
 from mcp_tooling.theory import get_chord_notes
 from mcp_tooling.brass.section import BrassConductor
 
 # Helper for key parsing (should be shared util but copying for safety)
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+@functools.lru_cache(maxsize=64)
 def key_to_midi(key: str, octave: int = 4) -> int:
     k = key.strip().upper()
     if len(k) > 1 and k[1] in ["#", "B"]:
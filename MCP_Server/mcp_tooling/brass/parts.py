@@ -34,13 +34,12 @@ def fit_to_range(pitch: int, part_name: str) -> int:
         
     current = pitch
     
-    # Check if we need to shift up
-    while current < part.min:
-        current += 12
-        
-    # Check if we need to shift down
-    while current > part.max:
-        current -= 12
+    # Shift up to the lowest octave at or above min, then down to the
+    # highest at or below max; same result as stepping by 12
+    if current < part.min:
+        current = part.min + (current - part.min) % 12
+    if current > part.max:
+        current = part.max - (part.max - current) % 12
         
     # Final check - if oscillating, clamp?
     if current < part.min: current += 12
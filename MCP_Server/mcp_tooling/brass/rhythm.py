@@ -25,3 +25,21 @@ PATTERNS = {
 
 def get_pattern(name: str) -> list:
     return PATTERNS.get(name, PATTERNS["whole_note"])
+
+# Patterns in play order, sorted once rather than per chord
+_SORTED_PATTERNS = {name: tuple(sorted(offsets)) for name, offsets in PATTERNS.items()}
+
+def get_pattern_times(name: str, duration: float, start: float = 0.0) -> list:
+    """
+    Lay a pattern over one chord.
+
+    Returns (frac, start_time, step) per hit in time order, where step is
+    the time to the next hit (or to the end of the chord).
+    """
+    offsets = _SORTED_PATTERNS.get(name, _SORTED_PATTERNS["whole_note"])
+    last = len(offsets) - 1
+    return [
+        (frac, start + (frac * duration),
+         (offsets[i + 1] - frac) * duration if i < last else duration - (frac * duration))
+        for i, frac in enumerate(offsets)
+    ]
@@ -7,7 +7,7 @@ Impact-first generation logic for brass with rigorous constraints.
 from typing import List, Dict, Optional
 import random
 from .parts import PARTS
-from .rhythm import get_pattern
+from .rhythm import get_pattern_times
 from .styles import get_style_profile, BrassProfile
 from .voicings import get_pow_stack, get_shell_recipe
 from ..performance import apply_performance_humanization
@@ -221,7 +221,6 @@ class BrassConductor:
 
         # 4. Rhythm & Duration
         rhythm_key = self.profile.rhythm_pattern
-        offsets = sorted(get_pattern(rhythm_key))
         gate = self.profile.gate
         
         all_notes = []
@@ -248,18 +247,9 @@ class BrassConductor:
             active_subset = list(keepers)
             
         
-        for idx, frac in enumerate(offsets):
-            start = start_time + (frac * duration)
-            
-            # Dynamic Duration Logic
-            # Calc step to next event
-             # Distance to next offset or end of bar
-            if idx < len(offsets) - 1:
-                next_frac = offsets[idx+1]
-                step = (next_frac - frac) * duration
-            else:
-                step = duration - (frac * duration) # To end of duration
-            
+        # Dynamic Duration Logic: step is the distance to the next offset
+        # or to the end of the chord
+        for frac, start, step in get_pattern_times(rhythm_key, duration, start_time):
             final_dur = step * gate
             # Clamp for stabs
             if self.profile.texture == "hit":
@@ -4,6 +4,8 @@
 # Original by Ludovic Drolez (2019-2025) - MIT License
 # Extensions with cited sources added 2026
 
+import functools
+
 # ORIGINAL PROGRESSIONS (from ldrolez/free-midi-chords)
 # ========================================================
 
@@ -615,41 +617,36 @@ def parse_progression(prog_str: str) -> tuple:
     
     return chords, moods, source
 
+@functools.lru_cache(maxsize=None)
+def _parsed_progressions() -> tuple:
+    """Parse the progression library once: (category, chords, moods, moods_lower, source)."""
+    return tuple(
+        (category, tuple(chords), tuple(moods), tuple(m.lower() for m in moods), source)
+        for category, progressions in prog_all_extended.items()
+        for chords, moods, source in map(parse_progression, progressions)
+    )
+
+def _progressions_tagged(tag: str) -> list:
+    """Get all progressions with a mood/genre tag containing tag (case-insensitive)."""
+    tag_lower = tag.lower()
+    return [
+        {
+            'chords': list(chords),
+            'moods': list(moods),
+            'source': source,
+            'category': category
+        }
+        for category, chords, moods, moods_lower, source in _parsed_progressions()
+        if any(tag_lower in m for m in moods_lower)
+    ]
+
 def get_progressions_by_genre(genre: str) -> list:
     """Get all progressions tagged with a specific genre."""
-    genre_lower = genre.lower()
-    results = []
-    
-    for category, progressions in prog_all_extended.items():
-        for prog_str in progressions:
-            chords, moods, source = parse_progression(prog_str)
-            if any(genre_lower in m.lower() for m in moods):
-                results.append({
-                    'chords': chords,
-                    'moods': moods,
-                    'source': source,
-                    'category': category
-                })
-    
-    return results
+    return _progressions_tagged(genre)
 
 def get_progressions_by_mood(mood: str) -> list:
     """Get all progressions tagged with a specific mood."""
-    mood_lower = mood.lower()
-    results = []
-    
-    for category, progressions in prog_all_extended.items():
-        for prog_str in progressions:
-            chords, moods, source = parse_progression(prog_str)
-            if any(mood_lower in m.lower() for m in moods):
-                results.append({
-                    'chords': chords,
-                    'moods': moods,
-                    'source': source,
-                    'category': category
-                })
-    
-    return results
+    return _progressions_tagged(mood)
 
 def get_source_citation(source_key: str) -> str:
     """Get full citation for a source."""
@@ -661,17 +658,15 @@ def get_all_progressions_by_category(category: str = None) -> list:
         progs = prog_all_extended.get(category, [])
         return [parse_progression(p) for p in progs]
     
-    results = []
-    for cat, progs in prog_all_extended.items():
-        for prog_str in progs:
-            chords, moods, source = parse_progression(prog_str)
-            results.append({
-                'chords': chords,
-                'moods': moods,
-                'source': source,
-                'category': cat
-            })
-    return results
+    return [
+        {
+            'chords': list(chords),
+            'moods': list(moods),
+            'source': source,
+            'category': cat
+        }
+        for cat, chords, moods, _, source in _parsed_progressions()
+    ]
 
 if __name__ == "__main__":
     # Example usage
@@ -1,43 +1,188 @@
+import base64
+import contextlib
+import contextvars
+import copy
 import socket
 import json
+import struct
 import logging
+import threading
 import time
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger("mcp_server")
 
+# orjson is optional; both paths take and produce UTF-8 bytes on the wire
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Length-prefixed framing offered by newer Remote Scripts in their greeting:
+# a 4-byte big-endian payload length, then the UTF-8 JSON payload
+_FRAME_HEADER = struct.Struct(">I")
+_FRAMING = "u32be"
+
+# Read-only queries that helpers tend to repeat back-to-back. Their results
+# are reused for _CACHE_TTL seconds; any other command clears the cache.
+# Each caller gets its own deep copy, so a helper that edits a reply (say,
+# appends to its "tracks") can't change what the next caller sees.
+_CACHEABLE = frozenset(("get_song_context", "get_session_info", "get_track_info"))
+_CACHE_TTL = 0.2
+_CACHE_MAX = 64
+
+# One note as packed in a base64 "notes_packed" param: pitch, start_time,
+# duration, velocity, mute. Must match the Remote Script's NOTE_PACKING,
+# which it advertises alongside its opcodes; about a third of the JSON size.
+_NOTE_PACKING = "<BddBB"
+_NOTE_RECORD = struct.Struct(_NOTE_PACKING)
+_NOTE_FIELDS = frozenset(("pitch", "start_time", "duration", "velocity", "mute"))
+
+def _pack_notes(notes) -> Optional[str]:
+    """Pack note dicts for notes_packed; None if any note can't be packed"""
+    try:
+        buf = bytearray(_NOTE_RECORD.size * len(notes))
+        for i, note in enumerate(notes):
+            # Extra fields (probability, ...) only travel as JSON
+            if not note.keys() <= _NOTE_FIELDS:
+                return None
+            _NOTE_RECORD.pack_into(
+                buf, i * _NOTE_RECORD.size,
+                int(note.get("pitch", 60)), float(note.get("start_time", 0.0)),
+                float(note.get("duration", 0.01)), int(note.get("velocity", 100)),
+                bool(note.get("mute", False))
+            )
+    except (AttributeError, TypeError, ValueError, struct.error):
+        return None
+    return base64.b64encode(buf).decode("ascii")
+
+def _pack_clip_notes(clip: Dict[str, Any]) -> Dict[str, Any]:
+    """Swap a params/clip dict's notes for notes_packed where possible"""
+    notes = clip.get("notes")
+    packed = _pack_notes(notes) if notes else None
+    if packed is None:
+        return clip
+    clip = dict(clip)
+    del clip["notes"]
+    clip["notes_packed"] = packed
+    return clip
+
+def _pack_note_params(command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Pack the notes of note-writing commands; other params pass through"""
+    if command_type == "add_notes_to_clip":
+        return _pack_clip_notes(params)
+    if command_type in ("bulk_create_clips", "add_notes_to_clips_multi") and params.get("clips"):
+        params = dict(params)
+        params["clips"] = [_pack_clip_notes(clip) for clip in params["clips"]]
+    return params
+
+class AbletonCommandError(Exception):
+    """Ableton answered with an error status; the connection is still usable"""
+
+
 class AbletonConnection:
     def __init__(self, host='localhost', port=9877): # Default port
         self.host = host
         self.port = port
         self.sock = None
+        # Command name -> integer opcode advertised by the Remote Script
+        self.opcodes: Dict[str, int] = {}
+        # Note struct layout the Remote Script can unpack, if any
+        self.note_packing: Optional[str] = None
+        # Whether the Remote Script speaks length-prefixed framing
+        self.framed = False
+        # (command_type, params) -> (timestamp, result) for _CACHEABLE
+        self._cache: Dict[Any, Any] = {}
+        # One request/response exchange on the socket at a time, so threads
+        # can share the connection
+        self._lock = threading.RLock()
         
     def connect(self):
         """Establish connection to Ableton"""
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.settimeout(5.0)
+            # Small request/response pairs; disable Nagle's algorithm
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # The singleton stays open between scripts' commands; let the OS
+            # probe idle links so NAT/firewall state isn't dropped silently
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             self.sock.connect((self.host, self.port))
             
             # Perform handshake
+            self.framed = False
             try:
                 # Wait for initial greeting
                 greeting = self.sock.recv(1024).decode('utf-8')
                 logger.info(f"Connected to Ableton: {greeting}")
+                try:
+                    hello = json.loads(greeting)
+                except ValueError:
+                    hello = {}
+                if hello.get("status") == "error":
+                    # The Remote Script refused the connection (e.g. all client slots busy)
+                    raise ConnectionError(hello.get("message", "Connection refused by Ableton"))
+                self.framed = hello.get("framing") == _FRAMING
             except socket.timeout:
                 logger.warning("No greeting received from Ableton, creating new connection")
-                
+            
+            protocol = self._fetch_protocol()
+            self.opcodes = protocol.get("opcodes", {})
+            self.note_packing = protocol.get("note_packing")
             return True
         except ConnectionRefusedError:
             logger.error(f"Connection refused at {self.host}:{self.port}. Is Ableton running with the Remote Script?")
-            self.sock = None
+            self.close()
             return False
         except Exception as e:
             logger.error(f"Error connecting to Ableton: {str(e)}")
-            self.sock = None
+            # Close rather than drop the socket; a busy server refuses
+            # connections after accepting them
+            self.close()
             return False
 
+    def _send_message(self, command: Dict[str, Any]):
+        """Send one command, framed if the Remote Script supports it"""
+        payload = _dumps(command)
+        if self.framed:
+            payload = _FRAME_HEADER.pack(len(payload)) + payload
+        self.sock.sendall(payload)
+
+    def _receive_message(self) -> Dict[str, Any]:
+        """Receive and decode one response"""
+        if not self.framed:
+            return _loads(self.receive_full_response(self.sock))
+        (length,) = _FRAME_HEADER.unpack(self._recv_exact(_FRAME_HEADER.size))
+        return _loads(self._recv_exact(length))
+
+    def _recv_exact(self, size: int) -> bytes:
+        """Read exactly size bytes from the socket"""
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = self.sock.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("Connection closed by Ableton")
+            buf += chunk
+        return bytes(buf)
+
+    def _fetch_protocol(self) -> Dict[str, Any]:
+        """Ask the Remote Script for its opcode table and note packing; empty if unsupported"""
+        try:
+            self._send_message({"type": "get_command_opcodes", "params": {}})
+            response = self._receive_message()
+            if response.get("status") == "success":
+                return response.get("result", {})
+            # Older Remote Scripts answer "Unknown command"; keep using names
+        except Exception as e:
+            logger.warning(f"Could not fetch command opcodes, sending names: {str(e)}")
+        return {}
+
     def close(self):
         if self.sock:
             try:
@@ -115,15 +260,49 @@ class AbletonConnection:
              return b''.join(chunks)
         raise Exception("No data received")
 
-    def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send a command to Ableton and return the response"""
+    def ensure_open(self):
+        """Connect if there is no live socket; an open socket is reused as-is"""
         if not self.sock and not self.connect():
             raise ConnectionError("Not connected to Ableton")
+
+    def send_command(self, command_type: str, params: Dict[str, Any] = None, ack: bool = True) -> Dict[str, Any]:
+        """Send a command to Ableton and return the response.
+
+        With ack=False the Remote Script sends no reply and this returns {}
+        as soon as the command is written; errors are only logged on the
+        Live side. Commands still run in the order they were sent. Scripts
+        that predate framing always reply, so ack is ignored for them.
+        
+        Safe to call from several threads; exchanges are serialized.
+        """
+        with self._lock:
+            return self._send_command(command_type, params, ack)
+
+    def _send_command(self, command_type: str, params: Optional[Dict[str, Any]], ack: bool) -> Dict[str, Any]:
+        self.ensure_open()
         
+        cache_key = None
+        if command_type in _CACHEABLE:
+            try:
+                cache_key = (command_type, tuple(sorted((params or {}).items())))
+                hit = self._cache.get(cache_key)
+            except TypeError:
+                # Unhashable param values; just send it
+                cache_key = hit = None
+            if hit is not None and time.monotonic() - hit[0] < _CACHE_TTL:
+                return copy.deepcopy(hit[1])
+        elif self._cache:
+            # Anything else may change what the queries would return
+            self._cache.clear()
+        
+        params = params or {}
         command = {
-            "type": command_type,
-            "params": params or {}
+            # Send the integer opcode when the Remote Script advertised one
+            "type": self.opcodes.get(command_type, command_type),
+            "params": _pack_note_params(command_type, params) if self.note_packing == _NOTE_PACKING else params
         }
+        if not ack and self.framed:
+            command["ack"] = False
         
         # Check if this is a state-modifying command (needs delays)
         is_modifying_command = command_type in [
@@ -140,15 +319,31 @@ class AbletonConnection:
             "set_device_parameter", "set_device_parameters", "set_device_audio_input", "get_device_parameters",
             "start_playback", "stop_playback", "load_instrument_or_effect", "load_browser_item",
             "load_device", "set_device_sidechain_source", "save_device_snapshot",
-            "apply_device_snapshot", "create_scene", "delete_scene", "duplicate_scene",
+            "apply_device_snapshot", "create_scene", "create_scenes", "delete_scene", "duplicate_scene",
             "fire_scene", "fire_scene_by_name", "stop_scene",
             "pump_helper", "auto_test_suite", "ducking_tool", "lfo_pump_helper",
-            "set_clip_envelope"
+            "set_clip_envelope", "batch", "bulk_create_clips", "add_notes_to_clips_multi"
         ]
         
         try:
             logger.info(f"Sending command: {command_type} with params: {params}")
-            self.sock.sendall(json.dumps(command).encode('utf-8'))
+            try:
+                self._send_message(command)
+            except (BrokenPipeError, ConnectionResetError):
+                # The Remote Script dropped a kept-alive socket between commands;
+                # nothing was delivered, so reconnect once and resend
+                logger.info("Connection to Ableton went stale, reconnecting")
+                self.close()
+                self.ensure_open()
+                command["type"] = self.opcodes.get(command_type, command_type)
+                if self.note_packing != _NOTE_PACKING:
+                    command["params"] = params
+                if not self.framed:
+                    command.pop("ack", None)
+                self._send_message(command)
+            
+            if command.get("ack") is False:
+                return {}
             
             if is_modifying_command:
                 time.sleep(0.1)
@@ -161,33 +356,138 @@ class AbletonConnection:
             else:
                 self.sock.settimeout(30.0 if is_modifying_command else 12.0)
             
-            response_data = self.receive_full_response(self.sock)
-            response = json.loads(response_data.decode('utf-8'))
+            response = self._receive_message()
             
             if response.get("status") == "error":
-                raise Exception(response.get("message", "Unknown error from Ableton"))
+                # The command failed but the connection is fine; keep it open
+                raise AbletonCommandError(response.get("message", "Unknown error from Ableton"))
             
             if is_modifying_command:
                 time.sleep(0.1)
             
-            return response.get("result", {})
+            result = response.get("result", {})
+            if cache_key is not None:
+                if len(self._cache) >= _CACHE_MAX:
+                    self._cache.clear()
+                self._cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
+            return result
             
+        except AbletonCommandError:
+            raise
         except socket.timeout:
             logger.error("Socket timeout")
-            self.sock = None
+            self.close()
             raise Exception("Timeout waiting for Ableton response")
         except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
             logger.error(f"Socket connection error: {str(e)}")
-            self.sock = None
+            self.close()
             raise Exception(f"Connection to Ableton lost: {str(e)}")
         except Exception as e:
-            self.sock = None
+            # The stream may be out of sync (e.g. a half-read reply); start afresh
+            self.close()
             raise e
 
+    def send_batch(self, commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send several commands in one round-trip and return one response per command.
+
+        Each command is a {"type": ..., "params": ...} dict. The Remote Script
+        runs them in order in a single main-thread task; a failing command does
+        not stop the rest, so check each response's "status".
+        """
+        with self._lock:
+            self.ensure_open()
+            batch = [
+                {"type": self.opcodes.get(c["type"], c["type"]), "params": c.get("params") or {}}
+                for c in commands
+            ]
+            return self.send_command("batch", {"commands": batch})
+
+    def bulk_create_clips(self, track_index: int, clips: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Replace several clips on one track in one main-thread task.
+
+        Each clip is a dict with clip_index and optional length, name, notes.
+        """
+        return self.send_command("bulk_create_clips", {"track_index": track_index, "clips": clips})
+
+    def add_notes_to_clips_multi(self, clips: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Write notes into clips across tracks in one main-thread task.
+
+        Each clip is a dict with track_index, clip_index, notes and optional
+        length (replace the clip) and name.
+        """
+        return self.send_command("add_notes_to_clips_multi", {"clips": clips})
+
+class InProcessConnection:
+    """Drop-in for AbletonConnection when the Remote Script's dispatcher lives
+    in this process (tests, or tooling loaded inside Live).
+
+    Commands go straight to the dispatcher as dicts: no socket, no JSON and
+    no greeting. Main-thread commands are still scheduled by the dispatcher.
+    """
+
+    def __init__(self, dispatcher):
+        # A CommandDispatcher, or anything with a dispatch(command) method
+        self._dispatch = dispatcher.dispatch
+
+    def ensure_open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send_command(self, command_type: str, params: Dict[str, Any] = None, ack: bool = True) -> Dict[str, Any]:
+        """Run a command and return its result; ack is accepted for parity"""
+        response = self._dispatch({"type": command_type, "params": params or {}})
+        if response.get("status") == "error":
+            raise AbletonCommandError(response.get("message", "Unknown error from Ableton"))
+        return response.get("result", {})
+
+    def send_batch(self, commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run commands as one batch and return one response per command"""
+        batch = [{"type": c["type"], "params": c.get("params") or {}} for c in commands]
+        return self.send_command("batch", {"commands": batch})
+
+    def bulk_create_clips(self, track_index: int, clips: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Replace several clips on one track; see AbletonConnection.bulk_create_clips"""
+        return self.send_command("bulk_create_clips", {"track_index": track_index, "clips": clips})
+
+    def add_notes_to_clips_multi(self, clips: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Write notes into clips across tracks; see AbletonConnection.add_notes_to_clips_multi"""
+        return self.send_command("add_notes_to_clips_multi", {"clips": clips})
+
+def get_inproc_connection(dispatcher) -> InProcessConnection:
+    """Return a connection that calls the given dispatcher directly"""
+    return InProcessConnection(dispatcher)
+
 # Singleton instance
 _connection = None
 
+# Connection installed by use_connection(); takes precedence over the singleton
+_connection_override = contextvars.ContextVar("ableton_connection", default=None)
+
+@contextlib.contextmanager
+def use_connection(conn):
+    """Make get_ableton_connection() return conn inside this block.
+
+    Lets a script route every mcp_tooling helper through a given connection
+    (e.g. an InProcessConnection). Scoped to the current thread or task;
+    worker threads started inside the block don't inherit it.
+    """
+    token = _connection_override.set(conn)
+    try:
+        yield conn
+    finally:
+        _connection_override.reset(token)
+
 def get_ableton_connection() -> AbletonConnection:
+    """Return the process-wide connection, or the one set by use_connection().
+
+    The socket, greeting and opcode table are set up once and reused by every
+    caller; scripts should not close() it between commands.
+    """
+    conn = _connection_override.get()
+    if conn is not None:
+        return conn
     global _connection
     if _connection is None:
         _connection = AbletonConnection()
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 # Musical Scales
 SCALES = {
@@ -98,8 +101,8 @@ PROGRESSIONS = {
     "chip_ending": ["I", "IV", "vi", "V", "I"],        # Happy ending
 }
 
-# Song Templates (Blueprints)
-GENRE_TEMPLATES = {
+# Song Templates (Blueprints), frozen into GenreTemplate below
+_GENRE_TEMPLATE_DATA = {
     "pop": {
         "structure": ["Intro", "Verse 1", "Chorus", "Verse 2", "Chorus", "Bridge", "Chorus", "Outro"],
         "progression_map": {
@@ -185,3 +188,27 @@ GENRE_TEMPLATES = {
     }
 }
 
+
+@dataclass(frozen=True, slots=True)
+class TemplateTrack:
+    name: str
+    type: str # "drums", "chords", "bass", "melody"
+    instrument: str
+
+
+@dataclass(frozen=True, slots=True)
+class GenreTemplate:
+    structure: Tuple[str, ...] # Section names, in song order
+    progression_map: Mapping[str, str] # Section -> PROGRESSIONS key
+    tracks: Tuple[TemplateTrack, ...]
+
+
+# Immutable, so blueprints can share them freely
+GENRE_TEMPLATES = {
+    genre: GenreTemplate(
+        structure=tuple(data["structure"]),
+        progression_map=MappingProxyType(dict(data["progression_map"])),
+        tracks=tuple(TemplateTrack(**track) for track in data["tracks"]),
+    )
+    for genre, data in _GENRE_TEMPLATE_DATA.items()
+}
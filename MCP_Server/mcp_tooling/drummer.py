@@ -209,36 +209,42 @@ def pattern_to_notes(
     step_duration = 4.0 / length_steps  # 0.25 beats per 16th step
     pattern_length_beats = 4.0  # 1 bar
     
-    notes = []
+    # One bar of hits as (pitch, step time, swing offset, velocity); only the
+    # bar offset changes between repeats
+    bar_hits = []
+    for track_name, track_data in tracks.items():
+        midi_note = track_data.get("midi_note", 36)
+        steps = track_data.get("steps", [])
+        
+        for step_info in steps:
+            step_num = step_info.get("step", 0)
+            velocity = step_info.get("velocity", 100)
+            
+            # Apply velocity scaling
+            velocity = int(velocity * velocity_scale)
+            velocity = max(1, min(127, velocity))
+            
+            # Manual Swing (if not using Humanize profile swing)
+            swing_offset = 0.0
+            if swing > 0 and step_num % 2 == 1:
+                swing_offset = step_duration * swing * 0.5
+            
+            bar_hits.append((midi_note, step_num * step_duration, swing_offset, velocity))
     
+    duration = step_duration * 0.9
+    notes = []
     for bar in range(bars):
         bar_offset = bar * pattern_length_beats
-        
-        for track_name, track_data in tracks.items():
-            midi_note = track_data.get("midi_note", 36)
-            steps = track_data.get("steps", [])
-            
-            for step_info in steps:
-                step_num = step_info.get("step", 0)
-                velocity = step_info.get("velocity", 100)
-                
-                # Apply velocity scaling
-                velocity = int(velocity * velocity_scale)
-                velocity = max(1, min(127, velocity))
-                
-                # Calculate time
-                base_time = bar_offset + (step_num * step_duration)
-                
-                # Manual Swing (if not using Humanize profile swing)
-                if swing > 0 and step_num % 2 == 1:
-                     base_time += step_duration * swing * 0.5
-
-                notes.append({
-                    "pitch": midi_note,
-                    "start_time": max(0.0, base_time),
-                    "duration": step_duration * 0.9,
-                    "velocity": velocity
-                })
+        for midi_note, step_time, swing_offset, velocity in bar_hits:
+            base_time = bar_offset + step_time
+            if swing_offset:
+                base_time += swing_offset
+            notes.append({
+                "pitch": midi_note,
+                "start_time": max(0.0, base_time),
+                "duration": duration,
+                "velocity": velocity
+            })
     
     # Apply Central Humanization
     if humanize > 0:
@@ -187,6 +187,96 @@ def generate_chord_progression(
     )
 
 
+def build_chord_notes(
+    chord_list: List[str],
+    key: str,
+    scale: str,
+    beats_per_chord: float,
+    velocity: int = 80,
+    voice_lead: bool = True,
+    strum: float = 0.0,
+    humanize: float = 0.0,
+    groove: str = "straight"
+):
+    """
+    Build the notes for a chord progression without touching Ableton.
+    
+    `key` and `scale` must already be normalized (see normalize_key_and_scale).
+    Returns (notes, clip_length), with notes finalized to the clip length.
+    """
+    notes = []
+    current_time = 0.0
+    
+    # Root note for key
+    root_midi = key_to_midi(key, 3) # Chords usually octave 3
+    
+    # Apply voice leading if requested
+    # We need actual pitches for voice leading.
+    # theory.voice_lead_progression takes (root_midi, scale, chord_names) -> list of lists of pitches
+    
+    if voice_lead:
+        # 1. Generate all chords in root position first
+        root_midi = key_to_midi(key, 3)
+        root_positioned_notes = []
+        for chord_name in chord_list:
+            root_positioned_notes.append(get_chord_notes(root_midi, scale, chord_name))
+        
+        # 2. Apply voice leading logic
+        chord_voicings = voice_lead_progression(root_positioned_notes)
+        
+        for i, tones in enumerate(chord_voicings):
+            for pitch in tones:
+                 notes.append({
+                    "pitch": pitch,
+                    "start_time": current_time,
+                    "duration": beats_per_chord,
+                    "velocity": velocity
+                })
+            current_time += beats_per_chord
+            
+    else:
+        # Standard generation (Root position / close voicing)
+        for chord_name in chord_list:
+            # get_chord_notes returns pitches relative to root_midi? OR absolute?
+            # theory.py: get_chord_notes(root_note, scale, chord_str, inversion=0)
+            # It returns actual MIDI pitches.
+            
+            chord_tones = get_chord_notes(root_midi, scale, chord_name)
+            
+            # Apply inversion if specified in chord string? (e.g. C/G)
+            # chords.py parsing strips slash bass usually.
+            # Simplistic constraint: just output
+            
+            for pitch in chord_tones:
+                processed_start = current_time
+                processed_vel = velocity
+                
+                # Strumming
+                if strum > 0:
+                    # Offset high notes later
+                    # index in chord (sort pitch)
+                    pass # TODO implement strum logic
+                
+                notes.append({
+                    "pitch": pitch,
+                    "start_time": processed_start,
+                    "duration": beats_per_chord,
+                    "velocity": processed_vel
+                })
+            current_time += beats_per_chord
+
+    # Humanization (Post-process)
+    if humanize > 0 or groove != "straight":
+         profile = HumanizeProfile.get_preset(groove if groove else "human")
+         # Override profile jitter if humanize is high?
+         # Actually apply_humanization uses 'amount' to scale the profile.
+         # So if humanize=0.5, we get 50% of the profile's jitter/velocity rng.
+         apply_humanization(notes, profile, amount=humanize if humanize > 0 else 1.0)
+
+    clip_length = float(len(chord_list) * beats_per_chord)
+    return finalize_notes(notes, clip_length), clip_length
+
+
 def generate_chord_progression_advanced(
     track_index: int,
     clip_index: int,
@@ -287,80 +377,14 @@ def generate_chord_progression_advanced(
         if beats_per_chord < 0.001:
             return f"Error: beats_per_chord too small ({beats_per_chord})"
         
-        # 3. Note Generation
-        notes = []
-        current_time = 0.0
-        
-        # Root note for key
-        root_midi = key_to_midi(key, 3) # Chords usually octave 3
-        
-        # Apply voice leading if requested
-        # We need actual pitches for voice leading.
-        # theory.voice_lead_progression takes (root_midi, scale, chord_names) -> list of lists of pitches
-        
-        if voice_lead:
-            # 1. Generate all chords in root position first
-            root_midi = key_to_midi(key, 3)
-            root_positioned_notes = []
-            for chord_name in chord_list:
-                root_positioned_notes.append(get_chord_notes(root_midi, scale, chord_name))
-            
-            # 2. Apply voice leading logic
-            chord_voicings = voice_lead_progression(root_positioned_notes)
-            
-            for i, tones in enumerate(chord_voicings):
-                for pitch in tones:
-                     notes.append({
-                        "pitch": pitch,
-                        "start_time": current_time,
-                        "duration": beats_per_chord,
-                        "velocity": velocity
-                    })
-                current_time += beats_per_chord
-                
-        else:
-            # Standard generation (Root position / close voicing)
-            for chord_name in chord_list:
-                # get_chord_notes returns pitches relative to root_midi? OR absolute?
-                # theory.py: get_chord_notes(root_note, scale, chord_str, inversion=0)
-                # It returns actual MIDI pitches.
-                
-                chord_tones = get_chord_notes(root_midi, scale, chord_name)
-                
-                # Apply inversion if specified in chord string? (e.g. C/G)
-                # chords.py parsing strips slash bass usually.
-                # Simplistic constraint: just output
-                
-                for pitch in chord_tones:
-                    processed_start = current_time
-                    processed_vel = velocity
-                    
-                    # Strumming
-                    if strum > 0:
-                        # Offset high notes later
-                        # index in chord (sort pitch)
-                        pass # TODO implement strum logic
-                    
-                    notes.append({
-                        "pitch": pitch,
-                        "start_time": processed_start,
-                        "duration": beats_per_chord,
-                        "velocity": processed_vel
-                    })
-                current_time += beats_per_chord
-
-        # 4. Humanization (Post-process)
-        if humanize > 0 or groove != "straight":
-             profile = HumanizeProfile.get_preset(groove if groove else "human")
-             # Override profile jitter if humanize is high?
-             # Actually apply_humanization uses 'amount' to scale the profile.
-             # So if humanize=0.5, we get 50% of the profile's jitter/velocity rng.
-             apply_humanization(notes, profile, amount=humanize if humanize > 0 else 1.0)
-
-        # 5. Send to Ableton
-        clip_length = float(len(chord_list) * beats_per_chord)
-        final_notes = finalize_notes(notes, clip_length)
+        # 3. Notes (voicing, humanization, clip bounds)
+        final_notes, clip_length = build_chord_notes(
+            chord_list, key, scale, beats_per_chord,
+            velocity=velocity, voice_lead=voice_lead, strum=strum,
+            humanize=humanize, groove=groove
+        )
 
+        # 4. Send to Ableton
         # Safe clip creation: delete if exists to avoid "Already has clip" error
         try:
             ableton.send_command("delete_clip", {"track_index": track_index, "clip_index": clip_index})
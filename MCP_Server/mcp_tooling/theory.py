@@ -1,4 +1,6 @@
-from .constants import SCALES
+import functools
+
+from .constants import PROGRESSIONS, SCALES
 
 # Note name to MIDI offset lookup
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
@@ -60,6 +62,28 @@ def invert_chord(notes: list, inversion: int = 0) -> list:
     return result
 
 
+# Roman numeral (lowercased, accidentals stripped) -> scale degree index
+_DEGREE_MAP = {"i": 0, "ii": 1, "iii": 2, "iv": 3, "v": 4, "vi": 5, "vii": 6}
+
+
+def _parse_numeral(numeral):
+    """Return the scale steps (from the key root) stacked by a chord numeral."""
+    # Clean numeral
+    num_clean = numeral.lower().replace("dim", "").replace("aug", "").replace("maj", "").replace("min", "").replace("7", "").replace("9", "")
+    # Handle borrowed chords (bIII, bVI, etc.)
+    num_clean = num_clean.replace("b", "").replace("#", "")
+    degree_idx = _DEGREE_MAP.get(num_clean, 0)
+
+    # Build triad: Root, 3rd, 5th, then the 7th/9th if requested.
+    # A 9 without a 7 takes the 4th slot and so stacks a 7th.
+    intervals = [0, 2, 4]
+    if "7" in numeral:
+        intervals.append(6)
+    if "9" in numeral:
+        intervals.append(6 if len(intervals) == 3 else 8)
+    return tuple(degree_idx + interval for interval in intervals)
+
+
 def get_chord_notes(root_note, scale_name, numeral, inversion: int = 0):
     """
     Get MIDI note values for a chord given a root, scale, and numeral.
@@ -73,67 +97,29 @@ def get_chord_notes(root_note, scale_name, numeral, inversion: int = 0):
     Returns:
         List[int]: List of MIDI pitches.
     """
-    # scale logic
+    # Progressions repeat chords; callers get their own copy of the cached notes
+    return list(_chord_notes(root_note, scale_name, numeral, inversion))
+
+
+@functools.lru_cache(maxsize=512)
+def _chord_notes(root_note, scale_name, numeral, inversion):
+    """Cached body of get_chord_notes, as a tuple."""
     scale = SCALES.get(scale_name, SCALES["major"])
-    # Map Numeral to Scale Degree
-    degree_map = {"i": 0, "ii": 1, "iii": 2, "iv": 3, "v": 4, "vi": 5, "vii": 6}
-    
-    # Clean numeral
-    num_clean = numeral.lower().replace("dim", "").replace("aug", "").replace("maj", "").replace("min", "").replace("7", "").replace("9", "")
-    # Handle borrowed chords (bIII, bVI, etc.)
-    num_clean = num_clean.replace("b", "").replace("#", "")
-    degree_idx = degree_map.get(num_clean, 0)
-    
-    # Base Root index in scale
-    scale_degree = degree_idx
-    
-    # Build triad: Root, 3rd, 5th
-    indices = [scale_degree, (scale_degree + 2) % 7, (scale_degree + 4) % 7]
-    
-    # Add 7th if requested
-    if "7" in numeral:
-        indices.append((scale_degree + 6) % 7)
-    # Add 9th? 
-    if "9" in numeral:
-         indices.append((scale_degree + 8) % 7)
-         
-    notes = []
-    for i in indices:
-        # Calculate pitch regarding octave wrapping relative to the KEY root
-        
-        scale_val = scale[i]
-        
-        # Calculate how many octaves above the start of the scale this degree is.
-        # This is strictly theoretical relative logic
-        # e.g. if we are at index i, how many times did we wrap around 7?
-        # But we build intervals from the scale_degree.
-        
-        # We need the absolute index in the infinite scale arrray.
-        # The base_step is the interval distance from key root.
-        # e.g. V chord. Root=4. 3rd=6. 5th=1 (next octave).
-        
-        base_step = degree_idx + (2 if i == indices[1] else 4 if i == indices[2] else 
-                                  6 if (len(indices) > 3 and i == indices[3]) else 
-                                  8 if (len(indices) > 4 and i == indices[4]) else 0)
-                                  
-        # If it's the root of the chord (index 0 of indices), base_step = degree_idx.
-        
-        cycles = base_step // 7
-        step_mod = base_step % 7
-        
-        # Retrieve semitone offset from scale
-        # If scale is [0,2,4...]
-        semitones_in_scale = scale[step_mod]
-        
-        semitones_total = semitones_in_scale + (cycles * 12)
-        
-        notes.append(root_note + semitones_total)
-    
+    # Numerals outside the import-time table are parsed but not stored; the
+    # LRU around this function already bounds what is remembered
+    steps = _CHORD_STEPS.get(numeral)
+    if steps is None:
+        steps = _parse_numeral(numeral)
+
+    # Each step is an index into the infinite scale, so wrap it into the
+    # octave and add 12 per cycle (e.g. V chord: 4, 6, 8 -> 5th is 1 + 12)
+    notes = [root_note + scale[step % 7] + (step // 7) * 12 for step in steps]
+
     # Apply inversion if requested
     if inversion > 0:
         notes = invert_chord(notes, inversion)
         
-    return notes
+    return tuple(notes)
 
 
 def voice_lead_progression(progression_notes: list) -> list:
@@ -173,3 +159,9 @@ def voice_lead_progression(progression_notes: list) -> list:
     
     return result
 
+
+# Parsed numeral -> scale steps, for the numerals in PROGRESSIONS only.
+# Built once at import and never written to; other numerals are parsed on
+# each _chord_notes cache miss.
+_CHORD_STEPS = {numeral: _parse_numeral(numeral)
+                for chords in PROGRESSIONS.values() for numeral in chords}
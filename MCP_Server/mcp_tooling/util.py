@@ -19,6 +19,21 @@ CLIP_CACHE_FILE_FS = CACHE_DIR / "browser_clips_fs.json"
 MODULE_CACHE_DIR = Path(__file__).resolve().parent.parent / "cache" # Relative to MCP_Server/mcp_tooling/../
 MODULE_CACHE_FILE = MODULE_CACHE_DIR / "browser_devices.json"
 
+# Parsed cache files: path -> ((mtime_ns, size), items). Device lookups read
+# the same files for every track; re-parse only after a file changes.
+_CACHE_ITEMS: Dict[Path, Any] = {}
+
+def _read_cache_items(cache_file: Path) -> List[Dict[str, Any]]:
+    """Return the "items" list of a JSON cache file, parsed at most once per version."""
+    st = cache_file.stat()
+    version = (st.st_mtime_ns, st.st_size)
+    hit = _CACHE_ITEMS.get(cache_file)
+    if hit is not None and hit[0] == version:
+        return hit[1]
+    items = json.loads(cache_file.read_text("utf-8")).get("items", [])
+    _CACHE_ITEMS[cache_file] = (version, items)
+    return items
+
 def setup_trace_logger():
     """Setup profiling logger if env var is set."""
     if os.environ.get("ABLETON_MCP_TRACE"):
@@ -103,8 +118,7 @@ def search_cache(cache_file: Path, query: str, limit: int = 10) -> List[Dict[str
     if not cache_file.exists():
         return []
     try:
-        data = json.loads(cache_file.read_text("utf-8"))
-        items = data.get("items", [])
+        items = _read_cache_items(cache_file)
         query_lower = query.lower()
         matches = []
         
@@ -154,8 +168,7 @@ def get_best_device_name(query: str, category: str = "all") -> Optional[str]:
         if not cache_path.exists():
             return None
         try:
-            cached = json.loads(cache_path.read_text())
-            items = cached.get("items", [])
+            items = _read_cache_items(cache_path)
             candidates = []
             for item in items:
                 name = item.get("name", "")
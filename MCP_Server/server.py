@@ -860,6 +860,26 @@ def add_notes_to_clip(ctx: Context, track_index: int, clip_index: int, notes: Li
     except Exception as e:
         return f"Error: {e}"
 
+@mcp.tool()
+def bulk_create_clips(ctx: Context, track_index: int, clips: List[Dict[str, Any]]) -> str:
+    """Replace several MIDI clips on one track at once. clips=[{clip_index:0, length:16.0, name:"A", notes:[...]}]"""
+    try:
+        ableton = get_ableton_connection()
+        res = ableton.bulk_create_clips(track_index, clips)
+        return json.dumps(res, indent=2)
+    except Exception as e:
+        return f"Error: {e}"
+
+@mcp.tool()
+def add_notes_to_clips_multi(ctx: Context, clips: List[Dict[str, Any]]) -> str:
+    """Write notes into clips on several tracks at once. clips=[{track_index:0, clip_index:0, notes:[...], length:16.0 (optional, replaces the clip), name:"A" (optional)}]"""
+    try:
+        ableton = get_ableton_connection()
+        res = ableton.add_notes_to_clips_multi(clips)
+        return json.dumps(res, indent=2)
+    except Exception as e:
+        return f"Error: {e}"
+
 @mcp.tool()
 def fire_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     """Fire (trigger) a clip to play."""
@@ -1517,6 +1537,12 @@ def create_scene(ctx: Context, index: int = -1, name: Optional[str] = None) -> s
     conn = get_ableton_connection()
     return json.dumps(conn.send_command("create_scene", {"index": index, "name": name}), indent=2)
 
+@mcp.tool()
+def create_scenes(ctx: Context, count: int, names: Optional[List[str]] = None) -> str:
+    """Append several scenes in one call, optionally naming them in order."""
+    conn = get_ableton_connection()
+    return json.dumps(conn.send_command("create_scenes", {"count": count, "names": names}), indent=2)
+
 @mcp.tool()
 def get_scene_info(ctx: Context, scene_index: int) -> str:
     """Get detailed information about a scene."""
@@ -2071,6 +2097,24 @@ def unfold_group(ctx: Context, track_index: int) -> str:
     conn = get_ableton_connection()
     return json.dumps(conn.send_command("unfold_group", {"track_index": track_index}), indent=2)
 
+@mcp.tool()
+def fold_groups(ctx: Context, track_indices: List[int]) -> str:
+    """Fold several track groups in one round-trip."""
+    conn = get_ableton_connection()
+    return json.dumps(conn.send_command("fold_group_bulk", {"track_indices": track_indices}), indent=2)
+
+@mcp.tool()
+def unfold_groups(ctx: Context, track_indices: List[int]) -> str:
+    """Unfold several track groups in one round-trip."""
+    conn = get_ableton_connection()
+    return json.dumps(conn.send_command("unfold_group_bulk", {"track_indices": track_indices}), indent=2)
+
+@mcp.tool()
+def stop_track_clips(ctx: Context, track_indices: List[int]) -> str:
+    """Stop all clips on one or more tracks in one round-trip."""
+    conn = get_ableton_connection()
+    return json.dumps(conn.send_command("stop_track_clips_bulk", {"track_indices": track_indices}), indent=2)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # BROWSER & SAMPLE TOOLS (Phase 3)
 # ═══════════════════════════════════════════════════════════════════════════════
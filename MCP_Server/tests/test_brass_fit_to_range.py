@@ -0,0 +1,38 @@
+from mcp_tooling.brass.parts import PARTS, BrassInstrument, fit_to_range
+
+
+def _fit_to_range_stepwise(pitch, part):
+    # The original octave-stepping implementation, kept as the reference
+    current = pitch
+    while current < part.min:
+        current += 12
+    while current > part.max:
+        current -= 12
+    if current < part.min: current += 12
+    if current > part.max: current -= 12
+    return current
+
+
+def test_fit_to_range_matches_stepwise():
+    print("Checking fit_to_range against octave stepping...")
+    # Include a range narrower than an octave, where the final clamp matters
+    PARTS["_narrow"] = BrassInstrument("Narrow", 60, 66, 63, "test")
+    try:
+        mismatches = [
+            (name, pitch)
+            for name, part in PARTS.items()
+            for pitch in range(-30, 160)
+            if fit_to_range(pitch, name) != _fit_to_range_stepwise(pitch, part)
+        ]
+    finally:
+        del PARTS["_narrow"]
+
+    print(f"Parts: {len(PARTS)}, mismatches: {mismatches[:10]}")
+    assert not mismatches, f"fit_to_range differs for {mismatches[:10]}"
+    # Unknown parts leave the pitch alone
+    assert fit_to_range(200, "kazoo") == 200
+    print("PASS: fit_to_range matches octave stepping")
+
+
+if __name__ == "__main__":
+    test_fit_to_range_matches_stepwise()
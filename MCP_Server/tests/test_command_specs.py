@@ -0,0 +1,38 @@
+import ast
+import os
+
+# The Remote Script imports Live, so read the dispatch spec table from source
+current_dir = os.path.dirname(os.path.abspath(__file__)) # MCP_Server/tests
+repo_dir = os.path.dirname(os.path.dirname(current_dir))
+INTERFACE_PATH = os.path.join(repo_dir, "AbletonMCP_Remote_Script", "interface.py")
+
+
+def _command_spec_keys():
+    with open(INTERFACE_PATH, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "_COMMAND_SPECS" for t in node.targets
+        ):
+            return [k.value for k in node.value.keys]
+    raise AssertionError("_COMMAND_SPECS not found in interface.py")
+
+
+def test_command_specs_have_no_duplicate_keys():
+    print("Checking _COMMAND_SPECS for duplicate command types...")
+    keys = _command_spec_keys()
+    seen = set()
+    duplicates = []
+    for key in keys:
+        if key in seen:
+            duplicates.append(key)
+        seen.add(key)
+
+    print(f"Commands: {len(keys)}, duplicates: {duplicates}")
+    # A repeated key silently replaces the earlier handler in a dict literal
+    assert not duplicates, f"Duplicate command types: {duplicates}"
+    print("PASS: Every command type is routed once")
+
+
+if __name__ == "__main__":
+    test_command_specs_have_no_duplicate_keys()